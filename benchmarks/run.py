@@ -0,0 +1,398 @@
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import click
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_SIZES = "10,1000,10000,100000"
+
+# Feed documents above this many items would take hundreds of MB; parse benchmarks stop here
+MAX_PARSE_ITEMS = 10000
+
+# feedparser builds the whole document, so the baseline is only run on small feeds
+MAX_FEEDPARSER_ITEMS = 1000
+
+# --compare flags timings that got slower by this factor and by at least MIN_REGRESSION_SECONDS
+REGRESSION_RATIO = 1.10
+MIN_REGRESSION_SECONDS = 0.005
+
+# Timed sections run this many times and report the fastest run (set by --repeat)
+REPEAT = 3
+
+def _timed(fn: Callable, setup: Optional[Callable] = None, repeat: Optional[int] = None):
+    """Run fn repeat times (calling setup untimed before each run) and return (result, fastest seconds)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat or REPEAT):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def _rate(count: float, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+def _reset_store() -> None:
+    """Delete the article store, validators and exports under the benchmark HOME."""
+    shutil.rmtree(Path.home() / ".toadman" / "cache", ignore_errors=True)
+    shutil.rmtree(Path.home() / ".toadman" / "exports", ignore_errors=True)
+
+def _write_config(feeds: Dict[str, str], keywords: List[str], hits: int = 5) -> None:
+    from toadman.config import reload_config, save_config
+    save_config({
+        "rss_feeds": feeds,
+        "hacker_news": {"keywords": keywords, "hits_per_keyword": hits},
+        "cache": {"expiry_hours": 1, "summary_max_mb": 20},
+        "fetch": {"max_concurrency": 8, "source_timeout": 30},
+    })
+    reload_config()
+
+def make_articles(count: int, sources: int = 8) -> List:
+    """Generate realistic synthetic articles spread over the last six days."""
+    from toadman.models import Article
+    rng = random.Random(count)
+    words = ("agentic coding model release open weights benchmark terminal tools latency "
+             "evaluation sandbox runtime framework plugin context window pricing api").split()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choice(words) for _ in range(7)).capitalize()
+        articles.append(Article(
+            title=f"{title} #{i}",
+            url=f"https://news{i % 50}.example.com/posts/{i}",
+            published_date=now - timedelta(seconds=rng.randrange(6 * 24 * 3600)),
+            source=f"Feed {i % sources}",
+            content_snippet=" ".join(rng.choice(words) for _ in range(45)),
+            category="Agentic Tools" if i % 3 else "general",
+        ))
+    return articles
+
+def bench_fetch(server, feeds: int, keywords: int, items: int, pad_kb: int) -> Dict:
+    """Fetch every source from the fixture server, cold and then revalidated (304s and incremental HN)."""
+    import toadman.fetchers.engine as engine
+    _reset_store()
+    _write_config(
+        {f"Feed {i}": f"{server.base_url}/rss/newsletter?items={items}&pad_kb={pad_kb}&feed={i}" for i in range(feeds)},
+        [f"keyword{i}" for i in range(keywords)],
+    )
+    engine.HN_SEARCH_API = f"{server.base_url}/hn"
+    
+    cache_dir = Path.home() / ".toadman" / "cache"
+    
+    def forget_validators():
+        for name in ("feed_validators.json", "hn_cursors.json", "hn_backfill.json"):
+            (cache_dir / name).unlink(missing_ok=True)
+    
+    cold, cold_seconds = _timed(engine.fetch_all_articles, setup=forget_validators)
+    warm, warm_seconds = _timed(engine.fetch_all_articles)
+    return {
+        "sources": feeds + keywords,
+        "latency_ms": server.latency * 1000,
+        "articles": len(cold),
+        "cold_seconds": round(cold_seconds, 4),
+        "revalidate_seconds": round(warm_seconds, 4),
+    }
+
+def bench_parse(sizes: List[int], pad_kb: int) -> Dict:
+    """Parse feeds of each size fully, stopping after 10 entries, and with feedparser."""
+    import feedparser
+    from benchmarks.server import build_feed
+    from toadman.fetchers.feed_parser import parse_feed
+    from toadman.fetchers.rss_fetcher import parse_feed_entries
+    
+    results = {}
+    for size in sizes:
+        items = min(size, MAX_PARSE_ITEMS)
+        document = build_feed("newsletter", items, pad_kb)
+        megabytes = len(document) / 1e6
+        articles, full = _timed(lambda: parse_feed("Bench", document, max_entries=items))
+        _, first = _timed(lambda: parse_feed("Bench", document, max_entries=10))
+        result = {
+            "items": items,
+            "megabytes": round(megabytes, 2),
+            "full_seconds": round(full, 4),
+            "full_entries_per_second": _rate(len(articles), full),
+            "full_mb_per_second": _rate(megabytes, full),
+            "first10_seconds": round(first, 4),
+        }
+        if items <= MAX_FEEDPARSER_ITEMS:
+            _, baseline = _timed(lambda: parse_feed_entries("Bench", feedparser.parse(document), items))
+            result["feedparser_seconds"] = round(baseline, 4)
+        results[str(size)] = result
+    return results
+
+def bench_cache(sizes: List[int]) -> Dict:
+    """Save articles to a fresh store, re-save them, and load the 7-day window back."""
+    from toadman.cache import query_articles, save_cache
+    
+    results = {}
+    since = datetime.combine(datetime.now().date() - timedelta(days=7), datetime.min.time())
+    for size in sizes:
+        _reset_store()
+        articles = make_articles(size)
+        _, save = _timed(lambda: save_cache(articles), setup=_reset_store)
+        _, resave = _timed(lambda: save_cache(articles))
+        loaded, load = _timed(lambda: query_articles(since=since))
+        results[str(size)] = {
+            "save_seconds": round(save, 4),
+            "resave_seconds": round(resave, 4),
+            "load_seconds": round(load, 4),
+            "loaded": len(loaded),
+            "save_articles_per_second": _rate(size, save),
+            "load_articles_per_second": _rate(len(loaded), load),
+        }
+    return results
+
+def bench_list_rebuild(sizes: List[int]) -> Dict:
+    """Build the TUI article list, rebuild it after a 1% change, and rebuild it for a search."""
+    from toadman.cache import save_cache
+    from toadman.fetchers.hn_fetcher import HN_SOURCE
+    from toadman.models import Article
+    from toadman.tui.app import ToadmanApp
+    
+    # An empty, fresh configuration keeps the app from fetching on mount
+    _reset_store()
+    _write_config({}, [])
+    save_cache([Article(title="Marker", url="https://example.com/marker", published_date=None,
+                        source=HN_SOURCE, content_snippet="")])
+    
+    async def measure() -> Dict:
+        results = {}
+        app = ToadmanApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            for size in sizes:
+                articles = make_articles(size)
+                app.search_query = ""
+                build = float("inf")
+                for _ in range(REPEAT):
+                    app.articles = []
+                    await app.update_article_list()
+                    app.articles = articles
+                    start = time.perf_counter()
+                    await app.update_article_list()
+                    build = min(build, time.perf_counter() - start)
+                
+                changed = list(articles)
+                for i in range(0, size, 100):
+                    a = changed[i]
+                    changed[i] = Article(a.title + " (updated)", a.url, a.published_date, a.source,
+                                         a.content_snippet, a.category)
+                app.articles = changed
+                start = time.perf_counter()
+                await app.update_article_list()
+                rebuild = time.perf_counter() - start
+                
+                app.search_query = "agentic model"
+                start = time.perf_counter()
+                await app.update_article_list()
+                search = time.perf_counter() - start
+                
+                results[str(size)] = {
+                    "build_seconds": round(build, 4),
+                    "rebuild_seconds": round(rebuild, 4),
+                    "search_seconds": round(search, 4),
+                }
+            app.exit()
+        return results
+    
+    return asyncio.run(measure())
+
+def bench_relevance(sizes: List[int]) -> Dict:
+    """Rank articles by relevance from scratch (indexing them first) and with an index already built, as the TUI does."""
+    from toadman.config import get_config
+    from toadman.relevance import rank_by_relevance
+    from toadman.search import SearchIndex
+    
+    config = get_config()
+    results = {}
+    for size in sizes:
+        articles = make_articles(size)
+        _, cold = _timed(lambda: rank_by_relevance(articles, config=config))
+        index = SearchIndex()
+        index.add_many(articles)
+        # Fresh dicts each run, so per-term scores are not reused from the previous one
+        _, ranked = _timed(lambda: rank_by_relevance(articles, index=index, config=config), setup=index._invalidate)
+        results[str(size)] = {
+            "cold_seconds": round(cold, 4),
+            "indexed_seconds": round(ranked, 4),
+            "indexed_articles_per_second": _rate(size, ranked),
+        }
+    return results
+
+def bench_export(sizes: List[int]) -> Dict:
+    """Stream articles to each export format."""
+    from toadman.export.formatters import FORMATTERS
+    from toadman.export.stream_exporter import export_articles
+    
+    _reset_store()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            articles = make_articles(size)
+            by_format = {}
+            for fmt in FORMATTERS:
+                path = Path(directory) / f"export_{size}.{fmt}"
+                _, seconds = _timed(lambda: export_articles(iter(articles), {}, fmt=fmt, path=path))
+                megabytes = path.stat().st_size / 1e6
+                by_format[fmt] = {
+                    "seconds": round(seconds, 4),
+                    "articles_per_second": _rate(size, seconds),
+                    "mb_per_second": _rate(megabytes, seconds),
+                }
+            results[str(size)] = by_format
+    return results
+
+def bench_summarize(count: int, batch_size: int) -> Dict:
+    """Summarize articles through the fake kiro-cli (one per call with and without standby processes, and batched) and locally."""
+    from toadman.config import reload_config, save_config
+    from toadman.summarizer.kiro_summarizer import summarize_articles
+    
+    articles = make_articles(count)
+    log = Path(os.environ["FAKE_KIRO_LOG"])
+    results = {}
+    for label, size, pool_size in (("single_cold", 1, 0), ("single", 1, 2), ("batched", batch_size, 2)):
+        save_config({"summarizer": {"pool_size": pool_size}})
+        reload_config()
+        log.write_text("")
+        _, seconds = _timed(lambda: summarize_articles(articles, batch_size=size, use_cache=False), repeat=1)
+        results[label] = {
+            "seconds": round(seconds, 4),
+            "kiro_calls": len(log.read_text().splitlines()),
+            "articles": count,
+        }
+    
+    from toadman.summarizer.backends import get_backend
+    extractive = get_backend("extractive").summarize_articles
+    _, seconds = _timed(lambda: extractive(articles, use_cache=False))
+    results["extractive"] = {"seconds": round(seconds, 4), "kiro_calls": 0, "articles": count}
+    return results
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(baseline: Dict, current: Dict) -> List[Tuple[str, float, float, float]]:
+    """
+    Compare the timings of two result files.
+    
+    Returns:
+        (metric, baseline seconds, current seconds, ratio) for every timing in both
+    """
+    old = _flatten(baseline["results"])
+    new = _flatten(current["results"])
+    rows = []
+    for name in sorted(old.keys() & new.keys()):
+        if name.endswith("seconds") and old[name] > 0:
+            rows.append((name, old[name], new[name], new[name] / old[name]))
+    return rows
+
+@click.command()
+@click.option('--sizes', default=DEFAULT_SIZES, show_default=True,
+              help='Comma-separated article counts for the parse, cache, list and export benchmarks')
+@click.option('--latency-ms', default=50, show_default=True, help='Simulated server latency per request')
+@click.option('--pad-kb', default=4, show_default=True, help='Extra HTML per feed item, in kilobytes')
+@click.option('--feeds', default=8, show_default=True, help='RSS feeds fetched in the fetch benchmark')
+@click.option('--keywords', default=4, show_default=True, help='HN keywords fetched in the fetch benchmark')
+@click.option('--only', default=None, help='Comma-separated benchmarks to run (default: all)')
+@click.option('--repeat', default=REPEAT, show_default=True, help='Runs per timing; the fastest is reported')
+@click.option('--output', type=click.Path(dir_okay=False), default=None,
+              help='Write JSON results here (default: benchmarks/results/<commit>.json)')
+@click.option('--compare', 'baseline', type=click.File('r'), default=None,
+              help='Results file from another commit to compare against')
+def main(sizes, latency_ms, pad_kb, feeds, keywords, only, repeat, output, baseline):
+    """Run the offline benchmark suite and write JSON results."""
+    global REPEAT
+    REPEAT = repeat
+    sizes = [int(size) for size in sizes.split(",")]
+    
+    # Isolate everything toadman touches in a scratch HOME, before toadman is imported
+    home = tempfile.mkdtemp(prefix="toadman-bench-")
+    os.environ["HOME"] = home
+    os.environ["PATH"] = f"{BENCH_DIR / 'fake_kiro'}{os.pathsep}{os.environ.get('PATH', '')}"
+    os.environ.setdefault("FAKE_KIRO_DELAY", "0.05")
+    os.environ.setdefault("FAKE_KIRO_STARTUP", "0.2")
+    os.environ["FAKE_KIRO_LOG"] = str(Path(home) / "kiro_calls.log")
+    
+    from benchmarks.server import FixtureServer
+    
+    benchmarks = {
+        "fetch": lambda: bench_fetch(server, feeds, keywords, 25, pad_kb),
+        "parse": lambda: bench_parse(sizes, pad_kb),
+        "cache": lambda: bench_cache(sizes),
+        "list_rebuild": lambda: bench_list_rebuild(sizes),
+        "export": lambda: bench_export(sizes),
+        "relevance": lambda: bench_relevance(sizes),
+        "summarize": lambda: bench_summarize(20, 5),
+    }
+    selected = only.split(",") if only else list(benchmarks)
+    
+    results = {}
+    try:
+        with FixtureServer(latency=latency_ms / 1000) as server:
+            for name in selected:
+                click.echo(f"Running {name}...", err=True)
+                results[name] = benchmarks[name]()
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+    
+    commit = _git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "latency_ms": latency_ms,
+            "pad_kb": pad_kb,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    
+    path = Path(output) if output else BENCH_DIR / "results" / f"{commit or 'unknown'}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    click.echo(json.dumps(results, indent=2))
+    click.echo(f"Results written to {path}", err=True)
+    
+    if baseline:
+        click.echo(f"\nCompared with {baseline.name}:")
+        regressions = 0
+        for name, old, new, ratio in compare(json.load(baseline), report):
+            flag = ""
+            if ratio > REGRESSION_RATIO and new - old >= MIN_REGRESSION_SECONDS:
+                flag = "  SLOWER"
+                regressions += 1
+            click.echo(f"  {name:<55} {old:>9.4f}s -> {new:>9.4f}s  x{ratio:.2f}{flag}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
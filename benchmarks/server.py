@@ -0,0 +1,174 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_ITEM = re.compile(r"<item>.*?</item>", re.S)
+_PUB_DATE = re.compile(r"<pubDate>.*?</pubDate>")
+_POST_PATH = re.compile(r"(/p/[\w-]+)")
+
+def _split_feed(text: str) -> Tuple[str, List[str], str]:
+    """Split a recorded feed into its header, item templates and footer."""
+    items = _ITEM.findall(text)
+    start = text.index(items[0])
+    end = text.rindex(items[-1]) + len(items[-1])
+    return text[:start], items, text[end:]
+
+def build_feed(name: str, items: int, pad_kb: int = 0) -> bytes:
+    """
+    Build an RSS document with the given number of items from a recorded feed.
+    
+    Items cycle through the recorded ones with unique titles and links, newest
+    first, and each body is padded by pad_kb kilobytes of HTML.
+    """
+    header, templates, footer = _split_feed((FIXTURES_DIR / f"{name}.rss").read_text(encoding="utf-8"))
+    now = datetime.now(timezone.utc)
+    padding = "<p>" + "Lorem ipsum dolor sit amet. " * (pad_kb * 1024 // 28) + "</p>" if pad_kb else ""
+    parts = [header]
+    for i in range(items):
+        item = templates[i % len(templates)]
+        item = item.replace("]]></title>", f" #{i}]]></title>", 1)
+        item = _POST_PATH.sub(rf"\1-{i}", item)
+        item = _PUB_DATE.sub(f"<pubDate>{format_datetime(now - timedelta(minutes=i))}</pubDate>", item)
+        if padding:
+            item = item.replace("</div>]]>", padding + "</div>]]>", 1)
+        parts.append(item)
+    parts.append(footer)
+    return "".join(parts).encode("utf-8")
+
+def build_hn_results(query: str, hits: int, since: int = 0) -> bytes:
+    """
+    Build an Algolia search response from a recorded one.
+    
+    The query matches hits stories, one every ten minutes back from now, of
+    which those created after since are returned.
+    """
+    recorded = json.loads((FIXTURES_DIR / "hn_search.json").read_text(encoding="utf-8"))
+    now = int(time.time())
+    results = []
+    for i in range(hits):
+        if now - i * 600 <= since:
+            break
+        hit = dict(recorded["hits"][i % len(recorded["hits"])])
+        created = now - i * 600
+        hit.update(
+            objectID=f"{query}-{i}",
+            title=f"{hit['title']} ({query} #{i})",
+            created_at_i=created,
+            created_at=datetime.fromtimestamp(created, timezone.utc).isoformat().replace("+00:00", "Z"),
+        )
+        if hit.get("url"):
+            hit["url"] = f"{hit['url'].rstrip('/')}/{query}-{i}"
+        results.append(hit)
+    return json.dumps(dict(recorded, hits=results, nbHits=len(results), nbPages=1 if results else 0,
+                           query=query)).encode("utf-8")
+
+class FixtureServer:
+    """
+    Serves recorded feeds and HN search results from a local HTTP server.
+    
+    Routes:
+        /rss/<fixture>?items=N&pad_kb=K   RSS built from fixtures/<fixture>.rss
+        /hn?query=Q&hitsPerPage=N          Algolia-style search results (honouring
+                                           numericFilters=created_at_i>T)
+    
+    Every response is delayed by latency seconds (or a latency_ms query
+    parameter) and carries an ETag, so conditional requests get a 304.
+    """
+    
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self._bodies: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "FixtureServer":
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                server._handle(self)
+        
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
+    
+    def _body(self, path: str, query: Dict[str, List[str]]) -> Tuple[bytes, str]:
+        def param(name: str, default: str) -> str:
+            return query.get(name, [default])[0]
+        
+        key = f"{path}?{sorted(query.items())}"
+        with self._lock:
+            body = self._bodies.get(key)
+        if path.startswith("/rss/"):
+            content_type = "application/rss+xml"
+            if body is None:
+                body = build_feed(path[len("/rss/"):], int(param("items", "10")), int(param("pad_kb", "0")))
+        elif path == "/hn":
+            content_type = "application/json"
+            if body is None:
+                since = param("numericFilters", "created_at_i>0").partition(">")[2]
+                body = build_hn_results(param("query", ""), int(param("hitsPerPage", "5")), int(since or 0))
+        else:
+            raise FileNotFoundError(path)
+        with self._lock:
+            self._bodies[key] = body
+        return body, content_type
+    
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(request.path)
+        query = parse_qs(parts.query)
+        latency = float(query.pop("latency_ms", [self.latency * 1000])[0]) / 1000
+        try:
+            body, content_type = self._body(parts.path, query)
+        except FileNotFoundError:
+            request.send_error(404)
+            return
+        
+        if latency:
+            time.sleep(latency)
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if request.headers.get("If-None-Match") == etag:
+            request.send_response(304)
+            request.send_header("ETag", etag)
+            request.end_headers()
+            return
+        
+        request.send_response(200)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        request.send_header("ETag", etag)
+        request.end_headers()
+        request.wfile.write(body)
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Isolate everything toadman touches in a scratch HOME, before toadman is imported
+os.environ["HOME"] = tempfile.mkdtemp(prefix="toadman-test-")
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from toadman.dedupe import DuplicateIndex, canonicalize_url, url_key
+from toadman.models import Article
+
+def _article(title, url, source):
+    return Article(title=title, url=url, published_date=datetime.now(timezone.utc), source=source,
+                   content_snippet="")
+
+def test_canonicalize_url_normalizes_host_port_and_fragment():
+    assert canonicalize_url("HTTPS://Example.COM:443/post/#comments") == "https://example.com/post"
+    assert canonicalize_url("http://example.com:8080/") == "http://example.com:8080/"
+
+def test_canonicalize_url_strips_only_tracking_params():
+    url = "https://example.com/p?b=2&utm_source=hn&UTM_Medium=x&a=1&fbclid=abc"
+    assert canonicalize_url(url) == "https://example.com/p?a=1&b=2"
+    # "ref" selects content on GitHub and similar sites
+    assert canonicalize_url("https://github.com/o/r/blob/x?ref=dev") == "https://github.com/o/r/blob/x?ref=dev"
+
+def test_canonicalize_url_keeps_params_byte_for_byte():
+    assert canonicalize_url("https://example.com/s?q") == "https://example.com/s?q"
+    assert canonicalize_url("https://example.com/s?q=") == "https://example.com/s?q="
+    assert canonicalize_url("https://example.com/s?q=a%20b") == "https://example.com/s?q=a%20b"
+
+def test_canonicalize_url_leaves_other_schemes_alone():
+    assert canonicalize_url("mailto:someone@example.com") == "mailto:someone@example.com"
+    assert canonicalize_url("http://[::1") == "http://[::1"
+
+def test_url_key_ignores_scheme_and_www():
+    assert url_key("http://www.example.com/a/") == url_key("https://example.com/a")
+
+def test_duplicate_index_merges_same_url_and_keeps_sources():
+    index = DuplicateIndex()
+    first = _article("Rust 2.0 released today", "https://example.com/rust?utm_source=hn", "Hacker News")
+    second = _article("Something else entirely", "https://www.example.com/rust/", "Rust Blog")
+    assert index.add(first) is first
+    assert index.add(second) is first
+    assert first.other_sources == ("Rust Blog",)
+    # Adding the same source again does not list it twice
+    index.add(_article("Rust 2.0", "https://example.com/rust", "Rust Blog"))
+    assert first.other_sources == ("Rust Blog",)
+
+def test_duplicate_index_merges_similar_titles_across_sources_only():
+    index = DuplicateIndex()
+    first = _article("OpenAI announces new reasoning model for developers", "https://a.example/1", "OpenAI")
+    other = _article("OpenAI announces new reasoning model for developers", "https://b.example/2", "TechNews")
+    same_source = _article("OpenAI announces new reasoning model for developers", "https://a.example/3", "OpenAI")
+    assert index.add(first) is first
+    assert index.add(other) is first
+    assert index.add(same_source) is same_source
+
+def test_duplicate_index_keeps_generic_titles_apart():
+    index = DuplicateIndex()
+    first = _article("Weekly update", "https://a.example/1", "Blog A")
+    second = _article("Weekly update", "https://b.example/2", "Blog B")
+    assert index.add(first) is first
+    assert index.add(second) is second
@@ -0,0 +1,44 @@
+from toadman.fetchers.hn_fetcher import (
+    CURSOR_OVERLAP_SECONDS, backfill_gaps, batch_since, gap_before, select_new_hits,
+)
+
+NOW = 1_700_000_000
+
+def _hit(created, title="", url=""):
+    return {"objectID": str(created), "created_at_i": created, "title": title, "url": url}
+
+def test_batch_since_uses_the_earliest_keyword():
+    cursors = {"rust": NOW - 100, "go": NOW - 5000}
+    assert batch_since(("rust",), cursors, 7, now=NOW) == NOW - 100 - CURSOR_OVERLAP_SECONDS
+    assert batch_since(("rust", "go"), cursors, 7, now=NOW) == NOW - 5000 - CURSOR_OVERLAP_SECONDS
+    # A keyword without a cursor looks back lookback_days
+    assert batch_since(("rust", "zig"), cursors, 2, now=NOW) == NOW - 2 * 86400
+
+def test_select_new_hits_single_keyword_counts_every_hit():
+    since = NOW - 3600
+    hits = [_hit(NOW - 10), _hit(NOW - 7200)]
+    selected, advanced = select_new_hits(hits, ("rust",), {}, since)
+    assert selected == [hits[0]]
+    assert advanced == {"rust": NOW - 10}
+
+def test_select_new_hits_advances_only_matching_keywords():
+    cursors = {"rust": NOW - 1000, "go": NOW - 100}
+    hits = [_hit(NOW - 50, title="Rust in production"), _hit(NOW - 20, title="Go generics")]
+    selected, advanced = select_new_hits(hits, ("rust", "go"), cursors, NOW - 2000)
+    assert selected == hits
+    assert advanced == {"rust": NOW - 50, "go": NOW - 20}
+
+def test_select_new_hits_skips_hits_older_than_a_keyword_cursor():
+    cursors = {"rust": NOW}
+    old = _hit(NOW - CURSOR_OVERLAP_SECONDS - 1, title="Rust")
+    selected, advanced = select_new_hits([old], ("rust", "go"), cursors, NOW - 86400)
+    assert selected == []
+    assert advanced == {}
+
+def test_gap_before_is_just_past_the_oldest_hit():
+    assert gap_before([_hit(NOW - 5), _hit(NOW - 90)]) == NOW - 89
+    assert gap_before([], before=NOW) == NOW + 1
+
+def test_backfill_gaps_trims_to_the_lookback_window():
+    gaps = [[NOW - 10 * 86400, NOW - 3600], [NOW - 30 * 86400, NOW - 20 * 86400], [NOW - 100, NOW - 99]]
+    assert backfill_gaps(gaps, 7, now=NOW) == [[NOW - 7 * 86400, NOW - 3600]]
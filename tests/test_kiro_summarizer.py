@@ -0,0 +1,21 @@
+from toadman.summarizer.kiro_summarizer import parse_batch_output
+
+def test_parse_batch_output_splits_numbered_summaries():
+    output = (
+        "Here are the summaries.\n"
+        "=== SUMMARY 1 ===\n"
+        "First summary.\nSecond line.\n"
+        "=== SUMMARY 2 ===  \n"
+        "Second summary.\n"
+    )
+    assert parse_batch_output(output, 2) == {1: "First summary.\nSecond line.", 2: "Second summary."}
+
+def test_parse_batch_output_drops_empty_and_unknown_numbers():
+    output = (
+        "=== SUMMARY 1 ===\n\n"
+        "=== SUMMARY 3 ===\nOut of range.\n"
+        "=== SUMMARY 2 ===\nKept.\n"
+        "not a marker: === SUMMARY 1 ===\n"
+    )
+    assert parse_batch_output(output, 2) == {2: "Kept.\nnot a marker: === SUMMARY 1 ==="}
+    assert parse_batch_output("Error: kiro-cli failed", 2) == {}
@@ -0,0 +1,51 @@
+import json
+from toadman import metrics
+
+def _counters(path):
+    return {c["name"]: c["value"] for c in metrics.load(path)["counters"]}
+
+def test_save_merges_runs_and_only_adds_new(tmp_path):
+    path = tmp_path / "metrics.json"
+    metrics.reset()
+    metrics.incr("fetched_total", 3)
+    metrics.observe("fetch_source", 0.5, source="A")
+    metrics.save(path)
+    metrics.incr("fetched_total", 2)
+    metrics.observe("fetch_source", 1.5, source="A")
+    metrics.save(path)
+    # Nothing new since the last save, so this adds nothing
+    metrics.save(path)
+    
+    assert _counters(path) == {"fetched_total": 5}
+    timing, = metrics.load(path)["timings"]
+    assert timing["labels"] == {"source": "A"}
+    assert (timing["count"], timing["sum_seconds"], timing["max_seconds"]) == (2, 2.0, 1.5)
+    
+    # A later process adds to the file rather than replacing it
+    metrics.reset()
+    metrics.incr("fetched_total")
+    metrics.observe("fetch_source", 0.25, source="A")
+    metrics.save(path)
+    assert _counters(path) == {"fetched_total": 6}
+    timing, = metrics.load(path)["timings"]
+    assert (timing["count"], timing["sum_seconds"], timing["max_seconds"]) == (3, 2.25, 1.5)
+    metrics.reset()
+
+def test_save_keeps_the_newest_errors(tmp_path):
+    path = tmp_path / "metrics.json"
+    metrics.reset()
+    for i in range(metrics.MAX_ERRORS + 5):
+        metrics.record_error("fetch_errors_total", f"error {i}")
+    metrics.save(path)
+    metrics.record_error("fetch_errors_total", "last")
+    metrics.save(path)
+    
+    data = json.loads(path.read_text(encoding="utf-8"))
+    messages = [e["message"] for e in data["errors"]]
+    assert len(messages) == metrics.MAX_ERRORS
+    assert messages[-2:] == [f"error {metrics.MAX_ERRORS + 4}", "last"]
+    assert _counters(path) == {"fetch_errors_total": metrics.MAX_ERRORS + 6}
+    metrics.reset()
+
+def test_load_missing_file(tmp_path):
+    assert metrics.load(tmp_path / "missing.json")["timings"] == []
@@ -0,0 +1,35 @@
+import random
+from toadman.config import Config
+from toadman.fetchers.scheduler import MIN_BACKOFF_SECONDS, backoff_delay, learned_interval
+
+CONFIG = Config.from_dict({
+    "schedule": {"min_minutes": 15, "max_hours": 24, "max_backoff_hours": 6},
+    "cache": {"expiry_hours": 2},
+})
+
+NOW = 1_700_000_000.0
+
+def test_learned_interval_polls_twice_per_typical_gap():
+    published = [NOW - 600, NOW - 600 - 7200, NOW - 600 - 14400]
+    assert learned_interval(published, NOW, CONFIG) == 3600
+
+def test_learned_interval_slows_down_for_quiet_sources():
+    published = [NOW - 10 * 3600, NOW - 11 * 3600, NOW - 12 * 3600]
+    assert learned_interval(published, NOW, CONFIG) == 5 * 3600
+
+def test_learned_interval_clamps_and_falls_back():
+    busy = [NOW - 1, NOW - 2, NOW - 3]
+    assert learned_interval(busy, NOW, CONFIG) == 15 * 60
+    assert learned_interval([NOW - 86400 * 30, NOW - 86400 * 60], NOW, CONFIG) == 24 * 3600
+    assert learned_interval([NOW], NOW, CONFIG) == 2 * 3600
+
+def test_backoff_delay_doubles_up_to_the_cap():
+    random.seed(1)
+    for failures, full in ((1, 1800), (2, 3600), (3, 7200), (10, 6 * 3600)):
+        for _ in range(20):
+            assert full / 2 <= backoff_delay(1800, failures, CONFIG) <= full
+
+def test_backoff_delay_has_a_floor():
+    config = Config.from_dict({"schedule": {"min_minutes": 0, "max_hours": 24, "max_backoff_hours": 0}})
+    for _ in range(20):
+        assert MIN_BACKOFF_SECONDS / 2 <= backoff_delay(0, 3, config) <= MIN_BACKOFF_SECONDS
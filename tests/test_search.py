@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+from toadman.models import Article
+from toadman.search import SearchIndex
+
+def _article(title, url, snippet=""):
+    return Article(title=title, url=url, published_date=datetime.now(timezone.utc), source="Blog",
+                   content_snippet=snippet)
+
+def _index():
+    index = SearchIndex()
+    index.add_many([
+        _article("Rust compiler gets faster", "https://example.com/1"),
+        _article("Rusty old bikes", "https://example.com/2", "Not about rust at all, rust everywhere"),
+        _article("Python packaging news", "https://example.com/3", "pip and rustup"),
+        _article("Machine learning in Rust", "https://example.com/4", "machine learning frameworks"),
+    ])
+    return index
+
+def _urls(articles):
+    return [article.url[-1] for article in articles]
+
+def test_last_term_matches_as_prefix_while_typing():
+    index = _index()
+    assert set(_urls(index.search("rus"))) == {"1", "2", "3", "4"}
+    # A trailing space ends the term, so only exact matches remain
+    assert set(_urls(index.search("rust "))) == {"1", "2", "4"}
+    # Single letters do not expand to most of the vocabulary
+    assert index.search("r") == []
+
+def test_every_term_must_match_and_title_hits_rank_first():
+    index = _index()
+    assert _urls(index.search("machine rust")) == ["4"]
+    assert _urls(index.search("rust ", limit=1)) == ["1"]
+
+def test_phrase_scores_need_every_term_exactly():
+    index = _index()
+    assert set(index.phrase_scores("machine learning")) == {"https://example.com/4"}
+    assert index.phrase_scores("machine learn") == {}
+    assert index.phrase_scores("") == {}
+
+def test_index_updates_invalidate_cached_scores():
+    index = _index()
+    assert _urls(index.search("bikes")) == ["2"]
+    index.remove("https://example.com/2")
+    assert index.search("bikes") == []
+    index.add(_article("Bikes again", "https://example.com/5"))
+    assert _urls(index.search("bik")) == ["5"]
+    index.sync([_article("Only this one", "https://example.com/6")])
+    assert len(index) == 1 and index.search("bikes") == []
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime, timezone
+from toadman.cache import save_cache
+from toadman.config import reload_config, save_config
+from toadman.fetchers.hn_fetcher import HN_SOURCE
+from toadman.models import Article
+from toadman.tui.app import ArticleOption, SourceHeader, ToadmanApp
+
+def _setup_store(articles):
+    # No sources are configured, so the app shows the cache and never fetches
+    save_config({"rss_feeds": {}, "hacker_news": {"keywords": []}})
+    reload_config()
+    save_cache(articles)
+
+def test_search_query_with_markup_brackets():
+    _setup_store([
+        Article(title="Release notes [/bold] and [red]more[/red]", url="https://example.com/brackets",
+                published_date=datetime.now(timezone.utc), source=HN_SOURCE, content_snippet="Snippet with [/] brackets"),
+    ])
+    
+    async def scenario():
+        app = ToadmanApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            await pilot.press("/", *"release", "space", "left_square_bracket", "slash")
+            await pilot.pause()
+            assert app.search_query == "release [/"
+            
+            article_list = app.query_one("#article-list")
+            header = article_list.get_option_at_index(0)
+            assert isinstance(header, SourceHeader)
+            assert "release [/" in header.text
+            assert isinstance(article_list.get_option_at_index(1), ArticleOption)
+            
+            # Titles and snippets with brackets render in the list and detail pane
+            await pilot.press("enter")
+            article_list.highlighted = 1
+            await pilot.pause()
+            assert app.selected_article.url == "https://example.com/brackets"
+            app.exit()
+    
+    asyncio.run(scenario())
+
+def test_highlight_shows_cached_summary():
+    article = Article(title="Cached summary story", url="https://example.com/cached",
+                      published_date=datetime.now(timezone.utc), source=HN_SOURCE, content_snippet="Snippet")
+    _setup_store([article])
+    from toadman.cache import put_summary
+    from toadman.summarizer.backends import get_backend
+    put_summary(get_backend().summary_key(article), article.url, "- The cached bullet")
+    
+    async def scenario():
+        app = ToadmanApp()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            app.query_one("#article-list").highlighted = 1
+            # The summary is read on a worker thread, then the detail pane is redrawn
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.summaries.get(article.url) == "- The cached bullet"
+            app.exit()
+    
+    asyncio.run(scenario())
@@ -1,70 +1,587 @@
 import json
+import sqlite3
+import time
+import zlib
+from contextlib import closing
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from toadman.models import Article
+from toadman.config import get_config
+from toadman import metrics
 
 CACHE_DIR = Path.home() / ".toadman" / "cache"
-CACHE_FILE = CACHE_DIR / "articles_cache.json"
-CACHE_EXPIRY_HOURS = 1
+CACHE_FILE = CACHE_DIR / "articles_cache.json"  # Legacy JSON cache, imported into DB_FILE
+DB_FILE = CACHE_DIR / "articles.db"
+VALIDATORS_FILE = CACHE_DIR / "feed_validators.json"
+HN_CURSORS_FILE = CACHE_DIR / "hn_cursors.json"
+HN_BACKFILL_FILE = CACHE_DIR / "hn_backfill.json"
+SUMMARY_CACHE_MAX_BYTES = 20 * 1024 * 1024
+BODY_STORE_MAX_BYTES = 100 * 1024 * 1024
+# Pages that failed or had no text are tried again after this long, since most failures are transient
+BODY_RETRY_SECONDS = 6 * 3600
+# Newest hits kept per Hacker News keyword batch, enough to learn its publication rate from
+BATCH_HITS_KEPT = 50
+
+def article_to_dict(article: Article) -> Dict:
+    """Serialize an article to a JSON-compatible dict."""
+    return {
+        "title": article.title,
+        "url": article.url,
+        "published_date": article.published_date.isoformat() if article.published_date else None,
+        "published_ts": article.published_ts,
+        "source": article.source,
+        "content_snippet": article.content_snippet,
+        "category": article.category,
+        "other_sources": list(article.other_sources),
+    }
+
+def article_from_dict(item: Dict) -> Article:
+    """Rebuild an article from a dict produced by article_to_dict."""
+    published = None
+    published_ts = item.get("published_ts")
+    if published_ts is None and item["published_date"]:
+        # Older dicts (and other tools' JSONL) only carry the ISO date
+        published = datetime.fromisoformat(item["published_date"])
+    
+    return Article(
+        title=item["title"],
+        url=item["url"],
+        published_date=published,
+        source=item["source"],
+        content_snippet=item["content_snippet"],
+        category=item["category"],
+        other_sources=item.get("other_sources", ()),
+        published_ts=published_ts,
+    )
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    published_date TEXT,
+    published_ts REAL,
+    source TEXT NOT NULL,
+    content_snippet TEXT NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, published_ts);
+CREATE TABLE IF NOT EXISTS article_sources (
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (url, source)
+);
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS schedule (
+    source TEXT PRIMARY KEY,
+    interval REAL NOT NULL,
+    next_due REAL NOT NULL,
+    failures INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_last_used ON summaries (last_used);
+CREATE TABLE IF NOT EXISTS bodies (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bodies_fetched_at ON bodies (fetched_at);
+CREATE TABLE IF NOT EXISTS batch_hits (
+    batch TEXT NOT NULL,
+    story_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (batch, story_id)
+);
+CREATE TABLE IF NOT EXISTS exported (
+    target TEXT NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (target, url)
+);
+"""
+
+_UPSERT = """
+INSERT INTO articles (url, title, published_date, published_ts, source, content_snippet, category)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    published_date = excluded.published_date,
+    published_ts = excluded.published_ts,
+    source = excluded.source,
+    content_snippet = excluded.content_snippet,
+    category = excluded.category
+"""
+
+# Store files whose schema this process has already created
+_ready: Set[Path] = set()
+
+def _connect() -> sqlite3.Connection:
+    """Open the article store, creating the schema the first time this process opens it."""
+    fresh = DB_FILE not in _ready or not DB_FILE.exists()
+    if fresh:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_FILE)
+    if fresh:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        if CACHE_FILE.exists():
+            _import_json_cache(conn)
+        _ready.add(DB_FILE)
+    return conn
+
+def _chunked(conn: sqlite3.Connection, sql: str, keys: List[str], params: Tuple = ()) -> Iterator[Tuple]:
+    """
+    Run a query for many keys, a chunk at a time, and yield every row.
+    
+    sql contains "{keys}", which is replaced by one placeholder per key of a
+    chunk; params are bound after them.
+    """
+    # Stay well under SQLite's bound-parameter limit
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i + 500]
+        yield from conn.execute(sql.format(keys=", ".join("?" for _ in chunk)), [*chunk, *params])
+
+def _import_json_cache(conn: sqlite3.Connection) -> None:
+    """Move articles from the legacy JSON cache into the store."""
+    try:
+        cache_data = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+        _upsert(conn, [article_from_dict(item) for item in cache_data["articles"]])
+        conn.commit()
+    except Exception:
+        pass
+    CACHE_FILE.unlink()
+
+def _upsert(conn: sqlite3.Connection, articles: List[Article]) -> None:
+    conn.executemany(_UPSERT, [
+        (
+            a.url,
+            a.title,
+            a.published_date.isoformat() if a.published_ts is not None else None,
+            a.published_ts,
+            a.source,
+            a.content_snippet,
+            a.category,
+        )
+        for a in articles
+    ])
+    # Remember every source that linked to a URL, since the row only keeps the latest one
+    conn.executemany(
+        "INSERT OR IGNORE INTO article_sources (url, source) VALUES (?, ?)",
+        [(a.url, source) for a in articles for source in (a.source, *a.other_sources)],
+    )
+
+def _row_to_article(row) -> Article:
+    title, url, published_ts, source, content_snippet, category, other_sources = row
+    # Positional arguments: this runs once per stored article on every load
+    return Article(title, url, None, source, content_snippet, category,
+                   other_sources.split("\x1f") if other_sources else (), published_ts)
 
 def save_cache(articles: List[Article]) -> None:
-    """Save articles to cache."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    """Upsert articles into the store and mark their sources as freshly fetched."""
+    now = time.time()
+    with metrics.span("cache_save"), closing(_connect()) as conn, conn:
+        _upsert(conn, articles)
+        conn.executemany(
+            "INSERT OR REPLACE INTO sources (source, fetched_at) VALUES (?, ?)",
+            [(source, now) for source in {a.source for a in articles}],
+        )
+
+def mark_sources_fetched(sources: List[str]) -> None:
+    """Mark sources as freshly fetched, e.g. after an incremental fetch that found nothing new."""
+    now = time.time()
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sources (source, fetched_at) VALUES (?, ?)",
+            [(source, now) for source in sources],
+        )
+
+def iter_articles(since: Optional[datetime] = None,
+                  sources: Optional[List[str]] = None) -> Iterator[Article]:
+    """
+    Stream stored articles, newest first, without loading them all into memory.
+    
+    Args:
+        since: Only return articles published at or after this time; naive values are
+            local time (undated articles are excluded)
+        sources: Only return articles from these sources
     
-    cache_data = {
-        "timestamp": datetime.now().isoformat(),
-        "articles": [
-            {
-                "title": a.title,
-                "url": a.url,
-                "published_date": a.published_date.isoformat() if a.published_date else None,
-                "source": a.source,
-                "content_snippet": a.content_snippet,
-                "category": a.category,
+    Yields:
+        Matching articles ordered by published date descending
+    """
+    sql = """
+        SELECT title, url, published_ts, source, content_snippet, category,
+               (SELECT group_concat(s.source, char(31)) FROM article_sources s
+                WHERE s.url = articles.url AND s.source != articles.source)
+        FROM articles"""
+    clauses = []
+    params: List = []
+    if since is not None:
+        clauses.append("published_ts >= ?")
+        params.append(since.timestamp())
+    if sources is not None:
+        clauses.append(f"source IN ({', '.join('?' for _ in sources)})")
+        params.extend(sources)
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY published_ts IS NULL, published_ts DESC"
+    
+    with closing(_connect()) as conn:
+        for row in conn.execute(sql, params):
+            yield _row_to_article(row)
+
+def query_articles(since: Optional[datetime] = None,
+                   sources: Optional[List[str]] = None) -> List[Article]:
+    """Query stored articles, newest first (see iter_articles)."""
+    with metrics.span("cache_load"):
+        articles = list(iter_articles(since, sources))
+    metrics.incr("cache_articles_loaded_total", len(articles))
+    return articles
+
+def stale_sources(expiry_hours: Optional[float] = None) -> List[str]:
+    """Return the sources whose last fetch is older than expiry_hours (defaults to config)."""
+    if expiry_hours is None:
+        expiry_hours = get_config().cache_expiry_hours
+    cutoff = time.time() - expiry_hours * 3600
+    with closing(_connect()) as conn:
+        return [row[0] for row in conn.execute("SELECT source FROM sources WHERE fetched_at < ?", (cutoff,))]
+
+def stored_urls(source: str, urls: List[str]) -> Set[str]:
+    """Return which of urls are already stored as carried by source."""
+    with closing(_connect()) as conn:
+        return {row[0] for row in _chunked(
+            conn, "SELECT url FROM article_sources WHERE url IN ({keys}) AND source = ?", urls, (source,)
+        )}
+
+def recent_published(source: str, limit: int) -> List[float]:
+    """Return the published_ts of a source's newest dated articles, newest first."""
+    with closing(_connect()) as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT published_ts FROM articles WHERE source = ? AND published_ts IS NOT NULL "
+            "ORDER BY published_ts DESC LIMIT ?",
+            (source, limit),
+        )]
+
+def record_batch_hits(batch: str, hits: List[Tuple[str, float]]) -> None:
+    """
+    Record the (objectID, created_at_i) of stories a Hacker News keyword batch found.
+    
+    Every batch's stories are stored as HN_SOURCE, so the scheduler learns
+    each batch's rate from these instead. Only the newest BATCH_HITS_KEPT
+    are kept.
+    """
+    if not hits:
+        return
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO batch_hits (batch, story_id, created_at) VALUES (?, ?, ?)",
+            [(batch, story_id, created_at) for story_id, created_at in hits],
+        )
+        conn.execute(
+            "DELETE FROM batch_hits WHERE batch = ? AND story_id NOT IN "
+            "(SELECT story_id FROM batch_hits WHERE batch = ? ORDER BY created_at DESC LIMIT ?)",
+            (batch, batch, BATCH_HITS_KEPT),
+        )
+
+def recent_batch_hits(batch: str, limit: int) -> List[float]:
+    """Return the created_at of a Hacker News keyword batch's newest recorded stories, newest first."""
+    with closing(_connect()) as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT created_at FROM batch_hits WHERE batch = ? ORDER BY created_at DESC LIMIT ?",
+            (batch, limit),
+        )]
+
+def load_schedule() -> Dict[str, Dict]:
+    """
+    Load the refresh schedule keyed by source name.
+    
+    Each entry holds the source's learned "interval" in seconds, the epoch it
+    is "next_due" and its consecutive "failures".
+    """
+    try:
+        with closing(_connect()) as conn:
+            return {
+                source: {"interval": interval, "next_due": next_due, "failures": failures}
+                for source, interval, next_due, failures in conn.execute(
+                    "SELECT source, interval, next_due, failures FROM schedule"
+                )
             }
-            for a in articles
-        ]
+    except sqlite3.Error:
+        return {}
+
+def save_schedule(entries: Dict[str, Dict]) -> None:
+    """Insert or replace the schedule entries of the given sources."""
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO schedule (source, interval, next_due, failures) VALUES (?, ?, ?, ?)",
+            [(source, e["interval"], e["next_due"], e["failures"]) for source, e in entries.items()],
+        )
+
+def clear_cache() -> None:
+    """Expire every source so the next load refetches (the article archive and learned intervals are kept)."""
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM sources")
+        conn.execute("UPDATE schedule SET next_due = 0")
+
+def cache_stats() -> Dict:
+    """Summarize the contents of the article store and summary cache."""
+    with closing(_connect()) as conn:
+        total, oldest, newest = conn.execute(
+            "SELECT COUNT(*), MIN(published_ts), MAX(published_ts) FROM articles"
+        ).fetchone()
+        counts = dict(conn.execute("SELECT source, COUNT(*) FROM articles GROUP BY source"))
+        fetched = dict(conn.execute("SELECT source, fetched_at FROM sources"))
+        schedule = list(conn.execute("SELECT source, interval, next_due, failures FROM schedule ORDER BY source"))
+        summary_count, summary_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+        ).fetchone()
+        body_count, body_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM bodies WHERE size > 0"
+        ).fetchone()
+    
+    def iso(ts: Optional[float]) -> Optional[str]:
+        return datetime.fromtimestamp(ts).isoformat() if ts is not None else None
+    
+    return {
+        "db_path": str(DB_FILE),
+        "db_bytes": DB_FILE.stat().st_size if DB_FILE.exists() else 0,
+        "articles": total,
+        "oldest_published": iso(oldest),
+        "newest_published": iso(newest),
+        "sources": {
+            source: {"articles": counts.get(source, 0), "fetched_at": iso(fetched.get(source))}
+            for source in sorted(set(counts) | set(fetched))
+        },
+        "stale_sources": stale_sources(),
+        "schedule": {
+            source: {"interval_minutes": round(interval / 60, 1), "next_due": iso(next_due), "failures": failures}
+            for source, interval, next_due, failures in schedule
+        },
+        "summaries": summary_count,
+        "summary_bytes": summary_bytes,
+        "bodies": body_count,
+        "body_bytes": body_bytes,
     }
+
+def load_feed_validators() -> Dict[str, Dict]:
+    """
+    Load per-feed HTTP validators keyed by feed URL.
     
-    CACHE_FILE.write_text(json.dumps(cache_data, indent=2), encoding='utf-8')
+    Each entry holds the feed's "source" name, its "etag" and "last_modified"
+    response headers, and the "articles" parsed from the last full response,
+    which are reused when the server answers a conditional request with 304.
+    """
+    if not VALIDATORS_FILE.exists():
+        return {}
+    
+    try:
+        return json.loads(VALIDATORS_FILE.read_text(encoding='utf-8'))
+    except Exception:
+        return {}
+
+def save_feed_validators(validators: Dict[str, Dict]) -> None:
+    """Save per-feed HTTP validators."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    VALIDATORS_FILE.write_text(json.dumps(validators), encoding='utf-8')
 
-def load_cache() -> Optional[List[Article]]:
-    """Load articles from cache if not expired."""
-    if not CACHE_FILE.exists():
-        return None
+def load_hn_cursors() -> Dict[str, int]:
+    """
+    Load the newest Hacker News created_at_i seen per keyword.
+    
+    Incremental HN fetches only ask for stories created after a keyword's cursor.
+    """
+    if not HN_CURSORS_FILE.exists():
+        return {}
     
     try:
-        cache_data = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
-        
-        # Check if cache is expired
-        cache_time = datetime.fromisoformat(cache_data["timestamp"])
-        if datetime.now() - cache_time > timedelta(hours=CACHE_EXPIRY_HOURS):
-            return None
+        return json.loads(HN_CURSORS_FILE.read_text(encoding='utf-8'))
+    except Exception:
+        return {}
+
+def save_hn_cursors(cursors: Dict[str, int]) -> None:
+    """Save the per-keyword Hacker News cursors."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    HN_CURSORS_FILE.write_text(json.dumps(cursors), encoding='utf-8')
+
+def load_hn_backfill() -> Dict[str, List[List[int]]]:
+    """
+    Load the Hacker News backfill gaps per keyword batch.
+    
+    Each gap is an [after, before] created_at_i range, newest first, whose
+    stories a truncated search skipped and later fetches page back through.
+    """
+    if not HN_BACKFILL_FILE.exists():
+        return {}
+    
+    try:
+        return json.loads(HN_BACKFILL_FILE.read_text(encoding='utf-8'))
+    except Exception:
+        return {}
+
+def save_hn_backfill(gaps: Dict[str, List[List[int]]]) -> None:
+    """Save the Hacker News backfill gaps per keyword batch."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    HN_BACKFILL_FILE.write_text(json.dumps(gaps), encoding='utf-8')
+
+def get_summaries(keys: List[str]) -> Dict[str, str]:
+    """
+    Look up cached summaries by content key, marking hits as recently used.
+    
+    Args:
+        keys: Summary cache keys (see toadman.summarizer.kiro_summarizer.summary_key)
+    
+    Returns:
+        Dict mapping each key that has a cached summary to that summary
+    """
+    found: Dict[str, str] = {}
+    now = time.time()
+    with closing(_connect()) as conn, conn:
+        found.update(_chunked(conn, "SELECT key, summary FROM summaries WHERE key IN ({keys})", keys))
+        conn.executemany("UPDATE summaries SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+    metrics.incr("summary_cache_hits_total", len(found))
+    metrics.incr("summary_cache_misses_total", len(keys) - len(found))
+    return found
+
+def get_summary(key: str) -> Optional[str]:
+    """Look up a single cached summary by content key."""
+    return get_summaries([key]).get(key)
+
+def put_summary(key: str, url: str, summary: str,
+                max_bytes: int = SUMMARY_CACHE_MAX_BYTES) -> None:
+    """Cache a summary, evicting least recently used summaries beyond max_bytes."""
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO summaries (key, url, summary, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            (key, url, summary, len(summary.encode('utf-8')), time.time()),
+        )
         
-        # Reconstruct articles
-        articles = []
-        for item in cache_data["articles"]:
-            published = None
-            if item["published_date"]:
-                published = datetime.fromisoformat(item["published_date"])
-            
-            article = Article(
-                title=item["title"],
-                url=item["url"],
-                published_date=published,
-                source=item["source"],
-                content_snippet=item["content_snippet"],
-                category=item["category"],
-            )
-            articles.append(article)
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        if total <= max_bytes:
+            return
         
-        return articles
+        evict = []
+        for old_key, size in conn.execute("SELECT key, size FROM summaries ORDER BY last_used"):
+            if total <= max_bytes or old_key == key:
+                break
+            evict.append((old_key,))
+            total -= size
+        conn.executemany("DELETE FROM summaries WHERE key = ?", evict)
+
+def get_bodies(urls: List[str]) -> Dict[str, str]:
+    """
+    Look up the stored full text of articles.
     
-    except Exception:
-        return None
+    Args:
+        urls: Article URLs
+    
+    Returns:
+        Dict mapping each URL with stored text to that text (pages that could
+        not be fetched or had no text are left out)
+    """
+    found: Dict[str, str] = {}
+    with closing(_connect()) as conn:
+        for url, body in _chunked(conn, "SELECT url, body FROM bodies WHERE size > 0 AND url IN ({keys})", urls):
+            found[url] = zlib.decompress(body).decode('utf-8')
+    return found
 
-def clear_cache() -> None:
-    """Clear the cache file."""
-    if CACHE_FILE.exists():
-        CACHE_FILE.unlink()
+def get_body(url: str) -> Optional[str]:
+    """Look up the stored full text of a single article."""
+    return get_bodies([url]).get(url)
+
+def stored_bodies(urls: List[str]) -> Set[str]:
+    """Return which of urls have stored full text (see get_bodies), without reading it."""
+    with closing(_connect()) as conn:
+        return {row[0] for row in _chunked(conn, "SELECT url FROM bodies WHERE size > 0 AND url IN ({keys})", urls)}
+
+def has_bodies(articles: List[Article]) -> List[bool]:
+    """Return whether each article would be summarized from its stored full text (see article_contents)."""
+    if not get_config().content_enabled:
+        return [False] * len(articles)
+    stored = stored_bodies([a.url for a in articles])
+    return [a.url in stored for a in articles]
+
+def article_contents(articles: List[Article], max_chars: Optional[int] = None) -> List[str]:
+    """
+    Return the text to summarize for each article.
+    
+    That is the article's stored full text (see toadman.fetchers.content_fetcher),
+    cut to max_chars, when content fetching is enabled and the page has been
+    fetched, and its feed snippet otherwise.
+    
+    Args:
+        articles: The articles to summarize
+        max_chars: Maximum characters of full text per article (defaults to content.max_prompt_chars)
+    
+    Returns:
+        One text per article, in input order
+    """
+    config = get_config()
+    if max_chars is None:
+        max_chars = config.content_max_prompt_chars
+    bodies = get_bodies([a.url for a in articles]) if config.content_enabled else {}
+    return [bodies[a.url][:max_chars] if a.url in bodies else a.content_snippet for a in articles]
+
+def attempted_bodies(urls: List[str]) -> Set[str]:
+    """Return which of urls need no fetch: their text is stored, or their page failed within BODY_RETRY_SECONDS."""
+    retry_before = time.time() - BODY_RETRY_SECONDS
+    with closing(_connect()) as conn:
+        return {row[0] for row in _chunked(
+            conn, "SELECT url FROM bodies WHERE url IN ({keys}) AND (size > 0 OR fetched_at >= ?)",
+            urls, (retry_before,)
+        )}
+
+def put_bodies(bodies: Dict[str, str], max_bytes: int = BODY_STORE_MAX_BYTES) -> None:
+    """
+    Store articles' full text compressed, keyed by URL, evicting the oldest beyond max_bytes.
+    
+    An empty text records that the page failed or had no text, so it is not
+    fetched again for BODY_RETRY_SECONDS; such records are evicted after that.
+    """
+    now = time.time()
+    rows = []
+    for url, text in bodies.items():
+        compressed = zlib.compress(text.encode('utf-8'), 6) if text else b""
+        rows.append((url, compressed, len(compressed), now))
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO bodies (url, body, size, fetched_at) VALUES (?, ?, ?, ?)", rows
+        )
+        conn.execute("DELETE FROM bodies WHERE size = 0 AND fetched_at < ?", (now - BODY_RETRY_SECONDS,))
+        
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        if total <= max_bytes:
+            return
+        
+        evict = []
+        for old_url, size in conn.execute("SELECT url, size FROM bodies WHERE size > 0 ORDER BY fetched_at"):
+            if total <= max_bytes:
+                break
+            evict.append((old_url,))
+            total -= size
+        conn.executemany("DELETE FROM bodies WHERE url = ?", evict)
+
+def exported_urls(target: str, urls: List[str]) -> Set[str]:
+    """Return which of urls have already been exported to target (an export file path)."""
+    with closing(_connect()) as conn:
+        return {row[0] for row in _chunked(
+            conn, "SELECT url FROM exported WHERE url IN ({keys}) AND target = ?", urls, (target,)
+        )}
+
+def forget_exported(target: str) -> None:
+    """Forget what was exported to target, e.g. because the file was deleted."""
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM exported WHERE target = ?", (target,))
+
+def mark_exported(target: str, urls: List[str]) -> None:
+    """Record that urls have been exported to target."""
+    with closing(_connect()) as conn, conn:
+        conn.executemany("INSERT OR IGNORE INTO exported (target, url) VALUES (?, ?)", [(target, url) for url in urls])
@@ -1,26 +1,210 @@
+from toadman import startup, metrics
+import json
 import click
+from itertools import islice
 from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, Optional
 from toadman import __version__
-from toadman.cache import clear_cache
+from toadman.summarizer.backends import BACKENDS
 
-@click.command()
+startup.mark("cli imported")
+
+# Streamed articles are collapsed into stories this many at a time (newest first, so a
+# story's copies are usually close together)
+DEDUPE_WINDOW = 500
+
+def _article_window(days: int):
+    """Return the (since, sources) window used for headless queries, matching the TUI."""
+    from toadman.config import get_config
+    from toadman.fetchers.hn_fetcher import HN_SOURCE
+    
+    since = datetime.combine(datetime.now().date() - timedelta(days=days), datetime.min.time())
+    return since, list(get_config().rss_feeds) + [HN_SOURCE]
+
+def _read_articles(input_file, days: int, limit: Optional[int], sort: str = 'date') -> Iterator:
+    """
+    Read articles, one per story, from a JSONL stream or from the local store when no input is given.
+    
+    Articles are read lazily, newest first, and collapsed DEDUPE_WINDOW at a
+    time, so memory stays bounded however many are streamed; sort 'relevance'
+    reads them all, collapses and ranks them (see toadman.relevance) before
+    applying limit.
+    """
+    from toadman.cache import article_from_dict, iter_articles
+    from toadman.dedupe import collapse_duplicates
+    
+    if input_file is not None:
+        articles = (article_from_dict(json.loads(line)) for line in input_file if line.strip())
+    else:
+        since, sources = _article_window(days)
+        articles = iter_articles(since=since, sources=sources)
+    if sort == 'relevance':
+        from toadman.relevance import rank_by_relevance
+        articles = rank_by_relevance(collapse_duplicates(articles))
+    else:
+        articles = collapse_duplicates(articles, window=DEDUPE_WINDOW)
+    
+    return islice(articles, limit) if limit else articles
+
+def _emit(records: Iterable[Dict]) -> None:
+    """Write records to stdout as JSON lines, flushing after each one."""
+    for record in records:
+        click.echo(json.dumps(record, ensure_ascii=False))
+
+days_option = click.option('--days', default=7, show_default=True, help='Only use articles from the last N days')
+sort_option = click.option('--sort', type=click.Choice(['date', 'relevance']), default='date', show_default=True,
+                           help='Order articles by date or by relevance to the configured keywords and interests')
+input_option = click.option('--input', 'input_file', type=click.File('r'), default=None,
+                            help='Read articles as JSONL from a file ("-" for stdin) instead of the local store')
+
+@click.group(invoke_without_command=True)
 @click.version_option(version=__version__)
 @click.option('--refresh', is_flag=True, help='Force refresh articles (ignore cache)')
-def main(refresh):
+@click.option('--startup-profile', is_flag=True,
+              help='Launch the TUI, exit after the first frame and report startup timings')
+@click.pass_context
+def main(ctx, refresh, startup_profile):
     """Toadman - Agentic news platform"""
     # Create ~/.toadman directory structure
     toadman_dir = Path.home() / ".toadman"
     (toadman_dir / "cache").mkdir(parents=True, exist_ok=True)
     (toadman_dir / "exports").mkdir(parents=True, exist_ok=True)
     
+    # Keep this run's timings and errors for `toadman metrics`
+    ctx.call_on_close(metrics.save)
+    
     # Clear cache if refresh flag is set
     if refresh:
+        from toadman.cache import clear_cache
         clear_cache()
     
+    if ctx.invoked_subcommand is not None:
+        return
+    
     # Launch TUI
     from toadman.tui.app import ToadmanApp
-    app = ToadmanApp()
+    startup.mark("tui imported")
+    app = ToadmanApp(exit_after_first_paint=startup_profile)
     app.run()
+    
+    if startup_profile:
+        click.echo(startup.report(), err=True)
+        if not startup.within_budget():
+            ctx.exit(1)
+
+@main.command()
+@click.option('--all', 'fetch_all', is_flag=True, help='Fetch every source, not only those that are due')
+def fetch(fetch_all):
+    """Fetch the due sources, save them to the store and stream the articles as JSONL."""
+    import asyncio
+    from toadman.cache import article_to_dict, save_cache
+    from toadman.fetchers.engine import iter_source_articles
+    
+    async def run():
+        async for articles in iter_source_articles(due_only=not fetch_all):
+            save_cache(articles)
+            _emit(article_to_dict(a) for a in articles)
+    
+    asyncio.run(run())
+
+@main.command()
+@days_option
+@input_option
+@sort_option
+@click.option('--limit', type=int, default=None, help='Summarize at most N articles')
+@click.option('--batch-size', type=int, default=None, help='Articles per kiro-cli call (defaults to config)')
+@click.option('--backend', type=click.Choice(list(BACKENDS)), default=None,
+              help='Summarizer backend (defaults to summarizer.backend in config)')
+def summarize(days, input_file, sort, limit, batch_size, backend):
+    """Summarize articles (with Kiro by default) and stream them with their summaries as JSONL."""
+    from toadman.cache import article_to_dict
+    from toadman.config import get_config
+    from toadman.summarizer.backends import get_backend
+    
+    summarize_articles = get_backend(backend).summarize_articles
+    articles = _read_articles(input_file, days, limit, sort)
+    config = get_config()
+    batch_size = batch_size or config.summarizer_batch_size
+    
+    while True:
+        batch = list(islice(articles, batch_size))
+        if not batch:
+            break
+        # Batched calls get twice the per-article timeout, as in the TUI's summary queue
+        summaries = summarize_articles(batch, batch_size=batch_size, timeout=config.summarizer_timeout * 2)
+        _emit(dict(article_to_dict(a), summary=summary) for a, summary in zip(batch, summaries))
+
+@main.command()
+@days_option
+@input_option
+@sort_option
+@click.option('--limit', type=int, default=None, help='Export at most N articles')
+@click.option('--format', 'fmt', type=click.Choice(['markdown', 'jsonl', 'html']), default='markdown',
+              show_default=True, help='Output format')
+@click.option('--output', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help='Output file (defaults to ~/.toadman/exports)')
+@click.option('--append-new', is_flag=True,
+              help='Append only articles not yet exported to the output file')
+def export(days, input_file, sort, limit, fmt, output, append_new):
+    """Stream articles (with cached summaries) to an export file and print its path as JSON."""
+    from toadman.export.stream_exporter import export_articles
+    
+    articles = _read_articles(input_file, days, limit, sort)
+    filepath = export_articles(articles, fmt=fmt, path=output, append_new=append_new)
+    _emit([{"path": str(filepath), "format": fmt}])
+
+@main.command()
+@click.option('--interval', type=float, default=None,
+              help='Minutes between refreshes (defaults to daemon.refresh_minutes in config)')
+@click.option('--status', is_flag=True, help='Print the running daemon\'s status as JSON and exit')
+@click.pass_context
+def daemon(ctx, interval, status):
+    """Keep the store fresh in the background and share it with TUIs over a Unix socket."""
+    import asyncio
+    from toadman.daemon import Daemon, DaemonError, request
+    
+    if status:
+        reply = asyncio.run(request("status"))
+        _emit([reply or {"running": False}])
+        if reply is None:
+            ctx.exit(1)
+        return
+    
+    try:
+        asyncio.run(Daemon(interval_minutes=interval).serve())
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+
+@main.command(name='metrics')
+@click.option('--format', 'fmt', type=click.Choice(['json', 'prometheus']), default='json',
+              show_default=True, help='Output format')
+def metrics_command(fmt):
+    """Print the timings, counters and errors recorded by every run so far."""
+    data = metrics.load()
+    if fmt == 'prometheus':
+        click.echo(metrics.to_prometheus(data), nl=False)
+    else:
+        _emit([data])
+
+@main.group()
+def cache():
+    """Inspect or clear the local article store."""
+
+@cache.command()
+def stats():
+    """Print article store and summary cache statistics as JSON."""
+    from toadman.cache import cache_stats
+    
+    _emit([cache_stats()])
+
+@cache.command()
+def clear():
+    """Expire every source so the next load refetches."""
+    from toadman.cache import clear_cache
+    
+    clear_cache()
+    _emit([{"cleared": True}])
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,16 @@
+import sys
+import threading
+import time
 import toml
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Optional, Tuple
 
 CONFIG_FILE = Path.home() / ".toadman" / "config.toml"
 
+# How often get_config() may stat the config file to notice edits
+RELOAD_CHECK_SECONDS = 1.0
+
 DEFAULT_CONFIG = {
     "rss_feeds": {
         "OpenAI": "https://openai.com/blog/rss.xml",
@@ -13,9 +20,49 @@ DEFAULT_CONFIG = {
     "hacker_news": {
         "keywords": ["agentic", "Claude Code", "Codex", "OpenClaw"],
         "hits_per_keyword": 5,
+        "max_pages": 3,
+        "keywords_per_request": 4,
+        "lookback_days": 7,
+    },
+    "relevance": {
+        "interests": [],
+        "half_life_hours": 24,
     },
     "cache": {
         "expiry_hours": 1,
+        "summary_max_mb": 20,
+    },
+    "fetch": {
+        "max_concurrency": 8,
+        "source_timeout": 10,
+        "max_entries": 10,
+        "max_feed_mb": 5,
+        "parse_workers": 2,
+    },
+    "schedule": {
+        "min_minutes": 15,
+        "max_hours": 24,
+        "max_backoff_hours": 6,
+    },
+    "daemon": {
+        "refresh_minutes": 15,
+    },
+    "content": {
+        "enabled": False,
+        "prefetch_count": 20,
+        "per_host": 2,
+        "max_page_kb": 2048,
+        "max_prompt_chars": 12000,
+        "store_max_mb": 100,
+    },
+    "summarizer": {
+        "max_workers": 2,
+        "timeout": 60,
+        "batch_size": 5,
+        "backend": "kiro",
+        "preview": True,
+        "pool_size": 2,
+        "idle_minutes": 5,
     },
 }
 
@@ -32,21 +79,172 @@ def load_config() -> Dict:
 
 def save_config(config: Dict) -> None:
     """Save configuration to file."""
+    global _config_checked_at
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, 'w') as f:
         toml.dump(config, f)
+    # Let the next get_config() notice the new mtime immediately
+    _config_checked_at = 0.0
+
+@dataclass(frozen=True)
+class Config:
+    """Validated settings read from config.toml, with defaults for anything missing or invalid."""
+    rss_feeds: Dict[str, str]
+    hn_keywords: Tuple[str, ...]
+    hn_hits_per_keyword: int
+    hn_max_pages: int
+    hn_keywords_per_request: int
+    hn_lookback_days: float
+    relevance_interests: Tuple[str, ...]
+    relevance_half_life_hours: float
+    cache_expiry_hours: float
+    summary_cache_max_mb: float
+    fetch_max_concurrency: int
+    fetch_source_timeout: float
+    fetch_max_entries: int
+    fetch_max_feed_mb: float
+    fetch_parse_workers: int
+    schedule_min_minutes: float
+    schedule_max_hours: float
+    schedule_max_backoff_hours: float
+    daemon_refresh_minutes: float
+    content_enabled: bool
+    content_prefetch_count: int
+    content_per_host: int
+    content_max_page_kb: float
+    content_max_prompt_chars: int
+    content_store_max_mb: float
+    summarizer_max_workers: int
+    summarizer_timeout: int
+    summarizer_batch_size: int
+    summarizer_backend: str
+    summarizer_preview: bool
+    summarizer_pool_size: int
+    summarizer_idle_minutes: float
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Config":
+        """Build a Config from parsed TOML, warning about and replacing invalid values."""
+        feeds = _section(data, "rss_feeds")
+        if feeds is None or not all(isinstance(k, str) and isinstance(v, str) for k, v in feeds.items()):
+            _warn("rss_feeds", "expected a table of name = \"url\" pairs")
+            feeds = DEFAULT_CONFIG["rss_feeds"]
+        
+        keywords = _setting(data, "hacker_news", "keywords")
+        if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+            _warn("hacker_news.keywords", "expected a list of strings")
+            keywords = DEFAULT_CONFIG["hacker_news"]["keywords"]
+        
+        interests = _setting(data, "relevance", "interests")
+        if not isinstance(interests, list) or not all(isinstance(i, str) for i in interests):
+            _warn("relevance.interests", "expected a list of strings")
+            interests = DEFAULT_CONFIG["relevance"]["interests"]
+        
+        content_enabled = _setting(data, "content", "enabled")
+        if not isinstance(content_enabled, bool):
+            _warn("content.enabled", "expected true or false")
+            content_enabled = DEFAULT_CONFIG["content"]["enabled"]
+        
+        # Whether a backend by this name exists is checked by toadman.summarizer.backends.get_backend
+        backend = _setting(data, "summarizer", "backend")
+        if not isinstance(backend, str):
+            _warn("summarizer.backend", "expected a backend name")
+            backend = DEFAULT_CONFIG["summarizer"]["backend"]
+        
+        preview = _setting(data, "summarizer", "preview")
+        if not isinstance(preview, bool):
+            _warn("summarizer.preview", "expected true or false")
+            preview = DEFAULT_CONFIG["summarizer"]["preview"]
+        
+        return cls(
+            rss_feeds=dict(feeds),
+            hn_keywords=tuple(keywords),
+            hn_hits_per_keyword=_number(data, "hacker_news", "hits_per_keyword", int, minimum=1),
+            hn_max_pages=_number(data, "hacker_news", "max_pages", int, minimum=1),
+            hn_keywords_per_request=_number(data, "hacker_news", "keywords_per_request", int, minimum=1),
+            hn_lookback_days=_number(data, "hacker_news", "lookback_days", float, minimum=0),
+            relevance_interests=tuple(interests),
+            relevance_half_life_hours=_number(data, "relevance", "half_life_hours", float, minimum=0),
+            cache_expiry_hours=_number(data, "cache", "expiry_hours", float, minimum=0),
+            summary_cache_max_mb=_number(data, "cache", "summary_max_mb", float, minimum=0),
+            fetch_max_concurrency=_number(data, "fetch", "max_concurrency", int, minimum=1),
+            fetch_source_timeout=_number(data, "fetch", "source_timeout", float, minimum=0.1),
+            fetch_max_entries=_number(data, "fetch", "max_entries", int, minimum=1),
+            fetch_max_feed_mb=_number(data, "fetch", "max_feed_mb", float, minimum=0.01),
+            fetch_parse_workers=_number(data, "fetch", "parse_workers", int, minimum=0),
+            schedule_min_minutes=_number(data, "schedule", "min_minutes", float, minimum=0),
+            schedule_max_hours=_number(data, "schedule", "max_hours", float, minimum=0),
+            schedule_max_backoff_hours=_number(data, "schedule", "max_backoff_hours", float, minimum=0),
+            daemon_refresh_minutes=_number(data, "daemon", "refresh_minutes", float, minimum=0.1),
+            content_enabled=content_enabled,
+            content_prefetch_count=_number(data, "content", "prefetch_count", int, minimum=0),
+            content_per_host=_number(data, "content", "per_host", int, minimum=1),
+            content_max_page_kb=_number(data, "content", "max_page_kb", float, minimum=1),
+            content_max_prompt_chars=_number(data, "content", "max_prompt_chars", int, minimum=300),
+            content_store_max_mb=_number(data, "content", "store_max_mb", float, minimum=0),
+            summarizer_max_workers=_number(data, "summarizer", "max_workers", int, minimum=1),
+            summarizer_timeout=_number(data, "summarizer", "timeout", int, minimum=1),
+            summarizer_batch_size=_number(data, "summarizer", "batch_size", int, minimum=1),
+            summarizer_backend=backend,
+            summarizer_preview=preview,
+            summarizer_pool_size=_number(data, "summarizer", "pool_size", int, minimum=0),
+            summarizer_idle_minutes=_number(data, "summarizer", "idle_minutes", float, minimum=0),
+        )
+
+def _warn(key: str, problem: str) -> None:
+    print(f"Invalid config value for {key}: {problem}; using the default", file=sys.stderr)
+
+def _section(data: Dict, section: str) -> Optional[Dict]:
+    value = data.get(section, DEFAULT_CONFIG[section])
+    return value if isinstance(value, dict) else None
+
+def _setting(data: Dict, section: str, key: str) -> Any:
+    return (_section(data, section) or {}).get(key, DEFAULT_CONFIG[section][key])
 
-def get_rss_feeds() -> Dict[str, str]:
-    """Get RSS feeds from config."""
-    config = load_config()
-    return config.get("rss_feeds", DEFAULT_CONFIG["rss_feeds"])
+def _number(data: Dict, section: str, key: str, kind: type, minimum: float) -> Any:
+    """Read a numeric setting, falling back to the default if it has the wrong type or is too small."""
+    value = _setting(data, section, key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum:
+        _warn(f"{section}.{key}", f"expected a number >= {minimum}")
+        value = DEFAULT_CONFIG[section][key]
+    return kind(value)
 
-def get_hn_keywords() -> List[str]:
-    """Get Hacker News keywords from config."""
-    config = load_config()
-    return config.get("hacker_news", {}).get("keywords", DEFAULT_CONFIG["hacker_news"]["keywords"])
+_config: Optional[Config] = None
+_config_mtime: Optional[float] = None
+_config_checked_at = 0.0
+_config_lock = threading.Lock()
+
+def get_config() -> Config:
+    """
+    Return the current configuration, loading it on first use.
+    
+    The parsed config is memoized and only re-read when the file's mtime
+    changes; the file is stat'ed at most once per RELOAD_CHECK_SECONDS, so
+    this is cheap enough to call on hot paths.
+    
+    Returns:
+        The validated Config; the same object is returned until the file changes
+    """
+    global _config, _config_mtime, _config_checked_at
+    now = time.monotonic()
+    if _config is not None and now - _config_checked_at < RELOAD_CHECK_SECONDS:
+        return _config
+    
+    with _config_lock:
+        _config_checked_at = now
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime
+        except OSError:
+            mtime = None
+        if _config is None or mtime != _config_mtime:
+            _config = Config.from_dict(load_config())
+            # load_config() creates the file when missing, so stat again
+            _config_mtime = CONFIG_FILE.stat().st_mtime if CONFIG_FILE.exists() else None
+        return _config
 
-def get_cache_expiry_hours() -> int:
-    """Get cache expiry hours from config."""
-    config = load_config()
-    return config.get("cache", {}).get("expiry_hours", DEFAULT_CONFIG["cache"]["expiry_hours"])
+def reload_config() -> Config:
+    """Discard the memoized configuration and read the file again."""
+    global _config
+    with _config_lock:
+        _config = None
+    return get_config()
@@ -0,0 +1,275 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from toadman.models import Article
+from toadman.config import get_config
+from toadman import metrics
+
+SOCKET_PATH = Path.home() / ".toadman" / "daemon.sock"
+
+# Replies carry whole article sets on one line, well past asyncio's 64 KB default
+STREAM_LIMIT = 64 * 1024 * 1024
+
+# A daemon that does not accept within this long is treated as absent
+CONNECT_TIMEOUT = 0.5
+
+class DaemonError(Exception):
+    """Raised when a daemon cannot start or answers a request with an error."""
+
+class Daemon:
+    """
+    Keeps the article store warm and shares it with TUIs over a Unix socket.
+    
+    Whenever a source falls due (see scheduler), checking at least every
+    refresh interval, or on request, the due sources are fetched into the
+    store. Clients speak newline-delimited JSON, one request per line:
+        
+        {"op": "articles", "since": <epoch>, "sources": [...]}  -> {"articles": [...]}
+        {"op": "refresh", "force": <bool>}                    -> {"ok": true}
+        {"op": "status"}                                      -> {"pid": ..., ...}
+        {"op": "watch"}                                       -> a stream of events
+    
+    Watchers get {"event": "changed", "sources": [...]} whenever fetched
+    articles are saved and {"event": "refreshed", ...} after each refresh.
+    """
+    
+    def __init__(self, interval_minutes: Optional[float] = None, path: Path = SOCKET_PATH):
+        self.interval_minutes = interval_minutes
+        self.path = path
+        self.last_refresh: Optional[float] = None
+        self.next_refresh: Optional[float] = None
+        self.refreshing = False
+        self._wake: Optional[asyncio.Event] = None
+        self._watchers: Set[asyncio.StreamWriter] = set()
+        # Article sets already served, keyed by window, until the store changes
+        self._served: Dict[Tuple, List[Dict]] = {}
+    
+    async def serve(self) -> None:
+        """Listen on the socket and refresh on schedule until SIGINT or SIGTERM."""
+        if is_running(self.path):
+            raise DaemonError(f"a daemon is already listening on {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        
+        self._wake = asyncio.Event()
+        server = await asyncio.start_unix_server(self._handle, path=str(self.path), limit=STREAM_LIMIT)
+        os.chmod(self.path, 0o600)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        
+        refresher = asyncio.ensure_future(self._refresh_loop())
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            refresher.cancel()
+            for writer in list(self._watchers):
+                writer.close()
+            self.path.unlink(missing_ok=True)
+    
+    def _interval_seconds(self) -> float:
+        # Read on every cycle so edits to config.toml apply without a restart
+        minutes = self.interval_minutes or get_config().daemon_refresh_minutes
+        return minutes * 60
+    
+    async def _refresh_loop(self) -> None:
+        from toadman.fetchers.scheduler import seconds_until_due
+        
+        while True:
+            await self.refresh()
+            # Sleep until the next source falls due, but never past the interval, so config edits apply
+            delay = min(seconds_until_due(), self._interval_seconds())
+            self.next_refresh = time.time() + delay
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+    
+    async def refresh(self) -> None:
+        """Fetch the due sources into the store, telling watchers as each one lands, then prefetch article text."""
+        from toadman.cache import save_cache
+        from toadman.fetchers.engine import iter_source_articles
+        from toadman.fetchers.content_fetcher import prefetch_recent
+        from toadman.fetchers.hn_fetcher import HN_SOURCE
+        
+        self.refreshing = True
+        errors_before = metrics.total("fetch_errors_total")
+        try:
+            async for articles in iter_source_articles(due_only=True):
+                save_cache(articles)
+                self._served.clear()
+                self._broadcast({"event": "changed", "sources": sorted({a.source for a in articles})})
+            await prefetch_recent(sources=list(get_config().rss_feeds) + [HN_SOURCE])
+        except Exception as e:
+            metrics.record_error("daemon_errors_total", str(e))
+            print(f"Refresh failed: {e}", file=sys.stderr)
+        finally:
+            self.refreshing = False
+        
+        self.last_refresh = time.time()
+        self._broadcast({"event": "refreshed", "at": self.last_refresh,
+                         "failed": metrics.total("fetch_errors_total") - errors_before})
+        metrics.save()
+    
+    def _broadcast(self, event: Dict) -> None:
+        line = (json.dumps(event) + "\n").encode("utf-8")
+        for writer in list(self._watchers):
+            if writer.is_closing():
+                self._watchers.discard(writer)
+            else:
+                writer.write(line)
+    
+    def _articles(self, since: Optional[float], sources: Optional[List[str]]) -> List[Dict]:
+        """Return the window's articles, one per story, as dicts."""
+        from toadman.cache import article_to_dict, query_articles
+        from toadman.dedupe import collapse_duplicates
+        
+        key = (since, tuple(sources) if sources is not None else None)
+        if key not in self._served:
+            articles = query_articles(
+                since=datetime.fromtimestamp(since) if since is not None else None,
+                sources=sources,
+            )
+            self._served[key] = [article_to_dict(a) for a in collapse_duplicates(articles)]
+        return self._served[key]
+    
+    def status(self) -> Dict:
+        """Describe the daemon for `toadman daemon --status`."""
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.path),
+            "refreshing": self.refreshing,
+            "last_refresh": self.last_refresh,
+            "next_refresh": self.next_refresh,
+            "interval_minutes": self._interval_seconds() / 60,
+            "watchers": len(self._watchers),
+        }
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            async for line in reader:
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "articles":
+                        reply = {"articles": self._articles(request.get("since"), request.get("sources"))}
+                    elif op == "refresh":
+                        if request.get("force"):
+                            # Make every source due, as `r` does without a daemon
+                            from toadman.cache import clear_cache
+                            clear_cache()
+                        self._wake.set()
+                        reply = {"ok": True}
+                    elif op == "status":
+                        reply = self.status()
+                    elif op == "watch":
+                        self._watchers.add(writer)
+                        continue
+                    else:
+                        reply = {"error": f"unknown op {op!r}"}
+                except (ValueError, AttributeError, TypeError, OverflowError) as e:
+                    reply = {"error": f"bad request: {e}"}
+                writer.write((json.dumps(reply) + "\n").encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Shutting down; ending quietly keeps asyncio from logging every open connection
+            pass
+        finally:
+            self._watchers.discard(writer)
+            writer.close()
+
+def is_running(path: Path = SOCKET_PATH) -> bool:
+    """Return True if a daemon is accepting connections on path."""
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+async def _connect(path: Path) -> Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    try:
+        return await asyncio.wait_for(asyncio.open_unix_connection(str(path), limit=STREAM_LIMIT), CONNECT_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+async def request(op: str, path: Path = SOCKET_PATH, **params) -> Optional[Dict]:
+    """
+    Send one request to the daemon.
+    
+    Returns:
+        The daemon's reply, or None if no daemon is running (or it went away)
+    
+    Raises:
+        DaemonError: If the daemon rejected the request
+    """
+    connection = await _connect(path)
+    if connection is None:
+        return None
+    reader, writer = connection
+    try:
+        writer.write((json.dumps(dict(params, op=op)) + "\n").encode("utf-8"))
+        await writer.drain()
+        line = await reader.readline()
+        reply = json.loads(line) if line else None
+    except (OSError, asyncio.LimitOverrunError, ValueError):
+        return None
+    finally:
+        writer.close()
+    if not isinstance(reply, dict):
+        return None
+    if "error" in reply:
+        raise DaemonError(reply["error"])
+    return reply
+
+async def query_articles(since: Optional[datetime] = None, sources: Optional[List[str]] = None,
+                         path: Path = SOCKET_PATH) -> Optional[List[Article]]:
+    """
+    Ask the daemon for a window of articles, one per story, newest first.
+    
+    Args:
+        since: Only return articles published at or after this time (naive values are local time)
+        sources: Only return articles from these sources
+    
+    Returns:
+        The articles, or None if no daemon is running
+    """
+    from toadman.cache import article_from_dict
+    
+    reply = await request("articles", path, since=since.timestamp() if since else None, sources=sources)
+    if reply is None:
+        return None
+    return [article_from_dict(item) for item in reply["articles"]]
+
+async def watch(path: Path = SOCKET_PATH) -> AsyncIterator[Dict]:
+    """Yield the daemon's events until it goes away (nothing if it is not running)."""
+    connection = await _connect(path)
+    if connection is None:
+        return
+    reader, writer = connection
+    try:
+        writer.write(b'{"op": "watch"}\n')
+        await writer.drain()
+        async for line in reader:
+            yield json.loads(line)
+    except (OSError, ValueError):
+        pass
+    finally:
+        writer.close()
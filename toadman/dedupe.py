@@ -0,0 +1,198 @@
+import random
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+from toadman.models import Article
+from toadman.search import tokenize
+
+# Click and campaign IDs (besides utm_*) that never select content. Generic names
+# such as "ref" are kept: on GitHub and similar sites they pick a branch or page.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "mkt_tok",
+}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# MinHash signature layout: BANDS * ROWS hash functions, banded for locality-sensitive lookup
+BANDS = 8
+ROWS = 4
+
+# Candidate titles must share at least this fraction of their words to be merged
+MIN_TITLE_SIMILARITY = 0.6
+
+# Titles with fewer distinct words ("Weekly update") are too generic to cluster
+MIN_TITLE_TOKENS = 3
+
+# Words that carry no identity in a headline
+TITLE_STOPWORDS = {"a", "an", "and", "the", "of", "to", "in", "on", "for", "with", "is", "hn", "show", "ask"}
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(0x70AD)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(BANDS * ROWS)]
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so that links to the same page compare equal.
+    
+    Lowercases the scheme and host, drops default ports, fragments, utm_* and
+    known click-ID parameters, sorts the remaining query and removes a
+    trailing slash. Kept parameters are copied byte-for-byte, so "?q" and
+    "?q=" stay distinct. Anything that is not an http(s) URL is returned unchanged.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+    
+    host = parts.hostname.rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    
+    path = parts.path.rstrip("/") or "/"
+    query = "&".join(sorted(
+        param for param in parts.query.split("&")
+        if param and not _is_tracking(unquote_plus(param.partition("=")[0]).lower())
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+def _is_tracking(key: str) -> bool:
+    """Return whether a lowercased query parameter name only tracks the click."""
+    return key.startswith("utm_") or key in TRACKING_PARAMS
+
+@lru_cache(maxsize=16384)
+def url_key(url: str) -> str:
+    """Return a matching key for a URL that also ignores the scheme and a leading www."""
+    canonical = canonicalize_url(url)
+    _, _, rest = canonical.partition("://")
+    if rest.startswith("www."):
+        rest = rest[4:]
+    return rest or canonical
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    """Return the distinctive words of a headline."""
+    return frozenset(token for token in tokenize(title) if token not in TITLE_STOPWORDS)
+
+@lru_cache(maxsize=65536)
+def _token_hashes(token: str) -> Tuple[int, ...]:
+    """Return a token's value under every MinHash permutation (headline words repeat a lot)."""
+    h = hash(token) & _PRIME
+    return tuple((a * h + b) % _PRIME for a, b in _PERMUTATIONS)
+
+def minhash(tokens: Iterable[str]) -> Tuple[int, ...]:
+    """Compute a MinHash signature of a non-empty token set."""
+    return tuple(map(min, zip(*map(_token_hashes, tokens))))
+
+@lru_cache(maxsize=16384)
+def _title_bands(title: str) -> Tuple[FrozenSet[str], Tuple[Tuple[int, Tuple[int, ...]], ...]]:
+    """Return a title's tokens and MinHash bands (empty for titles too generic to cluster)."""
+    tokens = title_tokens(title)
+    if len(tokens) < MIN_TITLE_TOKENS:
+        return tokens, ()
+    signature = minhash(tokens)
+    return tokens, tuple((band, signature[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS))
+
+class DuplicateIndex:
+    """
+    Groups articles that are the same story.
+    
+    Articles match when their URLs agree after canonicalization, or when their
+    titles are near-duplicates and they come from different sources. Titles are
+    compared with MinHash signatures split into bands, so each lookup only
+    checks articles sharing at least one band rather than every article seen.
+    URL keys and title signatures are memoized, so re-collapsing a list that
+    mostly repeats earlier articles is cheap.
+    """
+    
+    def __init__(self):
+        self._by_url: Dict[str, Article] = {}
+        self._bands: Dict[Tuple[int, Tuple[int, ...]], List[Article]] = {}
+        self._tokens: Dict[int, FrozenSet[str]] = {}
+        self._sources: Dict[int, Set[str]] = {}
+    
+    def add(self, article: Article) -> Article:
+        """
+        Add an article, returning the representative of its group.
+        
+        A new story returns the article itself. A duplicate returns the article
+        first seen for that story, with the duplicate's sources added to its
+        other_sources.
+        """
+        key = url_key(article.url)
+        representative = self._by_url.get(key)
+        tokens, bands = _title_bands(article.title)
+        if representative is None and bands:
+            representative = self._similar_title(article, tokens, bands)
+        
+        if representative is None:
+            self._by_url[key] = article
+            self._tokens[id(article)] = tokens
+            self._sources[id(article)] = {article.source, *article.other_sources}
+            for band in bands:
+                self._bands.setdefault(band, []).append(article)
+            return article
+        
+        self._by_url.setdefault(key, representative)
+        sources = self._sources[id(representative)]
+        new_sources = [s for s in (article.source, *article.other_sources) if s not in sources]
+        if new_sources:
+            sources.update(new_sources)
+            representative.other_sources = representative.other_sources + tuple(new_sources)
+        return representative
+    
+    def _similar_title(self, article: Article, tokens: FrozenSet[str],
+                       bands: Tuple[Tuple[int, Tuple[int, ...]], ...]) -> Optional[Article]:
+        """Return an earlier article from another source whose title nearly matches."""
+        checked = set()
+        for band in bands:
+            for candidate in self._bands.get(band, ()):
+                if id(candidate) in checked:
+                    continue
+                checked.add(id(candidate))
+                if article.source in self._sources[id(candidate)]:
+                    continue
+                other = self._tokens[id(candidate)]
+                if len(tokens & other) / len(tokens | other) >= MIN_TITLE_SIMILARITY:
+                    return candidate
+        return None
+
+def collapse_duplicates(articles: Iterable[Article], window: Optional[int] = None) -> Iterator[Article]:
+    """
+    Yield one article per story, in input order.
+    
+    Later duplicates are not yielded; their sources are folded into the
+    other_sources of the article already yielded for the story, so callers
+    that collect the whole result see every source.
+    
+    The index keeps every story seen, so memory grows with the input. With
+    window, articles are collapsed window at a time instead, and each
+    window's articles are only yielded once it is complete, with all their
+    sources: memory stays bounded for long streams, but duplicates more than
+    window articles apart are both kept.
+    
+    Args:
+        articles: Articles in priority order (the first of each story is kept)
+        window: Collapse this many articles at a time (default: all of them)
+    
+    Yields:
+        The first article of each story
+    """
+    if window is not None:
+        iterator = iter(articles)
+        while True:
+            chunk = list(islice(iterator, window))
+            if not chunk:
+                return
+            yield from list(collapse_duplicates(chunk))
+    
+    index = DuplicateIndex()
+    for article in articles:
+        if index.add(article) is article:
+            yield article
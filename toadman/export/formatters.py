@@ -0,0 +1,142 @@
+import html
+import json
+from datetime import datetime
+from typing import Dict, Optional, Type
+from toadman.models import Article
+from toadman.cache import article_to_dict
+
+class Formatter:
+    """
+    Renders an export one piece at a time.
+    
+    Subclasses return strings for the document header, each article and the
+    footer, so the exporter can write them to an open file as they are produced.
+    """
+    
+    extension = "txt"
+    
+    def header(self, generated: datetime, total: Optional[int]) -> str:
+        """Text written at the start of a new export file."""
+        return ""
+    
+    def append_header(self, generated: datetime) -> str:
+        """Text written before articles appended to an existing export file."""
+        return ""
+    
+    def article(self, article: Article, summary: Optional[str]) -> str:
+        """Text for a single article."""
+        raise NotImplementedError
+    
+    def footer(self, count: int) -> str:
+        """Text written after the last article."""
+        return ""
+
+class MarkdownFormatter(Formatter):
+    extension = "md"
+    
+    def header(self, generated: datetime, total: Optional[int]) -> str:
+        content = f"""# Toadman News Export
+Generated: {generated.strftime("%Y-%m-%d %H:%M:%S")}
+
+"""
+        if total is not None:
+            content += f"""Total Articles: {total}
+
+"""
+        return content + """---
+
+"""
+    
+    def append_header(self, generated: datetime) -> str:
+        return f"""Appended: {generated.strftime("%Y-%m-%d %H:%M:%S")}
+
+---
+
+"""
+    
+    def article(self, article: Article, summary: Optional[str]) -> str:
+        content = f"""## {article.title}
+
+**Source:** {", ".join((article.source,) + article.other_sources)}  
+**Category:** {article.category}  
+**Published:** {article.published_date or 'Unknown'}  
+**URL:** [{article.url}]({article.url})
+
+"""
+        
+        # Add summary if available
+        if summary:
+            content += f"""### AI Summary
+
+{summary}
+
+"""
+        
+        # Add original content
+        return content + f"""### Content
+
+{article.content_snippet}
+
+---
+
+"""
+
+class JsonlFormatter(Formatter):
+    extension = "jsonl"
+    
+    def article(self, article: Article, summary: Optional[str]) -> str:
+        return json.dumps(dict(article_to_dict(article), summary=summary), ensure_ascii=False) + "\n"
+
+class HtmlFormatter(Formatter):
+    """HTML export; closing </body></html> tags are omitted (optional in HTML5) so files can be appended to."""
+    
+    extension = "html"
+    
+    def header(self, generated: datetime, total: Optional[int]) -> str:
+        content = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Toadman News Export</title>
+</head>
+<body>
+<h1>Toadman News Export</h1>
+<p>Generated: {generated.strftime("%Y-%m-%d %H:%M:%S")}</p>
+"""
+        if total is not None:
+            content += f"<p>Total Articles: {total}</p>\n"
+        return content + "<hr>\n"
+    
+    def append_header(self, generated: datetime) -> str:
+        return f"""<p>Appended: {generated.strftime("%Y-%m-%d %H:%M:%S")}</p>
+<hr>
+"""
+    
+    def article(self, article: Article, summary: Optional[str]) -> str:
+        url = html.escape(article.url)
+        content = f"""<article>
+<h2>{html.escape(article.title)}</h2>
+<p><strong>Source:</strong> {html.escape(", ".join((article.source,) + article.other_sources))}<br>
+<strong>Category:</strong> {html.escape(article.category)}<br>
+<strong>Published:</strong> {html.escape(str(article.published_date or 'Unknown'))}<br>
+<strong>URL:</strong> <a href="{url}">{url}</a></p>
+"""
+        if summary:
+            content += f"""<h3>AI Summary</h3>
+<pre>{html.escape(summary)}</pre>
+"""
+        return content + f"""<h3>Content</h3>
+<p>{html.escape(article.content_snippet)}</p>
+</article>
+<hr>
+"""
+
+FORMATTERS: Dict[str, Type[Formatter]] = {
+    "markdown": MarkdownFormatter,
+    "jsonl": JsonlFormatter,
+    "html": HtmlFormatter,
+}
+
+def register_formatter(name: str, formatter: Type[Formatter]) -> None:
+    """Make a formatter available to export_articles under the given name."""
+    FORMATTERS[name] = formatter
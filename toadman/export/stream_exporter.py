@@ -0,0 +1,90 @@
+from itertools import islice
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+from toadman.models import Article
+from toadman.cache import get_summaries, exported_urls, forget_exported, mark_exported
+from toadman.summarizer.backends import get_backend
+from toadman.export.formatters import FORMATTERS
+
+EXPORT_DIR = Path.home() / ".toadman" / "exports"
+CHUNK_SIZE = 500
+
+def _chunks(articles: Iterable[Article], size: int) -> Iterator[List[Article]]:
+    iterator = iter(articles)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def export_articles(articles: Iterable[Article], summaries: Optional[Dict[str, str]] = None,
+                    fmt: str = "markdown", path: Optional[Path] = None,
+                    append_new: bool = False) -> Path:
+    """
+    Stream articles and their summaries to an export file.
+    
+    Articles are consumed lazily and written in chunks, so memory use does not
+    grow with the size of the export.
+    
+    Args:
+        articles: Articles to export (any iterable, e.g. cache.iter_articles())
+        summaries: Optional dict mapping article URLs to their summaries; articles
+            without an entry fall back to the on-disk summary cache
+        fmt: Name of a registered formatter ("markdown", "jsonl" or "html")
+        path: Output file (defaults to a timestamped file in ~/.toadman/exports,
+            or a fixed per-format file when append_new is set)
+        append_new: Append only articles not already exported to this file
+    
+    Returns:
+        Path to the export file
+    """
+    if fmt not in FORMATTERS:
+        raise ValueError(f"Unknown export format '{fmt}' (choose from {', '.join(FORMATTERS)})")
+    formatter = FORMATTERS[fmt]()
+    summaries = summaries or {}
+    
+    now = datetime.now()
+    if path is None:
+        EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+        if append_new:
+            path = EXPORT_DIR / f"toadman_export.{formatter.extension}"
+        else:
+            path = EXPORT_DIR / f"toadman_export_{now.strftime('%Y%m%d_%H%M%S')}.{formatter.extension}"
+    target = str(path.resolve())
+    
+    appending = append_new and path.exists()
+    if append_new and not appending:
+        # The file is gone, so everything recorded as exported to it has to be written again
+        forget_exported(target)
+    total = len(articles) if not append_new and hasattr(articles, "__len__") else None
+    
+    count = 0
+    with open(path, "a" if appending else "w", encoding='utf-8') as f:
+        if not appending:
+            f.write(formatter.header(now, total))
+        
+        for chunk in _chunks(articles, CHUNK_SIZE):
+            if append_new:
+                seen = exported_urls(target, [a.url for a in chunk])
+                chunk = [a for a in chunk if a.url not in seen]
+            
+            # Fill in summaries from the persistent cache
+            missing = [a for a in chunk if a.url not in summaries]
+            keys = {key: a.url for key, a in zip(get_backend().summary_keys(missing), missing)}
+            cached = {keys[key]: summary for key, summary in get_summaries(list(keys)).items()}
+            
+            # An append run that finds nothing new leaves the file as it was
+            if appending and chunk and not count:
+                f.write(formatter.append_header(now))
+            for article in chunk:
+                f.write(formatter.article(article, summaries.get(article.url) or cached.get(article.url)))
+            count += len(chunk)
+            
+            if append_new:
+                mark_exported(target, [a.url for a in chunk])
+        
+        if count or not appending:
+            f.write(formatter.footer(count))
+    
+    return path
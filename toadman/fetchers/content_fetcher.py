@@ -0,0 +1,200 @@
+import asyncio
+import re
+import time
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from toadman.models import Article
+from toadman.config import get_config
+from toadman import metrics
+from toadman.cache import attempted_bodies, iter_articles, put_bodies
+
+# Elements whose text is never part of an article
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "iframe", "nav", "header", "footer",
+    "aside", "form", "button", "select", "figure",
+}
+
+# Elements whose text forms a paragraph of the extracted text
+BLOCK_TAGS = {"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "pre", "blockquote", "td", "dd"}
+
+# Shorter blocks outside headings are usually bylines, share links and other chrome
+MIN_BLOCK_CHARS = 25
+
+# Links whose page is a discussion rather than an article
+SKIP_HOSTS = {"news.ycombinator.com"}
+
+_SPACE = re.compile(r"\s+")
+
+class _TextExtractor(HTMLParser):
+    """Collects paragraph text, noting which paragraphs sit inside <article> or <main>."""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[Tuple[str, bool, bool]] = []  # (text, is_heading, in_main)
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._block: Optional[List[str]] = None
+        self._block_tag = ""
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in ("article", "main"):
+            self._main_depth += 1
+        elif tag in BLOCK_TAGS and self._skip_depth == 0:
+            self._flush()
+            self._block = []
+            self._block_tag = tag
+        elif tag == "br" and self._block is not None:
+            self._block.append("\n")
+    
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in ("article", "main"):
+            self._flush()
+            self._main_depth = max(0, self._main_depth - 1)
+        elif tag == self._block_tag:
+            self._flush()
+    
+    def handle_data(self, data):
+        if self._skip_depth == 0 and self._block is not None:
+            self._block.append(data)
+    
+    def _flush(self):
+        if self._block:
+            text = _SPACE.sub(" ", "".join(self._block)).strip()
+            if text:
+                self.blocks.append((text, self._block_tag[0] == "h", self._main_depth > 0))
+        self._block = None
+        self._block_tag = ""
+    
+    def close(self):
+        super().close()
+        self._flush()
+
+def extract_text(html: str) -> str:
+    """
+    Extract the main text of an HTML page.
+    
+    Paragraphs, headings and list items outside navigation, headers, footers,
+    scripts and forms are kept; if the page marks up an <article> or <main>
+    element, only the text inside it is used.
+    
+    Args:
+        html: The page's HTML
+    
+    Returns:
+        The text, one paragraph per line pair (empty if nothing looked like content)
+    """
+    parser = _TextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        # Whatever was collected before the markup broke is still useful
+        pass
+    
+    blocks = parser.blocks
+    if any(in_main for _, _, in_main in blocks):
+        blocks = [block for block in blocks if block[2]]
+    return "\n\n".join(text for text, heading, _ in blocks if heading or len(text) >= MIN_BLOCK_CHARS)
+
+async def _fetch_text(client, url: str, max_bytes: int) -> str:
+    """Download at most max_bytes of an HTML page and extract its text ("" for non-HTML pages)."""
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        if "html" not in response.headers.get("Content-Type", "html"):
+            return ""
+        
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                # A truncated page still parses; its opening is where the article is
+                break
+        encoding = response.charset_encoding or "utf-8"
+    
+    html = b"".join(chunks)[:max_bytes].decode(encoding, errors="replace")
+    # Parsing a large page takes a while; keep the event loop (and the TUI) responsive
+    return await asyncio.to_thread(extract_text, html)
+
+def _wanted(article: Article) -> bool:
+    parts = urlsplit(article.url)
+    return parts.scheme in ("http", "https") and parts.hostname not in SKIP_HOSTS
+
+async def prefetch_bodies(articles: List[Article]) -> int:
+    """
+    Fetch and store the full text of articles whose page has not been fetched yet.
+    
+    Pages are fetched concurrently, at most fetch.max_concurrency at a time and
+    content.per_host per host, reading at most content.max_page_kb of each.
+    Pages that fail or have no text are remembered, so they are not retried
+    until cache.BODY_RETRY_SECONDS have passed.
+    
+    Args:
+        articles: Articles whose pages to fetch
+    
+    Returns:
+        The number of articles whose text was stored
+    """
+    import httpx
+    
+    config = get_config()
+    urls = list(dict.fromkeys(a.url for a in articles if _wanted(a)))
+    tried = attempted_bodies(urls)
+    urls = [url for url in urls if url not in tried]
+    if not urls:
+        return 0
+    
+    max_bytes = int(config.content_max_page_kb * 1024)
+    limiter = asyncio.Semaphore(config.fetch_max_concurrency)
+    host_limiters: Dict[str, asyncio.Semaphore] = {}
+    bodies: Dict[str, str] = {}
+    
+    async def fetch(url: str) -> None:
+        host = urlsplit(url).hostname
+        host_limiter = host_limiters.setdefault(host, asyncio.Semaphore(config.content_per_host))
+        async with host_limiter, limiter:
+            started = time.perf_counter()
+            try:
+                text = await asyncio.wait_for(_fetch_text(client, url, max_bytes), config.fetch_source_timeout)
+            except Exception:
+                # Paywalls, bot blocks and dead links are routine here; count them rather than report each
+                metrics.incr("content_fetch_errors_total", host=host)
+                text = ""
+            metrics.observe("content_fetch", time.perf_counter() - started)
+        bodies[url] = text
+    
+    limits = httpx.Limits(max_connections=config.fetch_max_concurrency)
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; toadman)"}
+    async with httpx.AsyncClient(limits=limits, headers=headers, timeout=config.fetch_source_timeout,
+                                 follow_redirects=True) as client:
+        await asyncio.gather(*(fetch(url) for url in urls))
+    
+    put_bodies(bodies, max_bytes=int(config.content_store_max_mb * 1024 * 1024))
+    stored = sum(1 for text in bodies.values() if text)
+    metrics.incr("content_bodies_stored_total", stored)
+    return stored
+
+async def prefetch_recent(sources: Optional[List[str]] = None, count: Optional[int] = None) -> int:
+    """
+    Prefetch the full text of the newest stored articles, if enabled in config.
+    
+    Args:
+        sources: Only consider articles from these sources
+        count: Number of newest articles to cover (defaults to content.prefetch_count)
+    
+    Returns:
+        The number of articles whose text was stored
+    """
+    config = get_config()
+    if not config.content_enabled:
+        return 0
+    if count is None:
+        count = config.content_prefetch_count
+    return await prefetch_bodies(list(islice(iter_articles(sources=sources), count)))
@@ -0,0 +1,346 @@
+import asyncio
+import sys
+import time
+import httpx
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from toadman.models import Article
+from toadman.cache import (
+    article_to_dict,
+    article_from_dict,
+    load_feed_validators,
+    save_feed_validators,
+    load_hn_cursors,
+    save_hn_cursors,
+    load_hn_backfill,
+    save_hn_backfill,
+    mark_sources_fetched,
+    record_batch_hits,
+    save_cache,
+)
+from toadman.config import get_config
+from toadman import metrics
+from toadman.fetchers.feed_parser import parse_feed_async
+from toadman.fetchers.hn_fetcher import (
+    HN_SEARCH_API,
+    HN_SOURCE,
+    backfill_gaps,
+    batch_name,
+    batch_since,
+    dedupe_by_url,
+    drop_stored,
+    gap_before,
+    keyword_batches,
+    matching_hits,
+    parse_hits,
+    report_truncated,
+    search_params,
+    select_new_hits,
+)
+from toadman.fetchers.scheduler import due_sources, reschedule
+from toadman.dedupe import collapse_duplicates
+
+async def _read_capped(client: httpx.AsyncClient, url: str, headers: Dict[str, str],
+                       max_bytes: int) -> Tuple[httpx.Response, bytes]:
+    """GET a URL, reading at most max_bytes of the body (nothing for a 304)."""
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return response, b""
+        response.raise_for_status()
+        
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                print(f"Feed {url} is larger than {max_bytes} bytes; reading only the start", file=sys.stderr)
+                break
+        return response, b"".join(chunks)[:max_bytes]
+
+async def _fetch_rss_source(client: httpx.AsyncClient, limiter: asyncio.Semaphore,
+                            source: str, url: str, timeout: float,
+                            validator: Optional[Dict], max_entries: int = 10,
+                            max_bytes: int = 5 * 1024 * 1024,
+                            parse_workers: int = 2) -> Tuple[List[Article], Dict]:
+    """
+    Download and parse a single RSS feed using a conditional GET.
+    
+    At most max_bytes of the response are read, and only the first max_entries
+    entries are parsed (in a worker process for large feeds).
+    
+    Returns the feed's articles and the validator entry to persist for it.
+    """
+    headers = {}
+    if validator:
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+    
+    async with limiter:
+        # Time from when the request is sent, so waiting for a free slot does not count
+        started = time.perf_counter()
+        response, content = await asyncio.wait_for(_read_capped(client, url, headers, max_bytes), timeout)
+    if response.status_code == 304:
+        if validator:
+            metrics.incr("fetch_not_modified_total", source=source)
+            metrics.observe("fetch_source", time.perf_counter() - started, source=source)
+            return [article_from_dict(item) for item in validator["articles"]], validator
+        response.raise_for_status()
+    
+    metrics.incr("fetch_bytes_total", len(content), source=source)
+    articles = await parse_feed_async(source, content, max_entries, parse_workers)
+    metrics.observe("fetch_source", time.perf_counter() - started, source=source)
+    return articles, {
+        "source": source,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "articles": [article_to_dict(a) for a in articles],
+    }
+
+async def _fetch_hn_batch(client: httpx.AsyncClient, limiter: asyncio.Semaphore,
+                          name: str, keywords: Tuple[str, ...], cursors: Dict[str, int],
+                          gaps: List[List[int]], timeout: float, hits: int = 5, max_pages: int = 3,
+                          lookback_days: float = 7) -> Tuple[List[Article], Dict[str, int], List[List[int]]]:
+    """
+    Query the Algolia HN search API for stories new to any of several keywords.
+    
+    Up to max_pages pages are fetched in all, newest first, and every page
+    must arrive within timeout of the first request. Pages the search for new
+    stories leaves over page back through gaps, the stories earlier truncated
+    searches skipped (see hn_fetcher.backfill_gaps); a truncated search adds
+    its own gap.
+    
+    Returns:
+        The new stories, leaving out those already stored, the advanced cursors
+        of the keywords that found any, and the batch's remaining gaps
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None
+    pages_left = max_pages
+    
+    async def search(after: int, before: Optional[int] = None) -> Tuple[List[Dict], bool]:
+        """Fetch pages of one search while pages are left; returns its hits and whether it was exhausted."""
+        nonlocal deadline, pages_left
+        found = []
+        page = 0
+        while pages_left:
+            async with limiter:
+                # The deadline starts with the first request, so waiting for a free slot does not count
+                if deadline is None:
+                    deadline = loop.time() + timeout
+                response = await asyncio.wait_for(
+                    client.get(HN_SEARCH_API, params=search_params(keywords, after, hits, page, before)),
+                    max(0.0, deadline - loop.time()),
+                )
+                response.raise_for_status()
+            pages_left -= 1
+            data = response.json()
+            found.extend(data.get("hits", []))
+            page += 1
+            if page >= data.get("nbPages", 0):
+                return found, True
+        return found, False
+    
+    started = time.perf_counter()
+    since = batch_since(keywords, cursors, lookback_days)
+    found, complete = await search(since)
+    new_hits, advanced = select_new_hits(found, keywords, cursors, since)
+    gaps = backfill_gaps(gaps, lookback_days)
+    if not complete:
+        report_truncated(name, max_pages)
+        gaps.insert(0, [since, gap_before(found)])
+    
+    while gaps and pages_left:
+        after, before = gaps[0]
+        found, complete = await search(after, before)
+        new_hits.extend(matching_hits(found, keywords))
+        if complete:
+            gaps.pop(0)
+        else:
+            gaps[0] = [after, gap_before(found, before)]
+    
+    # Stories already stored still tell the scheduler how busy this batch is
+    record_batch_hits(name, [(hit["objectID"], hit["created_at_i"]) for hit in new_hits
+                             if hit.get("objectID") and hit.get("created_at_i")])
+    metrics.observe("fetch_source", time.perf_counter() - started, source=name)
+    return drop_stored(dedupe_by_url(parse_hits({"hits": new_hits}))), advanced, gaps
+
+async def iter_source_articles(max_concurrency: Optional[int] = None,
+                               source_timeout: Optional[float] = None,
+                               due_only: bool = False) -> AsyncIterator[List[Article]]:
+    """
+    Fetch every RSS feed and HN keyword concurrently, yielding each source's articles as it completes.
+    
+    Hacker News is fetched incrementally: each search (of up to
+    keywords_per_request keywords) only asks for stories created since the
+    keywords' last fetch, so HN contributes only new stories.
+    
+    Every fetch reschedules its source (see scheduler): successful sources
+    next fall due after an interval learned from their publication rate,
+    failing ones after an exponential, jittered backoff.
+    
+    Args:
+        max_concurrency: Maximum number of in-flight requests (defaults to config)
+        source_timeout: Deadline in seconds for each individual source (defaults to config)
+        due_only: Skip sources whose next fetch is not due yet
+    
+    Yields:
+        The articles of one feed or HN search; failed sources are reported, counted
+        in metrics as fetch_errors_total and skipped
+    """
+    # Snapshot the config so a reload mid-fetch cannot mix old and new settings
+    config = get_config()
+    if max_concurrency is None:
+        max_concurrency = config.fetch_max_concurrency
+    if source_timeout is None:
+        source_timeout = config.fetch_source_timeout
+    
+    rss_feeds = config.rss_feeds
+    hn_batches = [
+        (batch_name(batch), batch)
+        for batch in keyword_batches(list(config.hn_keywords), config.hn_keywords_per_request)
+    ]
+    if due_only:
+        due = set(due_sources(config))
+        skipped = len(rss_feeds) + len(hn_batches) - len(due)
+        rss_feeds = {source: url for source, url in rss_feeds.items() if source in due}
+        hn_batches = [(name, batch) for name, batch in hn_batches if name in due]
+        if skipped:
+            metrics.incr("fetch_skipped_total", skipped)
+    
+    validators = load_feed_validators()
+    validators_changed = False
+    cursors = load_hn_cursors()
+    cursors_changed = False
+    backfill = load_hn_backfill()
+    backfill_changed = False
+    outcomes: Dict[str, bool] = {}
+    
+    async def run_rss(source: str, url: str) -> List[Article]:
+        nonlocal validators_changed
+        # Only trust validators recorded for the same source name at this URL
+        validator = validators.get(url)
+        if validator and validator.get("source") != source:
+            validator = None
+        
+        articles, new_validator = await _fetch_rss_source(
+            client, limiter, source, url, source_timeout, validator,
+            max_entries=config.fetch_max_entries,
+            max_bytes=int(config.fetch_max_feed_mb * 1024 * 1024),
+            parse_workers=config.fetch_parse_workers,
+        )
+        if new_validator is not validator:
+            validators[url] = new_validator
+            validators_changed = True
+        return articles
+    
+    async def run_hn(name: str, batch: Tuple[str, ...]) -> List[Article]:
+        nonlocal cursors_changed, backfill_changed
+        articles, advanced, gaps = await _fetch_hn_batch(
+            client, limiter, name, batch, cursors, backfill.get(name, []), source_timeout,
+            hits=config.hn_hits_per_keyword,
+            max_pages=config.hn_max_pages,
+            lookback_days=config.hn_lookback_days,
+        )
+        if advanced:
+            cursors.update(advanced)
+            cursors_changed = True
+        if gaps != backfill.get(name, []):
+            backfill[name] = gaps
+            backfill_changed = True
+        # Nothing new is still a successful fetch, so keep HN from looking stale
+        mark_sources_fetched([HN_SOURCE])
+        return articles
+    
+    async def run(name: str, coro) -> Tuple[str, Optional[List[Article]]]:
+        try:
+            articles = await coro
+            metrics.incr("fetch_articles_total", len(articles), source=name)
+            outcomes[name] = True
+            return name, articles
+        except asyncio.TimeoutError:
+            error = f"timed out after {source_timeout}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        print(f"Error fetching {name}: {error}", file=sys.stderr)
+        metrics.record_error("fetch_errors_total", error, source=name)
+        outcomes[name] = False
+        return name, None
+    
+    limiter = asyncio.Semaphore(max_concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+    
+    started = time.perf_counter()
+    async with httpx.AsyncClient(limits=limits, timeout=source_timeout, follow_redirects=True) as client:
+        tasks = [
+            asyncio.ensure_future(run(source, run_rss(source, url)))
+            for source, url in rss_feeds.items()
+        ] + [
+            asyncio.ensure_future(run(name, run_hn(name, batch)))
+            for name, batch in hn_batches
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, articles = await next_done
+                if articles is not None:
+                    yield articles
+        finally:
+            for task in tasks:
+                task.cancel()
+            if validators_changed:
+                save_feed_validators(validators)
+            if cursors_changed:
+                save_hn_cursors(cursors)
+            if backfill_changed:
+                # Gaps of batches no longer configured would never be fetched
+                batches = {batch_name(batch) for batch in keyword_batches(list(config.hn_keywords),
+                                                                          config.hn_keywords_per_request)}
+                save_hn_backfill({name: gaps for name, gaps in backfill.items() if gaps and name in batches})
+            # By now the caller has stored every yielded source, so rates include the new articles
+            reschedule(outcomes, config)
+            metrics.observe("fetch_all", time.perf_counter() - started)
+
+async def fetch_all_articles_async(max_concurrency: Optional[int] = None,
+                                   source_timeout: Optional[float] = None) -> List[Article]:
+    """
+    Fetch articles from every RSS feed and HN keyword concurrently, saving each source's to the store.
+    
+    Sources are saved as they arrive, as the TUI and `toadman fetch` do: HN
+    cursors advance past what was fetched, and schedules learn from the
+    stored articles.
+    
+    Args:
+        max_concurrency: Maximum number of in-flight requests (defaults to config)
+        source_timeout: Deadline in seconds for each individual source (defaults to config)
+    
+    Returns:
+        RSS articles followed by new HN articles, one per story (see collapse_duplicates)
+    """
+    rss_articles = []
+    hn_articles = []
+    async for articles in iter_source_articles(max_concurrency, source_timeout):
+        save_cache(articles)
+        for article in articles:
+            if article.source == HN_SOURCE:
+                hn_articles.append(article)
+            else:
+                rss_articles.append(article)
+    
+    # RSS first, so a feed's own copy of a story represents it rather than an HN link
+    return list(collapse_duplicates(rss_articles + hn_articles))
+
+def fetch_all_articles(max_concurrency: Optional[int] = None,
+                       source_timeout: Optional[float] = None) -> List[Article]:
+    """Synchronous wrapper around fetch_all_articles_async for non-async callers."""
+    return asyncio.run(fetch_all_articles_async(max_concurrency, source_timeout))
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    articles = fetch_all_articles()
+    elapsed = time.perf_counter() - start
+    print(f"Fetched {len(articles)} articles in {elapsed:.2f}s")
+    for article in articles[:5]:
+        print(f"\n{article.source}")
+        print(f"  {article.title}")
+        print(f"  {article.url}")
@@ -0,0 +1,152 @@
+import asyncio
+import feedparser
+import multiprocessing
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from toadman.models import Article
+from toadman.dedupe import canonicalize_url
+from toadman.fetchers.rss_fetcher import _categorize, parse_feed_entries
+
+# Bytes handed to the XML parser at a time, so parsing stops soon after the last wanted entry
+PARSE_CHUNK_SIZE = 16 * 1024
+
+# Feeds smaller than this are parsed in-process; shipping them to a worker costs more than parsing
+INLINE_PARSE_BYTES = 64 * 1024
+
+_FEED_ROOTS = {"rss", "feed", "RDF"}
+_ENTRY_TAGS = {"item", "entry"}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 or ISO 8601 feed date into a naive UTC datetime, as feedparser does."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _entry_fields(entry: ET.Element) -> Dict[str, str]:
+    """Collect the text of an RSS item or Atom entry's children by local name."""
+    fields: Dict[str, str] = {}
+    for child in entry:
+        name = _local_name(child.tag)
+        if name == "link" and child.get("href") is not None:
+            # Atom links carry the URL in href; prefer the alternate (or unlabelled) one
+            if child.get("rel", "alternate") == "alternate" or "link" not in fields:
+                fields["link"] = child.get("href")
+        elif name == "guid" and child.get("isPermaLink", "true") == "false":
+            continue
+        elif name not in fields:
+            fields[name] = "".join(child.itertext()).strip()
+    return fields
+
+def _article_from_fields(source: str, fields: Dict[str, str]) -> Article:
+    title = fields.get("title") or "No title"
+    content = (fields.get("description") or fields.get("summary")
+               or fields.get("encoded") or fields.get("content") or "")
+    published = None
+    for name in ("pubDate", "published", "updated", "date"):
+        if fields.get(name):
+            published = _parse_date(fields[name])
+            break
+    return Article(
+        title=title,
+        url=canonicalize_url(fields.get("link") or fields.get("guid") or ""),
+        published_date=published,
+        source=source,
+        content_snippet=content[:300],
+        category=_categorize(source, fields.get("title", "")),
+    )
+
+def _iterparse_entries(source: str, content: bytes, max_entries: int) -> Optional[List[Article]]:
+    """
+    Incrementally parse an RSS or Atom document, stopping after max_entries entries.
+    
+    Returns None if the document is not a feed this parser understands (or is
+    malformed before any entry was read), so the caller can fall back to feedparser.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    articles: List[Article] = []
+    root_checked = False
+    try:
+        for offset in range(0, len(content), PARSE_CHUNK_SIZE):
+            parser.feed(content[offset:offset + PARSE_CHUNK_SIZE])
+            for event, element in parser.read_events():
+                if not root_checked:
+                    if _local_name(element.tag) not in _FEED_ROOTS:
+                        return None
+                    root_checked = True
+                if event == "end" and _local_name(element.tag) in _ENTRY_TAGS:
+                    articles.append(_article_from_fields(source, _entry_fields(element)))
+                    # Entries are done with once converted; drop their subtree
+                    element.clear()
+                    if len(articles) >= max_entries:
+                        return articles
+        parser.close()
+    except ET.ParseError:
+        # A truncated or sloppy document still yields the entries read before the error
+        return articles or None
+    return articles if root_checked else None
+
+def parse_feed(source: str, content: bytes, max_entries: int = 10) -> List[Article]:
+    """
+    Parse a feed document into at most max_entries articles.
+    
+    RSS and Atom documents are parsed incrementally and parsing stops once
+    enough entries have been read; anything else goes through feedparser.
+    
+    Args:
+        source: Source name to attach to the articles
+        content: Raw feed bytes
+        max_entries: Number of leading entries to keep
+    
+    Returns:
+        The feed's first max_entries articles
+    """
+    articles = _iterparse_entries(source, content, max_entries)
+    if articles is None:
+        articles = parse_feed_entries(source, feedparser.parse(content), max_entries)
+    return articles
+
+def _parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared parser process pool, starting it on first use."""
+    global _pool
+    if _pool is None:
+        # Spawned (not forked) workers are safe next to the TUI's threads
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+async def parse_feed_async(source: str, content: bytes, max_entries: int = 10,
+                           workers: int = 2) -> List[Article]:
+    """
+    Parse a feed without tying up the event loop (and the GIL) on large documents.
+    
+    Documents of INLINE_PARSE_BYTES or more are parsed in a pool of worker
+    processes; smaller ones, or any when workers is 0, are parsed in-process.
+    """
+    global _pool
+    if workers <= 0 or len(content) < INLINE_PARSE_BYTES:
+        return parse_feed(source, content, max_entries)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_parse_pool(workers), parse_feed, source, content, max_entries)
+    except BrokenProcessPool:
+        # A worker died (or could not start); parse here and start a fresh pool next time
+        _pool = None
+        return parse_feed(source, content, max_entries)
@@ -1,60 +1,191 @@
-import httpx
+import sys
+import time
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from toadman.models import Article
-from toadman.config import get_hn_keywords
+from toadman import metrics
+from toadman.dedupe import canonicalize_url, url_key
+from toadman.cache import stored_urls
 
-HN_SEARCH_API = "https://hn.algolia.com/api/v1/search"
+# Newest stories first, so pages cut short by max_pages only ever miss the oldest
+HN_SEARCH_API = "https://hn.algolia.com/api/v1/search_by_date"
+HN_SOURCE = "Hacker News"
 
-def fetch_hn_articles() -> List[Article]:
-    """Fetch articles from Hacker News using Algolia search API."""
+# Algolia indexes stories a little after they are created, so windows reach this far behind the cursor
+CURSOR_OVERLAP_SECONDS = 600
+
+# Algolia never returns more than this many hits for one search
+MAX_HITS_PER_PAGE = 1000
+
+def keyword_batches(keywords: List[str], per_request: int) -> List[Tuple[str, ...]]:
+    """
+    Split keywords into groups searched together in one request.
+    
+    Single words are grouped, per_request at a time. Multi-word keywords are
+    searched on their own, as phrases: in a group every word is optional, so
+    "Claude Code" would match any story mentioning "code".
+    """
+    words = [k for k in keywords if len(k.split()) == 1]
+    phrases = [(k,) for k in keywords if len(k.split()) > 1]
+    return [tuple(words[i:i + per_request]) for i in range(0, len(words), per_request)] + phrases
+
+def batch_name(keywords: Tuple[str, ...]) -> str:
+    """Name a keyword batch as a source, for logs, metrics and the refresh schedule."""
+    return f"HN {', '.join(repr(k) for k in keywords)}"
+
+def batch_since(keywords: Tuple[str, ...], cursors: Dict[str, int], lookback_days: float,
+                now: Optional[float] = None) -> int:
+    """
+    Return the created_at_i a search for keywords should start after.
+    
+    A keyword with a cursor starts CURSOR_OVERLAP_SECONDS before its newest
+    story seen; one without starts lookback_days ago. A batch starts at the
+    earliest of its keywords.
+    """
+    first_fetch = int((now or time.time()) - lookback_days * 86400)
+    return min(cursors[k] - CURSOR_OVERLAP_SECONDS if k in cursors else first_fetch for k in keywords)
+
+def search_params(keywords: Tuple[str, ...], since: int, hits_per_keyword: int, page: int = 0,
+                  before: Optional[int] = None) -> Dict:
+    """
+    Build Algolia search parameters for stories matching any of keywords created after since.
+    
+    With before, only stories created before it are asked for (see backfill_gaps).
+    A batch of single words makes every word optional, so a story matching
+    one keyword matches the batch; select_new_hits then keeps only hits that
+    actually contain a keyword. A multi-word keyword (always searched alone,
+    see keyword_batches) is searched as an exact phrase.
+    """
+    numeric = f"created_at_i>{since}"
+    if before is not None:
+        numeric += f",created_at_i<{before}"
+    params = {
+        "tags": "story",
+        "numericFilters": numeric,
+        "hitsPerPage": min(hits_per_keyword * len(keywords), MAX_HITS_PER_PAGE),
+        "page": page,
+    }
+    if len(keywords) == 1 and len(keywords[0].split()) > 1:
+        params["query"] = f'"{keywords[0]}"'
+        params["advancedSyntax"] = "true"
+    else:
+        params["query"] = " ".join(keywords)
+        if len(keywords) > 1:
+            params["optionalWords"] = params["query"]
+    return params
+
+def _matches(hit: Dict, keyword: str) -> bool:
+    text = " ".join(hit.get(field) or "" for field in ("title", "url", "story_text")).lower()
+    return keyword.lower() in text
+
+def matching_hits(hits: List[Dict], keywords: Tuple[str, ...]) -> List[Dict]:
+    """Keep the hits that contain at least one of keywords (every hit, for a single keyword)."""
+    if len(keywords) == 1:
+        return list(hits)
+    return [hit for hit in hits if any(_matches(hit, k) for k in keywords)]
+
+def select_new_hits(hits: List[Dict], keywords: Tuple[str, ...], cursors: Dict[str, int],
+                    since: int) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Keep the hits that are new for at least one keyword and advance the keywords' cursors.
+    
+    With a single keyword every hit counts for it; with several, a hit counts
+    for the keywords it contains.
+    
+    Args:
+        hits: Algolia hits from every page of one search
+        keywords: The keywords searched together
+        cursors: Newest created_at_i seen per keyword so far
+        since: The created_at_i the search started after
+    
+    Returns:
+        The new hits, and the updated cursors of keywords that found any
+    """
+    selected = []
+    advanced: Dict[str, int] = {}
+    for hit in hits:
+        created = hit.get("created_at_i") or 0
+        new_for = [
+            k for k in keywords
+            if created > cursors.get(k, since) - CURSOR_OVERLAP_SECONDS
+            and (len(keywords) == 1 or _matches(hit, k))
+        ]
+        if not new_for:
+            continue
+        selected.append(hit)
+        for k in new_for:
+            advanced[k] = max(advanced.get(k, cursors.get(k, 0)), created)
+    return selected, advanced
+
+def gap_before(hits: List[Dict], before: Optional[int] = None) -> int:
+    """
+    Return the created_at_i bound below which a truncated search still has stories to fetch.
+    
+    That is just past its oldest hit, so stories created in the same second
+    are not skipped (the one already fetched is dropped as stored).
+    """
+    return min((hit.get("created_at_i") or 0 for hit in hits), default=before or 0) + 1
+
+def backfill_gaps(gaps: List[List[int]], lookback_days: float, now: Optional[float] = None) -> List[List[int]]:
+    """
+    Trim a batch's backfill gaps to the lookback window, dropping those left empty.
+    
+    A search truncated by max_pages only fetches the newest stories after its
+    start, so the rest, created in [after, before), is recorded as a gap and
+    fetched by later searches with the pages they have left.
+    """
+    first_fetch = int((now or time.time()) - lookback_days * 86400)
+    trimmed = [[max(after, first_fetch), before] for after, before in gaps]
+    return [[after, before] for after, before in trimmed if before > after + 1]
+
+def report_truncated(name: str, max_pages: int) -> None:
+    """Warn that a search had more new stories than max_pages pages could hold."""
+    print(f"{name} has more than {max_pages} pages of new stories; the older ones are fetched by "
+          f"the next refreshes (raise hacker_news.max_pages to fetch them sooner)", file=sys.stderr)
+    metrics.incr("hn_truncated_total", source=name)
+
+def parse_hits(data: Dict) -> List[Article]:
+    """Build articles from an Algolia search response."""
     articles = []
-    KEYWORDS = get_hn_keywords()
-    
-    for keyword in KEYWORDS:
-        try:
-            params = {
-                "query": keyword,
-                "tags": "story",
-                "hitsPerPage": 5,
-            }
-            
-            response = httpx.get(HN_SEARCH_API, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            for hit in data.get("hits", []):
-                published = None
-                if hit.get("created_at"):
-                    published = datetime.fromisoformat(hit["created_at"].replace("Z", "+00:00"))
-                
-                article = Article(
-                    title=hit.get("title", "No title"),
-                    url=hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID')}",
-                    published_date=published,
-                    source="Hacker News",
-                    content_snippet=hit.get("story_text", "")[:300],
-                    category="Hacker News"
-                )
-                articles.append(article)
-        except Exception as e:
-            print(f"Error fetching HN for '{keyword}': {e}")
-    
-    # Remove duplicates by URL
+    for hit in data.get("hits", []):
+        published = None
+        # created_at_i is already the UTC epoch; only parse created_at when it is missing
+        published_ts = hit.get("created_at_i")
+        if published_ts is None and hit.get("created_at"):
+            published = datetime.fromisoformat(hit["created_at"].replace("Z", "+00:00"))
+        
+        article = Article(
+            title=hit.get("title", "No title"),
+            url=canonicalize_url(hit.get("url") or f"https://news.ycombinator.com/item?id={hit.get('objectID')}"),
+            published_date=published,
+            source=HN_SOURCE,
+            content_snippet=(hit.get("story_text") or "")[:300],
+            category="Hacker News",
+            published_ts=published_ts,
+        )
+        articles.append(article)
+    
+    return articles
+
+def drop_stored(articles: List[Article]) -> List[Article]:
+    """
+    Remove stories already stored from Hacker News.
+    
+    Searches reach CURSOR_OVERLAP_SECONDS behind the cursor, and backfill
+    gaps start just past a hit already fetched, so some hits were returned by
+    an earlier fetch.
+    """
+    stored = stored_urls(HN_SOURCE, [a.url for a in articles])
+    return [a for a in articles if a.url not in stored]
+
+def dedupe_by_url(articles: List[Article]) -> List[Article]:
+    """Remove duplicate articles by canonical URL, keeping the first occurrence."""
     seen = set()
     unique_articles = []
     for article in articles:
-        if article.url not in seen:
-            seen.add(article.url)
+        key = url_key(article.url)
+        if key not in seen:
+            seen.add(key)
             unique_articles.append(article)
     
     return unique_articles
-
-if __name__ == "__main__":
-    articles = fetch_hn_articles()
-    print(f"Fetched {len(articles)} unique HN articles:")
-    for article in articles[:5]:
-        print(f"\n{article.source}")
-        print(f"  {article.title}")
-        print(f"  {article.url}")
-        print(f"  {article.published_date}")
@@ -1,39 +1,31 @@
-import feedparser
 from datetime import datetime
 from typing import List
 from toadman.models import Article
-from toadman.config import get_rss_feeds
+from toadman.dedupe import canonicalize_url
 
-def fetch_rss_feeds() -> List[Article]:
-    """Fetch articles from all configured RSS feeds."""
+def parse_feed_entries(source: str, feed, max_entries: int = 10) -> List[Article]:
+    """Build articles from the first max_entries entries of a parsed feedparser result."""
     articles = []
-    RSS_FEEDS = get_rss_feeds()
-    
-    for source, url in RSS_FEEDS.items():
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:10]:  # Limit to 10 most recent
-                published = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6])
-                
-                content = ""
-                if hasattr(entry, 'summary'):
-                    content = entry.summary[:300]
-                elif hasattr(entry, 'description'):
-                    content = entry.description[:300]
-                
-                article = Article(
-                    title=entry.get('title', 'No title'),
-                    url=entry.get('link', ''),
-                    published_date=published,
-                    source=source,
-                    content_snippet=content,
-                    category=_categorize(source, entry.get('title', ''))
-                )
-                articles.append(article)
-        except Exception as e:
-            print(f"Error fetching {source}: {e}")
+    for entry in feed.entries[:max_entries]:
+        published = None
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6])
+        
+        content = ""
+        if hasattr(entry, 'summary'):
+            content = entry.summary[:300]
+        elif hasattr(entry, 'description'):
+            content = entry.description[:300]
+        
+        article = Article(
+            title=entry.get('title', 'No title'),
+            url=canonicalize_url(entry.get('link', '')),
+            published_date=published,
+            source=source,
+            content_snippet=content,
+            category=_categorize(source, entry.get('title', ''))
+        )
+        articles.append(article)
     
     return articles
 
@@ -53,12 +45,3 @@ def _categorize(source: str, title: str) -> str:
         return "Codex"
     else:
         return "Agentic Tools"
-
-if __name__ == "__main__":
-    articles = fetch_rss_feeds()
-    print(f"Fetched {len(articles)} articles:")
-    for article in articles[:5]:
-        print(f"\n{article.category} | {article.source}")
-        print(f"  {article.title}")
-        print(f"  {article.url}")
-        print(f"  {article.published_date}")
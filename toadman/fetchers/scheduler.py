@@ -0,0 +1,136 @@
+import math
+import random
+import statistics
+import time
+from typing import Dict, List, Optional
+from toadman.config import Config, get_config
+from toadman.cache import load_schedule, recent_batch_hits, recent_published, save_schedule
+from toadman.fetchers.hn_fetcher import HN_SOURCE, batch_name, keyword_batches
+
+# Newest publications a source's rate is estimated from
+RATE_SAMPLE = 10
+
+# Fetch this many times per typical gap between publications
+POLLS_PER_GAP = 2
+
+# Healthy intervals vary by up to this fraction, so sources learned together drift apart
+INTERVAL_JITTER = 0.1
+
+# Failing sources back off from at least this many seconds, even with schedule.min_minutes = 0
+MIN_BACKOFF_SECONDS = 60
+
+def source_names(config: Optional[Config] = None) -> Dict[str, str]:
+    """
+    Return every fetched source, mapped to the source name its articles are stored under.
+    
+    RSS feeds are stored under their own name; each Hacker News keyword batch
+    is fetched separately but stored as HN_SOURCE.
+    """
+    config = config or get_config()
+    names = {source: source for source in config.rss_feeds}
+    for batch in keyword_batches(list(config.hn_keywords), config.hn_keywords_per_request):
+        names[batch_name(batch)] = HN_SOURCE
+    return names
+
+def learned_interval(published: List[float], now: float, config: Config) -> float:
+    """
+    Estimate how often a source should be fetched from its publication times.
+    
+    The typical gap is the median gap between the newest publications, or
+    the time since the newest one if that is longer (a source that has gone
+    quiet slows down). Sources with fewer than two dated articles use
+    cache.expiry_hours.
+    
+    Args:
+        published: The source's newest published_ts values, newest first
+        now: The current epoch
+        config: Supplies the schedule bounds
+    
+    Returns:
+        The interval in seconds, clamped to schedule.min_minutes..schedule.max_hours
+    """
+    minimum = config.schedule_min_minutes * 60
+    maximum = max(minimum, config.schedule_max_hours * 3600)
+    if len(published) < 2:
+        interval = config.cache_expiry_hours * 3600
+    else:
+        gaps = [newer - older for newer, older in zip(published, published[1:])]
+        typical = max(statistics.median(gaps), now - published[0])
+        interval = typical / POLLS_PER_GAP
+    return min(max(interval, minimum), maximum)
+
+def backoff_delay(interval: float, failures: int, config: Config) -> float:
+    """
+    Return how long to wait before retrying a source after consecutive failures.
+    
+    The delay doubles with every failure, starting from the source's interval
+    and capped at schedule.max_backoff_hours, and is drawn from its upper half
+    so failing sources do not retry in lockstep.
+    """
+    cap = max(config.schedule_max_backoff_hours * 3600, MIN_BACKOFF_SECONDS)
+    delay = min(max(interval, MIN_BACKOFF_SECONDS) * 2 ** (failures - 1), cap)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+def recent_times(name: str, stored_as: str) -> List[float]:
+    """
+    Return the publication times a source's rate is learned from, newest first.
+    
+    Hacker News keyword batches are all stored as HN_SOURCE, so each learns
+    from the stories its own searches found (see cache.record_batch_hits);
+    other sources from their stored articles.
+    """
+    if stored_as == HN_SOURCE and name != HN_SOURCE:
+        return recent_batch_hits(name, RATE_SAMPLE)
+    return recent_published(stored_as, RATE_SAMPLE)
+
+def next_entry(entry: Optional[Dict], ok: bool, published: List[float], now: float, config: Config) -> Dict:
+    """
+    Reschedule a source after a fetch.
+    
+    Args:
+        entry: The source's schedule entry, or None if it was never scheduled
+        ok: Whether the fetch succeeded
+        published: The source's newest publication times, newest first (see recent_times)
+        now: The current epoch
+        config: Supplies the schedule bounds
+    
+    Returns:
+        The new entry (see cache.load_schedule)
+    """
+    if ok:
+        interval = learned_interval(published, now, config)
+        delay = interval * random.uniform(1 - INTERVAL_JITTER, 1 + INTERVAL_JITTER)
+        return {"interval": interval, "next_due": now + delay, "failures": 0}
+    
+    interval = entry["interval"] if entry else config.cache_expiry_hours * 3600
+    failures = (entry["failures"] if entry else 0) + 1
+    return {"interval": interval, "next_due": now + backoff_delay(interval, failures, config), "failures": failures}
+
+def reschedule(outcomes: Dict[str, bool], config: Optional[Config] = None) -> None:
+    """Save new schedule entries for sources that were just fetched (name -> succeeded)."""
+    if not outcomes:
+        return
+    config = config or get_config()
+    names = source_names(config)
+    schedule = load_schedule()
+    now = time.time()
+    save_schedule({
+        name: next_entry(schedule.get(name), ok, recent_times(name, names.get(name, name)) if ok else [], now, config)
+        for name, ok in outcomes.items()
+    })
+
+def due_sources(config: Optional[Config] = None, now: Optional[float] = None) -> List[str]:
+    """Return the configured sources that are due for a fetch (never-fetched sources always are)."""
+    schedule = load_schedule()
+    now = now or time.time()
+    return [name for name in source_names(config) if name not in schedule or schedule[name]["next_due"] <= now]
+
+def seconds_until_due(config: Optional[Config] = None) -> float:
+    """Return how long until the next configured source is due (0 if one already is, inf if none are configured)."""
+    schedule = load_schedule()
+    now = time.time()
+    next_due = min(
+        (schedule[name]["next_due"] if name in schedule else now for name in source_names(config)),
+        default=math.inf,
+    )
+    return max(0.0, next_due - now)
@@ -0,0 +1,224 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Tuple
+
+METRICS_FILE = Path.home() / ".toadman" / "metrics.json"
+
+# Recent errors kept for the stats screen; older ones only survive as counts
+MAX_ERRORS = 50
+
+# Prefix for metric names in the Prometheus text format
+PROMETHEUS_PREFIX = "toadman_"
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_lock = threading.Lock()
+_started_at = time.time()
+_timings: Dict[_Key, List[float]] = {}  # [count, total seconds, max seconds]
+_counters: Dict[_Key, float] = {}
+_errors: Deque[Dict] = deque(maxlen=MAX_ERRORS)
+_error_count = 0
+
+# What save() has already merged into the metrics file, so saving again only adds what is new
+_saved_timings: Dict[_Key, Tuple[int, float]] = {}
+_saved_counters: Dict[_Key, float] = {}
+_saved_error_count = 0
+
+def _key(name: str, labels: Dict[str, str]) -> _Key:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """Record one timing of an operation, e.g. observe("fetch_source", 0.3, source="OpenAI")."""
+    key = _key(name, labels)
+    with _lock:
+        timing = _timings.get(key)
+        if timing is None:
+            _timings[key] = [1, seconds, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+@contextmanager
+def span(name: str, **labels) -> Iterator[None]:
+    """Time the enclosed block with observe; a block that raises counts towards <name>_errors_total."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        incr(f"{name}_errors_total", **labels)
+        raise
+    finally:
+        observe(name, time.perf_counter() - started, **labels)
+
+def incr(name: str, value: float = 1, **labels) -> None:
+    """Add value to a counter."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+def total(name: str) -> float:
+    """Return the sum of a counter across all of its labels."""
+    with _lock:
+        return sum(value for (counter, _), value in _counters.items() if counter == name)
+
+def record_error(name: str, message: str, **labels) -> None:
+    """Count an error under counter name and keep its message for the stats screen."""
+    global _error_count
+    incr(name, **labels)
+    with _lock:
+        _error_count += 1
+        _errors.append({"at": datetime.now().isoformat(timespec="seconds"), "name": name,
+                        "labels": dict(labels), "message": message})
+
+def snapshot() -> Dict:
+    """
+    Return everything recorded in this process as a JSON-compatible dict.
+    
+    Returns:
+        Dict with "started_at", "timings" (count, sum and max seconds per
+        name and labels), "counters" and the most recent "errors"
+    """
+    with _lock:
+        return {
+            "started_at": datetime.fromtimestamp(_started_at).isoformat(timespec="seconds"),
+            "timings": [
+                {"name": name, "labels": dict(labels), "count": int(count),
+                 "sum_seconds": round(total, 6), "max_seconds": round(longest, 6)}
+                for (name, labels), (count, total, longest) in sorted(_timings.items())
+            ],
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(_counters.items())
+            ],
+            "errors": list(_errors),
+        }
+
+def reset() -> None:
+    """Forget everything recorded so far."""
+    global _started_at, _error_count, _saved_error_count
+    with _lock:
+        _started_at = time.time()
+        _timings.clear()
+        _counters.clear()
+        _errors.clear()
+        _error_count = _saved_error_count = 0
+        _saved_timings.clear()
+        _saved_counters.clear()
+
+def save(path: Path = METRICS_FILE) -> None:
+    """
+    Merge what this process recorded since its last save into the metrics file at path.
+    
+    Every run adds to the file rather than replacing it, so a command that
+    only reads the store does not hide the timings of the last fetch.
+    Timings add up their counts and sums and keep the longest, counters add
+    up, and the newest MAX_ERRORS errors are kept. Saving again (as the
+    daemon does after each refresh) only adds what is new since.
+    """
+    global _saved_error_count
+    with _lock:
+        timings = {}
+        for key, (count, total_seconds, longest) in _timings.items():
+            saved_count, saved_total = _saved_timings.get(key, (0, 0.0))
+            if count > saved_count:
+                timings[key] = [count - saved_count, total_seconds - saved_total, longest]
+        counters = {
+            key: value - _saved_counters.get(key, 0)
+            for key, value in _counters.items()
+            if value != _saved_counters.get(key, 0)
+        }
+        errors = list(_errors)[len(_errors) - min(len(_errors), _error_count - _saved_error_count):]
+        error_count = _error_count
+        snapshot_timings = {key: (timing[0], timing[1]) for key, timing in _timings.items()}
+        snapshot_counters = dict(_counters)
+    if not timings and not counters and not errors:
+        return
+    
+    data = load(path)
+    merged_timings = {_key(t["name"], t["labels"]): [t["count"], t["sum_seconds"], t["max_seconds"]]
+                      for t in data.get("timings", [])}
+    for key, (count, total_seconds, longest) in timings.items():
+        merged = merged_timings.setdefault(key, [0, 0.0, 0.0])
+        merged[0] += count
+        merged[1] += total_seconds
+        merged[2] = max(merged[2], longest)
+    merged_counters = {_key(c["name"], c["labels"]): c["value"] for c in data.get("counters", [])}
+    for key, value in counters.items():
+        merged_counters[key] = merged_counters.get(key, 0) + value
+    
+    merged = {
+        "started_at": data.get("started_at") or datetime.fromtimestamp(_started_at).isoformat(timespec="seconds"),
+        "timings": [
+            {"name": name, "labels": dict(labels), "count": int(count),
+             "sum_seconds": round(total_seconds, 6), "max_seconds": round(longest, 6)}
+            for (name, labels), (count, total_seconds, longest) in sorted(merged_timings.items())
+        ],
+        "counters": [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(merged_counters.items())
+        ],
+        "errors": (data.get("errors", []) + errors)[-MAX_ERRORS:],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so a concurrent reader never sees half a file
+    partial = path.with_suffix(".tmp")
+    partial.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+    partial.replace(path)
+    
+    with _lock:
+        _saved_timings.update(snapshot_timings)
+        _saved_counters.update(snapshot_counters)
+        _saved_error_count = error_count
+
+def load(path: Path = METRICS_FILE) -> Dict:
+    """Load the metrics saved by every run so far (see save), or an empty snapshot if there are none."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"started_at": None, "timings": [], "counters": [], "errors": []}
+
+def _prometheus_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{label}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for label, value in sorted(labels.items())
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def to_prometheus(data: Dict) -> str:
+    """
+    Format a snapshot in the Prometheus text exposition format.
+    
+    Timings become <name>_seconds summaries (count and sum) plus a
+    <name>_seconds_max gauge; counters are exported as they are named.
+    """
+    lines: List[str] = []
+    declared = set()
+    
+    def declare(metric: str, kind: str) -> None:
+        if metric not in declared:
+            declared.add(metric)
+            lines.append(f"# TYPE {metric} {kind}")
+    
+    for timing in data["timings"]:
+        metric = f"{PROMETHEUS_PREFIX}{timing['name']}_seconds"
+        labels = _prometheus_labels(timing["labels"])
+        declare(metric, "summary")
+        lines.append(f"{metric}_count{labels} {timing['count']}")
+        lines.append(f"{metric}_sum{labels} {timing['sum_seconds']}")
+    for timing in data["timings"]:
+        metric = f"{PROMETHEUS_PREFIX}{timing['name']}_seconds_max"
+        declare(metric, "gauge")
+        lines.append(f"{metric}{_prometheus_labels(timing['labels'])} {timing['max_seconds']}")
+    for counter in data["counters"]:
+        metric = f"{PROMETHEUS_PREFIX}{counter['name']}"
+        declare(metric, "counter")
+        lines.append(f"{metric}{_prometheus_labels(counter['labels'])} {counter['value']:g}")
+    return "\n".join(lines) + "\n"
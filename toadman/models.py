@@ -1,12 +1,59 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+import sys
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Tuple
+
+def utc_timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Convert a datetime to a UTC epoch; naive values are taken to be UTC, as feed dates are."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
-@dataclass
 class Article:
-    title: str
-    url: str
-    published_date: Optional[datetime]
-    source: str
-    content_snippet: str
-    category: str = "general"
+    """
+    A news article.
+    
+    Articles are slotted so large archives stay small. The source and category
+    strings are interned, since a handful of values repeat across every
+    article, and the published time is normalized once, at ingest, to a UTC
+    epoch (published_ts), so sorting and window filtering compare floats.
+    published_date is derived from it for display.
+    """
+    
+    __slots__ = ("title", "url", "published_ts", "source", "content_snippet", "category", "other_sources")
+    
+    def __init__(self, title: str, url: str, published_date: Optional[datetime], source: str,
+                 content_snippet: str, category: str = "general", other_sources: Iterable[str] = (),
+                 published_ts: Optional[float] = None):
+        self.title = title
+        self.url = url
+        # An epoch from the store or the API is used as is, skipping datetime parsing
+        self.published_ts = published_ts if published_ts is not None else utc_timestamp(published_date)
+        self.source = sys.intern(source)
+        self.content_snippet = content_snippet
+        self.category = sys.intern(category)
+        # Other sources that carried the same story
+        self.other_sources: Tuple[str, ...] = tuple(map(sys.intern, other_sources)) if other_sources else ()
+    
+    @property
+    def published_date(self) -> Optional[datetime]:
+        """The published time as an aware UTC datetime, or None if unknown."""
+        if self.published_ts is None:
+            return None
+        return datetime.fromtimestamp(self.published_ts, timezone.utc)
+    
+    def _fields(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    # Articles are mutable (other_sources grows as duplicates are merged), so unhashable
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Article({fields})"
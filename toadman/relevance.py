@@ -0,0 +1,67 @@
+import time
+from typing import Dict, Iterable, List, Optional
+from toadman.models import Article
+from toadman.config import Config, get_config
+from toadman.search import SearchIndex
+
+def interest_terms(config: Optional[Config] = None) -> List[str]:
+    """Return the phrases articles are ranked against: the HN keywords and relevance.interests."""
+    config = config or get_config()
+    return list(dict.fromkeys(config.hn_keywords + config.relevance_interests))
+
+def relevance_scores(index: SearchIndex, interests: List[str], half_life_hours: float,
+                     now: Optional[float] = None) -> Dict[str, float]:
+    """
+    Score indexed articles by how well they match a set of interests, discounted by age.
+    
+    Each interest phrase contributes its BM25 score (see SearchIndex.phrase_scores),
+    so articles matching several interests, in their title or repeatedly, score
+    higher. The sum is halved for every half_life_hours since publication;
+    undated articles are not discounted.
+    
+    Args:
+        index: Index holding the articles to score
+        interests: Phrases to match, such as configured keywords
+        half_life_hours: Age at which a score is halved (0 disables the decay)
+        now: The current epoch (defaults to now)
+    
+    Returns:
+        Scores of the articles matching at least one interest, keyed by URL
+    """
+    scores: Dict[str, float] = {}
+    for phrase in interests:
+        for url, score in index.phrase_scores(phrase).items():
+            scores[url] = scores.get(url, 0.0) + score
+    
+    if half_life_hours > 0:
+        now = now or time.time()
+        half_life = half_life_hours * 3600
+        for url in scores:
+            published = index.get(url).published_ts
+            if published is not None:
+                scores[url] *= 0.5 ** (max(0.0, now - published) / half_life)
+    return scores
+
+def rank_by_relevance(articles: Iterable[Article], index: Optional[SearchIndex] = None,
+                      config: Optional[Config] = None) -> List[Article]:
+    """
+    Sort articles by relevance to the configured interests (see relevance_scores).
+    
+    Args:
+        articles: The articles to rank
+        index: A SearchIndex already holding exactly these articles, e.g. the
+            TUI's, to skip indexing them again
+        config: Supplies interests and relevance.half_life_hours (defaults to the current config)
+    
+    Returns:
+        Matching articles, most relevant first, followed by the rest in their original order
+    """
+    config = config or get_config()
+    articles = list(articles)
+    if index is None:
+        index = SearchIndex()
+        index.add_many(articles)
+    
+    scores = relevance_scores(index, interest_terms(config), config.relevance_half_life_hours)
+    # sorted is stable, so unmatched articles (all 0) keep their order
+    return sorted(articles, key=lambda a: scores.get(a.url, 0.0), reverse=True)
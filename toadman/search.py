@@ -0,0 +1,232 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+from toadman.models import Article
+
+_TOKEN = re.compile(r"\w+")
+_TAG = re.compile(r"<[^>]+>")
+
+# Per-field weights applied to term frequencies (a simple BM25F)
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "source": 1.5,
+    "category": 1.5,
+    "content_snippet": 1.0,
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Shorter trailing terms only match exactly, since they would expand to most of the vocabulary
+MIN_PREFIX_LENGTH = 2
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, ignoring HTML tags."""
+    return _TOKEN.findall(_TAG.sub(" ", text).lower())
+
+class SearchIndex:
+    """
+    In-memory inverted index over article title, source, category and snippet.
+    
+    Articles are keyed by URL and can be added incrementally; re-adding a URL
+    replaces its previous postings. Queries match every term (the last one as
+    a prefix, so results update as the user types) and are ranked with BM25.
+    """
+    
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._articles: Dict[str, Article] = {}
+        self._total_length = 0.0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        # Per-term and per-prefix BM25 scores, valid until the index next changes
+        self._term_scores: Dict[str, Dict[str, float]] = {}
+        self._prefix_scores: Dict[str, Dict[str, float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._articles)
+    
+    def __contains__(self, url: str) -> bool:
+        return url in self._articles
+    
+    def add(self, article: Article) -> None:
+        """Index an article, replacing any previous version with the same URL."""
+        if article.url in self._articles:
+            self.remove(article.url)
+        
+        terms: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(getattr(article, field)):
+                terms[token] = terms.get(token, 0.0) + weight
+        
+        self._invalidate()
+        url = article.url
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[url] = frequency
+        
+        length = sum(terms.values())
+        self._doc_terms[url] = terms
+        self._doc_lengths[url] = length
+        self._articles[url] = article
+        self._total_length += length
+    
+    def add_many(self, articles: Iterable[Article]) -> None:
+        """Index several articles."""
+        for article in articles:
+            self.add(article)
+    
+    def sync(self, articles: Iterable[Article]) -> None:
+        """Make the index hold exactly these articles, re-indexing only new ones or those whose text changed."""
+        current = {}
+        for article in articles:
+            current[article.url] = article
+            indexed = self._articles.get(article.url)
+            if indexed is article:
+                continue
+            if indexed is not None and all(getattr(indexed, f) == getattr(article, f) for f in FIELD_WEIGHTS):
+                # Same text, so the postings stand; keep the latest copy for get()
+                self._articles[article.url] = article
+            else:
+                self.add(article)
+        
+        for url in [url for url in self._articles if url not in current]:
+            self.remove(url)
+    
+    def remove(self, url: str) -> None:
+        """Remove an article from the index if present."""
+        terms = self._doc_terms.pop(url, None)
+        if terms is None:
+            return
+        
+        self._invalidate()
+        for term in terms:
+            postings = self._postings[term]
+            del postings[url]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+        
+        self._total_length -= self._doc_lengths.pop(url)
+        del self._articles[url]
+    
+    def clear(self) -> None:
+        """Remove every article from the index."""
+        self.__init__()
+    
+    def _invalidate(self) -> None:
+        if self._term_scores or self._prefix_scores:
+            self._term_scores = {}
+            self._prefix_scores = {}
+    
+    def _expand(self, prefix: str) -> List[str]:
+        """Return every indexed term starting with prefix."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        
+        start = bisect_left(self._vocabulary, prefix)
+        end = bisect_left(self._vocabulary, prefix + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+    
+    def _scores_for_term(self, term: str) -> Dict[str, float]:
+        """Return the BM25 score of every article containing term."""
+        scores = self._term_scores.get(term)
+        if scores is None:
+            postings = self._postings.get(term, {})
+            doc_count = len(self._articles)
+            avg_length = self._total_length / doc_count
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            lengths = self._doc_lengths
+            scores = {
+                url: idf * frequency * (K1 + 1) / (frequency + K1 * (1 - B + B * lengths[url] / avg_length))
+                for url, frequency in postings.items()
+            }
+            self._term_scores[term] = scores
+        return scores
+    
+    def _scores_for_prefix(self, prefix: str) -> Dict[str, float]:
+        """Return the summed BM25 score of every article containing a term starting with prefix."""
+        scores = self._prefix_scores.get(prefix)
+        if scores is None:
+            terms = self._expand(prefix)
+            if len(terms) == 1:
+                scores = self._scores_for_term(terms[0])
+            else:
+                scores = {}
+                for term in terms:
+                    for url, score in self._scores_for_term(term).items():
+                        scores[url] = scores.get(url, 0.0) + score
+            self._prefix_scores[prefix] = scores
+        return scores
+    
+    def phrase_scores(self, phrase: str) -> Dict[str, float]:
+        """
+        Score every article containing all terms of a phrase, such as a configured keyword.
+        
+        Unlike search, every term must match exactly.
+        
+        Returns:
+            The summed BM25 score of each matching article, keyed by URL
+        """
+        terms = tokenize(phrase)
+        if not terms or not self._articles:
+            return {}
+        return _intersect([self._scores_for_term(term) for term in terms])
+    
+    def get(self, url: str) -> Optional[Article]:
+        """Return the indexed article with this URL, if any."""
+        return self._articles.get(url)
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Article]:
+        """
+        Find articles matching every term of the query, best matches first.
+        
+        Args:
+            query: Free text; the last term also matches as a prefix unless the
+                query ends with a space
+            limit: Maximum number of results
+        
+        Returns:
+            Matching articles ranked by BM25 score
+        """
+        query_terms = tokenize(query)
+        if not query_terms or not self._articles:
+            return []
+        
+        term_scores = []
+        for position, term in enumerate(query_terms):
+            is_last = position == len(query_terms) - 1
+            if is_last and not query.endswith(" ") and len(term) >= MIN_PREFIX_LENGTH:
+                term_scores.append(self._scores_for_prefix(term))
+            else:
+                term_scores.append(self._scores_for_term(term))
+        
+        scores = _intersect(term_scores)
+        if not scores:
+            return []
+        
+        if limit is not None:
+            ranked = heapq.nlargest(limit, scores, key=scores.__getitem__)
+        else:
+            ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+        return [self._articles[url] for url in ranked]
+
+def _intersect(term_scores: List[Dict[str, float]]) -> Dict[str, float]:
+    """Sum per-term scores over the articles that have every term."""
+    # Start from the most selective term
+    term_scores = sorted(term_scores, key=len)
+    scores = term_scores[0]
+    for other in term_scores[1:]:
+        scores = {url: score + other[url] for url, score in scores.items() if url in other}
+        if not scores:
+            break
+    return scores
@@ -0,0 +1,60 @@
+import sys
+import time
+from typing import List, Tuple
+
+# Timings are measured from when this module is first imported, which the CLI does before anything else
+_started = time.perf_counter()
+_marks: List[Tuple[str, float]] = []
+_loaded_at_first_paint: List[str] = []
+
+# Target for the time from launch to the first rendered TUI frame
+FIRST_PAINT_BUDGET_MS = 800
+
+# Modules that should stay unloaded until they are actually needed
+DEFERRED_MODULES = ("httpx", "feedparser", "toadman.export.stream_exporter")
+
+def mark(name: str) -> None:
+    """Record that a startup phase has been reached."""
+    _marks.append((name, (time.perf_counter() - _started) * 1000))
+
+def first_paint() -> None:
+    """Record the first rendered frame and which deferred modules were loaded by then."""
+    _loaded_at_first_paint[:] = [name for name in DEFERRED_MODULES if name in sys.modules]
+    mark("first paint")
+
+def elapsed_ms(name: str) -> float:
+    """Return when a phase was reached in milliseconds, or -1 if it has not been."""
+    for mark_name, at in _marks:
+        if mark_name == name:
+            return at
+    return -1.0
+
+def within_budget() -> bool:
+    """Return True if the first frame was painted within FIRST_PAINT_BUDGET_MS."""
+    painted_at = elapsed_ms("first paint")
+    return 0 <= painted_at <= FIRST_PAINT_BUDGET_MS
+
+def report() -> str:
+    """
+    Format the recorded startup phases as a human-readable report.
+    
+    Returns:
+        One line per phase with its time and the delta from the previous one,
+        followed by the first-paint verdict against the budget
+    """
+    lines = ["Startup profile (ms since launch):"]
+    previous = 0.0
+    for name, at in _marks:
+        lines.append(f"  {name:<20} {at:8.1f}  (+{at - previous:.1f})")
+        previous = at
+    
+    painted_at = elapsed_ms("first paint")
+    if painted_at < 0:
+        lines.append("First paint: not reached")
+    else:
+        verdict = "ok" if within_budget() else "OVER BUDGET"
+        lines.append(f"First paint: {painted_at:.1f} ms (budget {FIRST_PAINT_BUDGET_MS} ms) {verdict}")
+    
+    if _loaded_at_first_paint:
+        lines.append(f"Loaded before first paint: {', '.join(_loaded_at_first_paint)}")
+    return "\n".join(lines)
@@ -0,0 +1,52 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Optional, Set
+
+# Summarizer backends by the name used for summarizer.backend in config.
+#
+# A backend is a module providing:
+#     summary_key(article) -> str
+#     summary_keys(articles) -> List[str]
+#     summarize_article(article, timeout=60, on_start=None, use_cache=True) -> str
+#     summarize_articles(articles, batch_size=5, timeout=120, on_start=None, use_cache=True) -> List[str]
+#
+# Summaries are markdown bullets; failures are returned as strings starting
+# with "Error:". on_start receives any subprocess started, so callers can kill
+# it to cancel. Summaries are cached under summary_key, so each backend's
+# summaries are kept apart.
+BACKENDS = {
+    "kiro": "toadman.summarizer.kiro_summarizer",
+    "extractive": "toadman.summarizer.extractive",
+}
+
+# Unknown summarizer.backend values already warned about, so each is reported once
+_warned: Set[str] = set()
+
+def get_backend(name: Optional[str] = None) -> ModuleType:
+    """
+    Return a summarizer backend module, importing it on first use.
+    
+    An unknown summarizer.backend in config is reported on stderr and the
+    default backend is used instead, as with other invalid config values.
+    
+    Args:
+        name: A key of BACKENDS (defaults to summarizer.backend in config)
+    
+    Raises:
+        ValueError: If name is given and there is no backend by that name
+    """
+    if not name:
+        # Imported here so the CLI can build its --backend choices without loading config
+        from toadman.config import DEFAULT_CONFIG, get_config
+        
+        name = get_config().summarizer_backend
+        if name not in BACKENDS:
+            if name not in _warned:
+                _warned.add(name)
+                print(f"Invalid config value for summarizer.backend: expected one of "
+                      f"{', '.join(repr(known) for known in BACKENDS)}; using the default", file=sys.stderr)
+            name = DEFAULT_CONFIG["summarizer"]["backend"]
+    if name not in BACKENDS:
+        raise ValueError(f"unknown summarizer backend {name!r} (expected one of {', '.join(BACKENDS)})")
+    return importlib.import_module(BACKENDS[name])
@@ -0,0 +1,166 @@
+import atexit
+import subprocess
+import threading
+import time
+from typing import List, Optional
+from toadman.config import get_config
+from toadman import metrics
+
+KIRO_COMMAND = ["kiro-cli", "chat"]
+
+# How often the pool checks on its standby processes
+HEALTH_CHECK_SECONDS = 5
+
+# Standbys that keep dying (e.g. kiro-cli is logged out) are not restarted again until the next summary
+MAX_CONSECUTIVE_CRASHES = 3
+
+class KiroPool:
+    """
+    Keeps kiro-cli chat processes started and waiting for a prompt.
+    
+    `kiro-cli chat` answers the prompt it reads from stdin and exits, so a
+    process cannot serve a second prompt. Instead the pool starts up to size
+    standby processes ahead of time: their start-up and session setup happen
+    while earlier summaries run, not after the next one is requested. A
+    background thread restarts standbys that exit on their own and stops them
+    all after idle_seconds without a summary; the next summary restarts them.
+    """
+    
+    def __init__(self, size: int, idle_seconds: float, command: List[str] = KIRO_COMMAND):
+        self.size = size
+        self.idle_seconds = idle_seconds
+        self.command = command
+        self._standby: List[subprocess.Popen] = []
+        self._crashes = 0
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+    
+    def acquire(self) -> subprocess.Popen:
+        """
+        Return a started kiro-cli process for one prompt, and start its replacement.
+        
+        The caller owns the process: it writes the prompt to stdin and reads
+        the answer, as with a freshly started one.
+        
+        Raises:
+            OSError: If kiro-cli could not be started (FileNotFoundError if it is not installed)
+        """
+        with self._lock:
+            self._last_used = time.monotonic()
+            process = None
+            while self._standby and process is None:
+                candidate = self._standby.pop(0)
+                if candidate.poll() is None:
+                    process = candidate
+                else:
+                    self._reap(candidate)
+            
+            if process is not None:
+                metrics.incr("summarizer_pool_hits_total")
+            else:
+                metrics.incr("summarizer_pool_misses_total")
+                process = self._spawn()
+            
+            # Each summary gives crashing standbys another MAX_CONSECUTIVE_CRASHES chances
+            self._crashes = 0
+            self._trim()
+            self._fill()
+            if self._monitor is None and self.size > 0:
+                self._stop.clear()
+                self._monitor = threading.Thread(target=self._watch, name="kiro-pool", daemon=True)
+                self._monitor.start()
+        return process
+    
+    def shutdown(self) -> None:
+        """Stop the standby processes and the health check thread."""
+        self._stop.set()
+        with self._lock:
+            for process in self._standby:
+                _stop_process(process)
+            self._standby = []
+    
+    def standby_count(self) -> int:
+        """Return the number of started processes waiting for a prompt."""
+        with self._lock:
+            return len(self._standby)
+    
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    
+    def _fill(self) -> None:
+        if self._crashes >= MAX_CONSECUTIVE_CRASHES:
+            return
+        while len(self._standby) < self.size:
+            try:
+                self._standby.append(self._spawn())
+            except OSError:
+                return
+    
+    def _trim(self) -> None:
+        # The size is re-read from config on every summary and may have shrunk
+        while len(self._standby) > self.size:
+            _stop_process(self._standby.pop())
+    
+    def _reap(self, process: subprocess.Popen) -> None:
+        """Record a standby that exited before it was given a prompt."""
+        try:
+            _, stderr = process.communicate(timeout=1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            stderr = ""
+        lines = (stderr or "").strip().splitlines()
+        self._crashes += 1
+        metrics.record_error("summarizer_worker_crashes_total",
+                             lines[0] if lines else f"kiro-cli exited with code {process.returncode}")
+    
+    def _watch(self) -> None:
+        while not self._stop.wait(HEALTH_CHECK_SECONDS):
+            with self._lock:
+                if time.monotonic() - self._last_used >= self.idle_seconds:
+                    for process in self._standby:
+                        _stop_process(process)
+                    self._standby = []
+                    self._monitor = None
+                    return
+                
+                alive = []
+                for process in self._standby:
+                    if process.poll() is None:
+                        alive.append(process)
+                    else:
+                        self._reap(process)
+                        metrics.incr("summarizer_worker_restarts_total")
+                self._standby = alive
+                self._fill()
+
+def _stop_process(process: subprocess.Popen) -> None:
+    # A standby has not been given a prompt yet, so nothing is lost by killing it
+    if process.poll() is None:
+        process.kill()
+    try:
+        process.communicate(timeout=1)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+
+_pool: Optional[KiroPool] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> KiroPool:
+    """Return the process-wide kiro-cli pool, sized from the current config."""
+    global _pool
+    config = get_config()
+    with _pool_lock:
+        if _pool is None:
+            _pool = KiroPool(config.summarizer_pool_size, config.summarizer_idle_minutes * 60)
+            # Standbys would otherwise outlive us, reading an empty prompt once our end of the pipe closes
+            atexit.register(_pool.shutdown)
+        _pool.size = config.summarizer_pool_size
+        _pool.idle_seconds = config.summarizer_idle_minutes * 60
+    return _pool
@@ -1,49 +1,219 @@
+import hashlib
+import re
 import subprocess
+import time
+from typing import Callable, Dict, List, Optional
 from toadman.models import Article
+from toadman.cache import article_contents, get_summary, get_summaries, has_bodies, put_summary
+from toadman.config import get_config
+from toadman import metrics
+from toadman.summarizer.kiro_pool import get_pool
 
-def summarize_article(article: Article, timeout: int = 60) -> str:
+# Bump whenever build_prompt changes so cached summaries are regenerated
+PROMPT_VERSION = 2
+
+def summary_key(article: Article, has_body: Optional[bool] = None) -> str:
     """
-    Summarize an article using Kiro CLI.
+    Return the summary cache key for an article's current content and prompt version.
     
-    Args:
-        article: The article to summarize
-        timeout: Timeout in seconds for the Kiro CLI call
-    
-    Returns:
-        The summary text from Kiro
+    Summaries of the feed snippet and of the fetched full text are cached
+    apart, so a summary made before the page was fetched is redone once it is.
+    has_body is looked up (see has_bodies) when not given.
     """
-    prompt = f"""Summarize this news article in 3-5 bullet points, focusing on key technical details and impact:
+    if has_body is None:
+        has_body = has_bodies([article])[0]
+    content = "\0".join([article.url, article.title, article.content_snippet,
+                         "body" if has_body else "snippet", str(PROMPT_VERSION)])
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def summary_keys(articles: List[Article]) -> List[str]:
+    """Return the summary cache keys of several articles (see summary_key), looking up their text at once."""
+    return [summary_key(a, has_body) for a, has_body in zip(articles, has_bodies(articles))]
+
+def build_prompt(article: Article, content: Optional[str] = None) -> str:
+    """Build the Kiro prompt for summarizing a single article (content defaults to its snippet)."""
+    if content is None:
+        content = article.content_snippet
+    return f"""Summarize this news article in 3-5 bullet points, focusing on key technical details and impact:
 
 Title: {article.title}
 Source: {article.source}
 URL: {article.url}
 
 Content:
-{article.content_snippet}
+{content}
 
 Provide a concise summary highlighting:
 - Main announcement or development
 - Key technical details
 - Impact on developers/users
 """
+
+def build_batch_prompt(articles: List[Article], contents: Optional[List[str]] = None) -> str:
+    """Build a single Kiro prompt asking for a summary of each of several articles (contents default to their snippets)."""
+    if contents is None:
+        contents = [article.content_snippet for article in articles]
+    prompt = f"""Summarize each of the following {len(articles)} news articles in 3-5 bullet points, focusing on key technical details and impact.
+
+For every article, start its summary with a line containing exactly "=== SUMMARY <number> ===" using the article's number, followed by the bullet points. Summarize every article, in order, and output nothing else.
+
+"""
+    for number, (article, content) in enumerate(zip(articles, contents), 1):
+        prompt += f"""=== ARTICLE {number} ===
+Title: {article.title}
+Source: {article.source}
+URL: {article.url}
+
+Content:
+{content}
+
+"""
+    return prompt
+
+_SUMMARY_MARKER = re.compile(r"^=== SUMMARY (\d+) ===[ \t]*$", re.MULTILINE)
+
+def parse_batch_output(output: str, count: int) -> Dict[int, str]:
+    """Split batch output into summaries keyed by 1-based article number, dropping empty or unknown ones."""
+    parts = _SUMMARY_MARKER.split(output)
+    # parts = [preamble, number, text, number, text, ...]
+    summaries = {}
+    for number, text in zip(parts[1::2], parts[2::2]):
+        number = int(number)
+        if 1 <= number <= count and text.strip():
+            summaries[number] = text.strip()
+    return summaries
+
+def summarize_article(article: Article, timeout: int = 60,
+                      on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+                      use_cache: bool = True) -> str:
+    """
+    Summarize an article using Kiro CLI.
+    
+    The article's full text is summarized if it has been fetched (see
+    cache.article_contents), and its snippet otherwise.
+    
+    Args:
+        article: The article to summarize
+        timeout: Timeout in seconds for the Kiro CLI call
+        on_start: Optional callback receiving the running kiro-cli process,
+            e.g. so a caller on another thread can kill it to cancel
+        use_cache: Read and write the on-disk summary cache
+    
+    Returns:
+        The summary text from Kiro
+    """
+    key = summary_key(article)
+    if use_cache:
+        cached = get_summary(key)
+        if cached is not None:
+            return cached
+    
+    summary = _run_kiro(build_prompt(article, article_contents([article])[0]), timeout, on_start, mode="single")
+    if use_cache and not summary.startswith("Error:"):
+        put_summary(key, article.url, summary, max_bytes=int(get_config().summary_cache_max_mb * 1024 * 1024))
+    return summary
+
+def summarize_articles(articles: List[Article], batch_size: int = 5, timeout: int = 120,
+                       on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+                       use_cache: bool = True) -> List[str]:
+    """
+    Summarize many articles, packing up to batch_size of them into each kiro-cli call.
+    
+    Articles left out of a batch response that did parse are retried with
+    individual summarize_article calls. When a batch call itself fails (it
+    timed out, crashed or was killed to cancel it), its error is returned for
+    each of its articles rather than retrying them one by one, and a failed
+    retry ends the retries, so a hung or cancelled kiro-cli costs one timeout.
+    
+    Args:
+        articles: The articles to summarize
+        batch_size: Maximum number of articles per kiro-cli invocation
+        timeout: Timeout in seconds for each Kiro CLI call, batched or retried alone
+        on_start: Optional callback receiving each kiro-cli process as it starts
+        use_cache: Read and write the on-disk summary cache
+    
+    Returns:
+        One summary (or error string) per article, in input order
+    """
+    keys = summary_keys(articles)
+    results: List[Optional[str]] = [None] * len(articles)
+    
+    if use_cache:
+        cached = get_summaries(keys)
+        for index, key in enumerate(keys):
+            results[index] = cached.get(key)
+    
+    pending = [index for index, result in enumerate(results) if result is None]
+    max_bytes = int(get_config().summary_cache_max_mb * 1024 * 1024)
+    
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        if len(batch) == 1:
+            continue
+        
+        batch_articles = [articles[i] for i in batch]
+        # Share one article's text budget across the batch so the prompt stays a similar size
+        contents = article_contents(batch_articles, get_config().content_max_prompt_chars // len(batch))
+        output = _run_kiro(build_batch_prompt(batch_articles, contents), timeout, on_start, mode="batch")
+        if output.startswith("Error:"):
+            for index in batch:
+                results[index] = output
+            continue
+        
+        for number, summary in parse_batch_output(output, len(batch)).items():
+            index = batch[number - 1]
+            results[index] = summary
+            if use_cache:
+                put_summary(keys[index], articles[index].url, summary, max_bytes=max_bytes)
     
+    # Fall back to one call per article for anything the batches did not cover
+    error = None
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = error or summarize_article(articles[index], timeout=timeout, on_start=on_start,
+                                                        use_cache=use_cache)
+            if results[index].startswith("Error:"):
+                error = results[index]
+    
+    return results
+
+def _run_kiro(prompt: str, timeout: int,
+              on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+              mode: str = "single") -> str:
+    """
+    Send a prompt to kiro-cli chat and return its output or an error string.
+    
+    Each call is timed in metrics as summarizer_call (labelled with mode), and
+    errors are counted as summarizer_errors_total.
+    """
+    started = time.perf_counter()
+    output = _call_kiro(prompt, timeout, on_start)
+    metrics.observe("summarizer_call", time.perf_counter() - started, mode=mode)
+    if output.startswith("Error:"):
+        metrics.record_error("summarizer_errors_total", output.splitlines()[0], mode=mode)
+    return output
+
+def _call_kiro(prompt: str, timeout: int,
+               on_start: Optional[Callable[[subprocess.Popen], None]] = None) -> str:
+    """Run a prompt through a kiro-cli chat process, usually one already started by the pool."""
     try:
         # Call kiro-cli chat with the prompt via stdin
-        result = subprocess.run(
-            ['kiro-cli', 'chat'],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+        process = get_pool().acquire()
+        if on_start:
+            on_start(process)
+        
+        try:
+            stdout, stderr = process.communicate(prompt, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return "Error: Kiro CLI timed out"
         
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if process.returncode == 0:
+            return stdout.strip()
         else:
-            return f"Error: Kiro CLI returned code {result.returncode}\n{result.stderr}"
+            return f"Error: Kiro CLI returned code {process.returncode}\n{stderr}"
     
-    except subprocess.TimeoutExpired:
-        return "Error: Kiro CLI timed out"
     except FileNotFoundError:
         return "Error: kiro-cli not found. Please ensure Kiro CLI is installed."
     except Exception as e:
@@ -51,10 +221,10 @@ Provide a concise summary highlighting:
 
 if __name__ == "__main__":
     # Test with a sample article
-    from toadman.fetchers.rss_fetcher import fetch_rss_feeds
+    from toadman.cache import iter_articles
     
-    articles = fetch_rss_feeds()
-    if articles:
-        print(f"Summarizing: {articles[0].title}\n")
-        summary = summarize_article(articles[0])
+    article = next(iter_articles(), None)
+    if article:
+        print(f"Summarizing: {article.title}\n")
+        summary = summarize_article(article)
         print(summary)
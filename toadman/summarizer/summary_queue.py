@@ -0,0 +1,207 @@
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+from toadman.models import Article
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+
+@dataclass(eq=False)
+class SummaryJob:
+    """A single article summarization tracked by a SummaryQueue."""
+    article: Article
+    status: str = QUEUED
+    result: Optional[str] = None
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _future: Optional[Future] = field(default=None, repr=False)
+    _process: Optional[subprocess.Popen] = field(default=None, repr=False)
+    _batch: List["SummaryJob"] = field(default_factory=list, repr=False)
+    
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent running so far (or in total once finished)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+class SummaryQueue:
+    """
+    Runs article summaries on a bounded thread pool.
+    
+    Jobs are keyed by article URL, so submitting an article that is already
+    queued or running returns the existing job. on_update is called from the
+    worker threads whenever a job changes state.
+    """
+    
+    def __init__(self, max_workers: int = 2, timeout: int = 60,
+                 on_update: Optional[Callable[[SummaryJob], None]] = None):
+        self.timeout = timeout
+        self.on_update = on_update
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="summarizer")
+        self._jobs: Dict[str, SummaryJob] = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, article: Article) -> SummaryJob:
+        """Queue an article for summarization, or return its active job."""
+        with self._lock:
+            job = self._jobs.get(article.url)
+            if job and job.active:
+                return job
+            
+            job = SummaryJob(article=article)
+            self._jobs[article.url] = job
+            job._future = self._executor.submit(self._run, job)
+        
+        self._notify(job)
+        return job
+    
+    def submit_many(self, articles: List[Article], batch_size: int = 5) -> List[SummaryJob]:
+        """
+        Queue several articles, summarizing up to batch_size of them per kiro-cli call.
+        
+        Articles that already have an active job keep it; the rest are grouped
+        into batch jobs that run on the same worker pool.
+        """
+        jobs = []
+        new_jobs = []
+        with self._lock:
+            for article in articles:
+                job = self._jobs.get(article.url)
+                if not job or not job.active:
+                    job = SummaryJob(article=article)
+                    self._jobs[article.url] = job
+                    new_jobs.append(job)
+                jobs.append(job)
+            
+            for start in range(0, len(new_jobs), batch_size):
+                batch = new_jobs[start:start + batch_size]
+                future = self._executor.submit(self._run_batch, batch)
+                for job in batch:
+                    job._batch = batch
+                    job._future = future
+        
+        for job in new_jobs:
+            self._notify(job)
+        return jobs
+    
+    def cancel(self, url: str) -> bool:
+        """Cancel the queued or running job for a URL. Returns False if there is none."""
+        with self._lock:
+            job = self._jobs.get(url)
+            if not job or not job.active:
+                return False
+            
+            job.status = CANCELLED
+            job.finished_at = time.monotonic()
+            # A batch keeps running while any of its other articles still wants a summary
+            if not any(j.active for j in job._batch):
+                if job._future:
+                    job._future.cancel()
+                if job._process and job._process.poll() is None:
+                    job._process.kill()
+        
+        self._notify(job)
+        return True
+    
+    def get(self, url: str) -> Optional[SummaryJob]:
+        """Return the most recent job for a URL, if any."""
+        return self._jobs.get(url)
+    
+    def position(self, job: SummaryJob) -> int:
+        """Return the 1-based position of a queued job among the waiting jobs (0 if not waiting)."""
+        with self._lock:
+            waiting = sorted(
+                (j for j in self._jobs.values() if j.status == QUEUED),
+                key=lambda j: j.submitted_at,
+            )
+        return waiting.index(job) + 1 if job in waiting else 0
+    
+    def active_jobs(self) -> List[SummaryJob]:
+        """Return all queued and running jobs."""
+        return [job for job in self._jobs.values() if job.active]
+    
+    def shutdown(self) -> None:
+        """Cancel every active job and stop the worker threads."""
+        for job in self.active_jobs():
+            self.cancel(job.article.url)
+        self._executor.shutdown(wait=False)
+    
+    def _run(self, job: SummaryJob) -> None:
+        with self._lock:
+            if job.status != QUEUED:
+                return
+            job.status = RUNNING
+            job.started_at = time.monotonic()
+        self._notify(job)
+        
+        def on_start(process: subprocess.Popen) -> None:
+            with self._lock:
+                job._process = process
+                cancelled = job.status == CANCELLED
+            if cancelled:
+                process.kill()
+        
+        from toadman.summarizer.backends import get_backend
+        result = get_backend().summarize_article(job.article, timeout=self.timeout, on_start=on_start)
+        
+        with self._lock:
+            job._process = None
+            if job.status == CANCELLED:
+                return
+            job.result = result
+            job.status = DONE
+            job.finished_at = time.monotonic()
+        self._notify(job)
+    
+    def _run_batch(self, batch: List[SummaryJob]) -> None:
+        with self._lock:
+            batch = [job for job in batch if job.status == QUEUED]
+            now = time.monotonic()
+            for job in batch:
+                job.status = RUNNING
+                job.started_at = now
+        if not batch:
+            return
+        for job in batch:
+            self._notify(job)
+        
+        def on_start(process: subprocess.Popen) -> None:
+            with self._lock:
+                for job in batch:
+                    job._process = process
+                cancelled = not any(job.active for job in batch)
+            if cancelled:
+                process.kill()
+        
+        from toadman.summarizer.backends import get_backend
+        results = get_backend().summarize_articles([job.article for job in batch], batch_size=len(batch),
+                                                   timeout=self.timeout * 2, on_start=on_start)
+        
+        finished = []
+        with self._lock:
+            now = time.monotonic()
+            for job, result in zip(batch, results):
+                job._process = None
+                if job.status == CANCELLED:
+                    continue
+                job.result = result
+                job.status = DONE
+                job.finished_at = now
+                finished.append(job)
+        for job in finished:
+            self._notify(job)
+    
+    def _notify(self, job: SummaryJob) -> None:
+        if self.on_update:
+            self.on_update(job)
@@ -1,22 +1,43 @@
 from textual.app import App, ComposeResult
+from textual.screen import ModalScreen
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll
-from textual.widgets import Header, Footer, Static, ListView, ListItem, Label, LoadingIndicator
+from textual.widgets import Header, Footer, Static, OptionList, LoadingIndicator, Input
+from textual.widgets.option_list import Option
 from textual.binding import Binding
+from textual import work
+from textual.worker import get_current_worker
 from textual.reactive import reactive
 from textual.message import Message
-from typing import List, Optional, Dict
+from rich.markup import escape
+from rich.text import Text
+from typing import List, Optional, Dict, Set, Tuple, Union
 from datetime import datetime, timedelta
 from toadman.models import Article
-from toadman.fetchers.rss_fetcher import fetch_rss_feeds
-from toadman.fetchers.hn_fetcher import fetch_hn_articles
-from toadman.summarizer.kiro_summarizer import summarize_article
-from toadman.export.markdown_exporter import export_to_markdown
-from toadman.cache import load_cache, save_cache, clear_cache
+from toadman.summarizer.summary_queue import SummaryQueue, SummaryJob, QUEUED, RUNNING, DONE, CANCELLED
+from toadman.fetchers.hn_fetcher import HN_SOURCE
+from toadman.fetchers.scheduler import due_sources
+from toadman.cache import save_cache, clear_cache, query_articles, get_summary, get_summaries, get_body
+from toadman.search import SearchIndex
+from toadman.relevance import rank_by_relevance
+from toadman.dedupe import collapse_duplicates
+from toadman.config import get_config
+from toadman import startup, metrics, daemon
 
-class ArticleItem(ListItem):
-    """A list item for an article."""
+class ArticleOption(Option):
+    """An article row in the article list."""
     
     def __init__(self, article: Article):
+        super().__init__(self._label_text(article), id=f"article:{article.url}")
+        self.article = article
+        self.label_fields = self.fields_of(article)
+    
+    @staticmethod
+    def fields_of(article: Article) -> Tuple:
+        """Return the article fields the row label is built from."""
+        return article.title, article.source, article.other_sources
+    
+    @staticmethod
+    def _label_text(article: Article) -> Text:
         # Choose emoji based on source
         if article.source == "MyClaw Newsletter":
             emoji = "🦞"
@@ -33,13 +54,21 @@ class ArticleItem(ListItem):
         title = article.title[:55] + "..." if len(article.title) > 55 else article.title
         
         # Don't add emoji if title already starts with an emoji (check if first char is emoji)
-        if title and ord(title[0]) > 127:  # Simple emoji detection
-            label = Label(title)
-        else:
-            label = Label(f"{emoji} {title}")
+        # Feed titles are plain Text, so brackets in them are never read as markup
+        label = Text(title if title and ord(title[0]) > 127 else f"{emoji} {title}")
         
-        super().__init__(label)
-        self.article = article
+        # Note how many other sources carried the same story
+        if article.other_sources:
+            label.append(f" +{len(article.other_sources)}", style="dim")
+        return label
+
+class SourceHeader(Option):
+    """A disabled row heading a group of articles."""
+    
+    def __init__(self, key: str, text: str):
+        # The text can hold a search query or feed name, so it is plain Text rather than markup
+        super().__init__(Text(f"━━━ {text} ━━━", style="bold cyan"), id=key, disabled=True)
+        self.text = text
 
 class ArticleDetail(Static):
     """Article detail view."""
@@ -48,24 +77,138 @@ class ArticleDetail(Static):
         super().__init__(*args, **kwargs)
         self.article = None
     
-    def show_article(self, article: Article):
+    def show_article(self, article: Article, summary: Optional[str] = None, status: Optional[str] = None,
+                     body: Optional[str] = None, preview: Optional[str] = None,
+                     summary_label: str = "Kiro Battle Chip Summary"):
         self.article = article
-        # Don't use link markup, just show the URL as plain text
-        content = f"""[bold]{article.title}[/bold]
-
-[dim]Source:[/dim] {article.source}
-[dim]Published:[/dim] {article.published_date or 'Unknown'}
-[dim]URL:[/dim] {article.url}
-
-{article.content_snippet}
-"""
+        # Labels are markup; feed, page and summary text is appended as plain text, so
+        # brackets in it are never read as markup. Don't use link markup, just show the URL.
+        content = Text()
+        content.append(f"{article.title}\n\n", style="bold")
+        content.append("Source: ", style="dim")
+        content.append(", ".join((article.source,) + article.other_sources) + "\n")
+        content.append("Published: ", style="dim")
+        content.append(f"{article.published_date or 'Unknown'}\n")
+        content.append("URL: ", style="dim")
+        content.append(f"{article.url}\n\n")
+        
+        if status:
+            content.append_text(Text.from_markup(status))
+            content.append("\n\n")
+        if preview:
+            content.append("🐸 Local preview:\n", style="bold")
+            content.append(f"{preview}\n\n")
+        if summary:
+            content.append(f"🐸 {summary_label}:\n", style="bold cyan")
+            content.append(f"{summary}\n\n")
+        if summary or preview:
+            content.append("Original Content:\n", style="dim")
+        content.append(f"{body or article.content_snippet}\n")
         self.update(content)
 
+class MetricsScreen(ModalScreen):
+    """Timings, counters and recent errors recorded since launch."""
+    
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close"),
+        Binding("m", "dismiss", "Close", show=False),
+    ]
+    
+    DEFAULT_CSS = """
+    MetricsScreen {
+        align: center middle;
+    }
+    
+    #metrics-container {
+        width: 90%;
+        height: 90%;
+        border: solid $primary;
+        background: $surface;
+        padding: 0 1;
+    }
+    """
+    
+    def compose(self) -> ComposeResult:
+        with VerticalScroll(id="metrics-container"):
+            yield Static(id="metrics-body")
+    
+    def on_mount(self) -> None:
+        self.refresh_stats()
+        self.set_interval(1, self.refresh_stats)
+    
+    def refresh_stats(self) -> None:
+        self.query_one("#metrics-body", Static).update(self.format_stats(metrics.snapshot()))
+    
+    @staticmethod
+    def format_stats(data: Dict) -> str:
+        """Render a metrics snapshot as console markup."""
+        counters = {(c["name"], tuple(sorted(c["labels"].items()))): c["value"] for c in data["counters"]}
+        
+        def counter(name: str, **labels) -> float:
+            return counters.get((name, tuple(sorted(labels.items()))), 0)
+        
+        lines = [f"[bold cyan]🐸 Stats since {data['started_at']}[/bold cyan] [dim](Esc to close)[/dim]", ""]
+        
+        # Sources, slowest first
+        sources = sorted((t for t in data["timings"] if t["name"] == "fetch_source"),
+                         key=lambda t: t["max_seconds"], reverse=True)
+        failed = {c["labels"]["source"] for c in data["counters"] if c["name"] == "fetch_errors_total"}
+        names = [t["labels"]["source"] for t in sources] + sorted(failed - {t["labels"]["source"] for t in sources})
+        lines.append("[bold]Sources[/bold] (slowest first)")
+        lines.append(f"[dim]  {'source':<32} {'fetches':>7} {'avg ms':>8} {'max ms':>8} {'304s':>5} {'errors':>6}[/dim]")
+        by_source = {t["labels"]["source"]: t for t in sources}
+        for name in names:
+            timing = by_source.get(name, {"count": 0, "sum_seconds": 0.0, "max_seconds": 0.0})
+            average = timing["sum_seconds"] / timing["count"] * 1000 if timing["count"] else 0.0
+            errors = counter("fetch_errors_total", source=name)
+            row = (f"  {escape(name[:32]):<32} {timing['count']:>7} {average:>8.0f} {timing['max_seconds'] * 1000:>8.0f} "
+                   f"{counter('fetch_not_modified_total', source=name):>5g} {errors:>6g}")
+            lines.append(f"[red]{row}[/red]" if errors else row)
+        if not names:
+            lines.append("  [dim]No fetches yet[/dim]")
+        lines.append("")
+        
+        lines.append("[bold]Operations[/bold]")
+        lines.append(f"[dim]  {'operation':<32} {'count':>7} {'avg ms':>8} {'max ms':>8}[/dim]")
+        for timing in data["timings"]:
+            if timing["name"] == "fetch_source":
+                continue
+            label = timing["name"] + "".join(f" {value}" for value in timing["labels"].values())
+            average = timing["sum_seconds"] / timing["count"] * 1000
+            lines.append(f"  {escape(label[:32]):<32} {timing['count']:>7} {average:>8.1f} "
+                         f"{timing['max_seconds'] * 1000:>8.1f}")
+        lines.append("")
+        
+        hits = counter("summary_cache_hits_total")
+        lookups = hits + counter("summary_cache_misses_total")
+        hit_rate = f"{hits / lookups:.0%}" if lookups else "n/a"
+        lines.append("[bold]Caches[/bold]")
+        lines.append(f"  Summary cache hit rate  {hit_rate} ({hits:g} of {lookups:g} lookups)")
+        not_modified = sum(c["value"] for c in data["counters"] if c["name"] == "fetch_not_modified_total")
+        lines.append(f"  Feeds not modified      {not_modified:g}")
+        lines.append(f"  Articles loaded         {counter('cache_articles_loaded_total'):g}")
+        lines.append("")
+        
+        lines.append("[bold]Recent errors[/bold]")
+        for error in reversed(data["errors"][-10:]):
+            where = ", ".join(str(value) for value in error["labels"].values())
+            lines.append(f"  [dim]{error['at']}[/dim] [red]{escape(where)}[/red] {escape(error['message'])}")
+        if not data["errors"]:
+            lines.append("  [dim]None[/dim]")
+        return "\n".join(lines)
+
 class ToadmanApp(App):
     """Toadman TUI application."""
     
     TITLE = "🐸 Toadman"
     
+    class SummaryUpdated(Message):
+        """Posted (from any thread) when a summary job changes state."""
+        
+        def __init__(self, job: SummaryJob):
+            super().__init__()
+            self.job = job
+    
     CSS = """
     Screen {
         layout: grid;
@@ -97,6 +240,16 @@ class ToadmanApp(App):
         height: 100%;
     }
     
+    #search-input {
+        display: none;
+    }
+    
+    #article-list {
+        height: 1fr;
+        max-height: 100%;
+        border: none;
+    }
+    
     #loading {
         align: center middle;
     }
@@ -108,140 +261,412 @@ class ToadmanApp(App):
         Binding("k", "cursor_up", "Up", show=False),
         Binding("r", "refresh", "Refresh"),
         Binding("s", "summarize", "Summarize"),
+        Binding("S", "summarize_all", "Summarize All"),
+        Binding("c", "cancel_summary", "Cancel Summary", show=False),
         Binding("e", "export", "Export"),
         Binding("o", "open_url", "Open URL"),
         Binding("/", "search", "Search"),
+        Binding("t", "toggle_sort", "Sort"),
+        Binding("m", "metrics", "Stats"),
+        Binding("escape", "clear_search", "Clear Search", show=False),
         ("?", "help", "Help"),
     ]
     
     articles: reactive[List[Article]] = reactive(list)
     selected_article: Optional[Article] = None
-    summaries: Dict[str, str] = {}
     search_query: str = ""
+    # "source" groups the list by source; "relevance" ranks it against the configured interests
+    sort_mode: str = "source"
+    # True while the article list follows a running `toadman daemon`
+    attached: bool = False
     
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Header()
         
-        with VerticalScroll(id="article-list-container"):
+        with Vertical(id="article-list-container"):
             yield LoadingIndicator(id="loading")
-            yield ListView(id="article-list")
+            yield Input(placeholder="Search articles...", id="search-input")
+            yield OptionList(id="article-list")
         
         with VerticalScroll(id="detail-container"):
             yield ArticleDetail(id="article-detail")
         
         yield Footer()
     
-    def on_mount(self) -> None:
+    def __init__(self, exit_after_first_paint: bool = False):
+        super().__init__()
+        self.exit_after_first_paint = exit_after_first_paint
+        self.visible_articles: List[Article] = []
+        self.summaries: Dict[str, str] = {}
+        self.bodies: Dict[str, str] = {}
+        self.previews: Dict[str, Optional[str]] = {}
+        # Articles whose stored summary and full text have been read (see load_stored)
+        self._looked_up: Set[str] = set()
+        self._options_by_key: Dict[str, Option] = {}
+        # The article list the search index was last synced with
+        self._indexed_articles: Optional[List[Article]] = None
+    
+    async def on_mount(self) -> None:
         """Load articles on startup."""
-        self.load_articles()
-    
-    def load_articles(self) -> None:
-        """Fetch articles from all sources."""
-        # Try to load from cache first
-        cached_articles = load_cache()
-        
-        if cached_articles:
-            self.articles = cached_articles
-            self.articles.sort(
-                key=lambda a: a.published_date.replace(tzinfo=None) if a.published_date else datetime.min,
-                reverse=True
-            )
-            # Filter to last 7 days
-            seven_days_ago = datetime.now().date() - timedelta(days=7)
-            self.articles = [a for a in self.articles if a.published_date and a.published_date.date() >= seven_days_ago]
-            self.update_article_list()
-            self.notify(f"🐸 Ribbit! Loaded {len(self.articles)} articles from cache")
-            self.query_one("#loading", LoadingIndicator).display = False
+        self.call_after_refresh(self._on_first_paint)
+        self.config = get_config()
+        self.search_index = SearchIndex()
+        self.summary_queue = SummaryQueue(
+            max_workers=self.config.summarizer_max_workers,
+            timeout=self.config.summarizer_timeout,
+            on_update=lambda job: self.post_message(self.SummaryUpdated(job)),
+        )
+        self.set_interval(1, self._tick_summary_progress)
+        self.set_interval(2, self._check_config)
+        await self.load_articles()
+        startup.mark("articles loaded")
+    
+    def _on_first_paint(self) -> None:
+        startup.first_paint()
+        if self.exit_after_first_paint:
+            self.exit()
+    
+    def on_unmount(self) -> None:
+        """Cancel outstanding summaries on exit."""
+        self.summary_queue.on_update = None
+        self.summary_queue.shutdown()
+    
+    def _article_window(self) -> Tuple[datetime, List[str]]:
+        """Return the display window: the last 7 days from currently configured sources."""
+        seven_days_ago = datetime.combine(datetime.now().date() - timedelta(days=7), datetime.min.time())
+        sources = list(self.config.rss_feeds) + [HN_SOURCE]
+        return seven_days_ago, sources
+    
+    async def _check_config(self) -> None:
+        """Apply edits to config.toml without restarting."""
+        config = get_config()
+        if config is self.config:
             return
         
-        # Fetch fresh data if no cache
-        self.notify("🐸 Toadman.EXE executing! Fetching news...")
+        previous, self.config = self.config, config
+        self.summary_queue.timeout = config.summarizer_timeout
+        self.notify("🐸 Config reloaded")
+        if config.summarizer_backend != previous.summarizer_backend:
+            # Summaries are cached per backend; show the new backend's
+            self.summaries.clear()
+            self._looked_up.clear()
+        if (config.rss_feeds, config.hn_keywords) != (previous.rss_feeds, previous.hn_keywords):
+            if self.attached:
+                # The daemon picks up the new sources on its next refresh; make that now
+                await daemon.request("refresh")
+            await self.load_articles()
+    
+    async def load_articles(self) -> None:
+        """
+        Show the daemon's articles if one is running.
         
-        # Fetch from RSS and HN
-        rss_articles = fetch_rss_feeds()
-        hn_articles = fetch_hn_articles()
+        Otherwise show cached articles immediately, then fetch the sources that
+        are due in the background.
+        """
+        if await self._attach_daemon():
+            return
         
-        self.articles = rss_articles + hn_articles
-        # Sort by published date, handling None and timezone-aware/naive datetimes
-        self.articles.sort(
-            key=lambda a: a.published_date.replace(tzinfo=None) if a.published_date else datetime.min,
-            reverse=True
-        )
+        since, sources = self._article_window()
         
-        # Filter to last 7 days
-        seven_days_ago = datetime.now().date() - timedelta(days=7)
-        self.articles = [a for a in self.articles if a.published_date and a.published_date.date() >= seven_days_ago]
+        # Render whatever is cached, even if expired
+        self.articles = list(collapse_duplicates(query_articles(since=since, sources=sources)))
+        if self.articles:
+            await self.update_article_list()
+            self.query_one("#loading", LoadingIndicator).display = False
         
-        # Save to cache
-        save_cache(self.articles)
+        if not due_sources(self.config):
+            self.notify(f"🐸 Ribbit! Loaded {len(self.articles)} articles from cache")
+            return
         
-        self.update_article_list()
-        self.notify(f"🐸 Jack in complete! {len(self.articles)} articles retrieved")
+        if self.articles:
+            self.notify(f"🐸 Showing {len(self.articles)} cached articles, refreshing in the background...")
+        else:
+            self.notify("🐸 Toadman.EXE executing! Fetching news...")
+        self.refresh_articles()
+    
+    async def _attach_daemon(self) -> bool:
+        """Show the daemon's article window and follow its updates; False if no daemon is running."""
+        try:
+            articles = await daemon.query_articles(*self._article_window())
+        except daemon.DaemonError:
+            articles = None
+        if articles is None:
+            return False
         
-        # Hide loading indicator
+        self.articles = articles
+        await self.update_article_list()
         self.query_one("#loading", LoadingIndicator).display = False
+        if not self.attached:
+            self.attached = True
+            self.notify(f"🐸 Attached to the Toadman daemon: {len(articles)} articles")
+            self.watch_daemon()
+        return True
     
-    def update_article_list(self) -> None:
-        """Update the article list based on search."""
-        article_list = self.query_one("#article-list", ListView)
-        article_list.clear()
+    @work(exclusive=True, group="daemon")
+    async def watch_daemon(self) -> None:
+        """Reload the list as the daemon saves articles, and fetch in-process if it stops."""
+        async for event in daemon.watch():
+            if event.get("event") == "changed":
+                articles = await daemon.query_articles(*self._article_window())
+                if articles is not None:
+                    self.articles = articles
+                    await self.update_article_list()
+            elif event.get("event") == "refreshed" and event.get("failed"):
+                self.notify(f"🐸 {event['failed']:g} sources failed to fetch (see toadman metrics)",
+                            severity="warning")
         
-        filtered = self.articles
+        self.attached = False
+        self.notify("🐸 Daemon went away, fetching news here from now on", severity="warning")
+        if due_sources(self.config):
+            self.refresh_articles()
+    
+    @work(exclusive=True, group="refresh")
+    async def refresh_articles(self) -> None:
+        """Fetch the due sources concurrently, merging each source into the list as it arrives."""
+        from toadman.fetchers.engine import iter_source_articles
+        since, sources = self._article_window()
+        errors_before = metrics.total("fetch_errors_total")
         
-        # Apply search filter
+        async for articles in iter_source_articles(due_only=True):
+            save_cache(articles)
+            self.articles = list(collapse_duplicates(query_articles(since=since, sources=sources)))
+            await self.update_article_list()
+            self.query_one("#loading", LoadingIndicator).display = False
+        
+        self.query_one("#loading", LoadingIndicator).display = False
+        self.notify(f"🐸 Jack in complete! {len(self.articles)} articles retrieved")
+        self.prefetch_bodies()
+        failed = metrics.total("fetch_errors_total") - errors_before
+        if failed:
+            self.notify(f"🐸 {failed:g} sources failed to fetch (press m for details)", severity="warning")
+    
+    @work(exclusive=True, group="bodies")
+    async def prefetch_bodies(self) -> None:
+        """Fetch the full text of the newest articles, so it is local before they are summarized."""
+        from toadman.fetchers.content_fetcher import prefetch_recent
+        _, sources = self._article_window()
+        if await prefetch_recent(sources=sources):
+            # Summaries are cached per text; look them up again for articles that now have their page
+            self.summaries.clear()
+            self.previews.clear()
+            self._looked_up.clear()
+        if self.selected_article:
+            self.show_detail(self.selected_article)
+    
+    async def update_article_list(self) -> None:
+        """Update the article list based on search, keeping the highlighted article selected."""
+        with metrics.span("list_rebuild"):
+            await self._update_article_list()
+    
+    async def _update_article_list(self) -> None:
+        # Keep the search index in step with the displayed articles (searching alone changes nothing)
+        if self._indexed_articles is not self.articles:
+            self.search_index.sync(self.articles)
+            self._indexed_articles = self.articles
+        
+        # Desired rows as (key, header text or article) pairs
+        rows: List[Tuple[str, Union[str, Article]]] = []
         if self.search_query:
-            query_lower = self.search_query.lower()
-            filtered = [a for a in filtered if query_lower in a.title.lower() or query_lower in a.source.lower()]
-        
-        # Group by source
-        sources = {}
-        for article in filtered:
-            if article.source not in sources:
-                sources[article.source] = []
-            sources[article.source].append(article)
-        
-        # Add articles grouped by source with headers
-        for source, articles in sources.items():
-            # Add source header
-            header = ListItem(Label(f"[bold cyan]━━━ {source} ━━━[/bold cyan]"))
-            header.disabled = True
-            article_list.append(header)
+            # Search results are ranked, so show them as one group in rank order
+            filtered = self.search_index.search(self.search_query)
+            if filtered:
+                rows.append(("header:results", f"{len(filtered)} results for '{self.search_query}'"))
+                rows.extend((f"article:{a.url}", a) for a in filtered)
+        elif self.sort_mode == "relevance":
+            # The search index already holds exactly these articles, so ranking only reads postings
+            filtered = rank_by_relevance(self.articles, index=self.search_index, config=self.config)
+            if filtered:
+                rows.append(("header:relevance", "Most relevant first"))
+                rows.extend((f"article:{a.url}", a) for a in filtered)
+        else:
+            # Group by source
+            sources = {}
+            for article in self.articles:
+                if article.source not in sources:
+                    sources[article.source] = []
+                sources[article.source].append(article)
             
-            # Add articles for this source
-            for article in articles:
-                item = ArticleItem(article)
-                article_list.append(item)
+            filtered = []
+            for source, articles in sources.items():
+                rows.append((f"header:{source}", source))
+                rows.extend((f"article:{a.url}", a) for a in articles)
+                filtered.extend(articles)
+        self.visible_articles = filtered
+        
+        await self._apply_rows(rows)
     
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+    async def _apply_rows(self, rows: List[Tuple[str, Union[str, Article]]]) -> None:
+        """
+        Show the desired rows in the article list, touching it only where they changed.
+        
+        The list is an OptionList, which only renders the rows on screen, so a
+        rebuild never creates widgets. Row objects are reused by key while their
+        label is unchanged, which keeps their rendered text cached. If the rows
+        are the same as shown, the list is left alone; if rows were only added
+        at the end, only those are added.
+        """
+        article_list = self.query_one("#article-list", OptionList)
+        
+        options = []
+        for key, value in rows:
+            option = self._options_by_key.get(key)
+            if isinstance(value, str):
+                if not isinstance(option, SourceHeader) or option.text != value:
+                    option = SourceHeader(key, value)
+            elif isinstance(option, ArticleOption) and option.label_fields == ArticleOption.fields_of(value):
+                # Same label; the detail pane reads the latest copy of the article
+                option.article = value
+            else:
+                option = ArticleOption(value)
+            options.append(option)
+        self._options_by_key = {option.id: option for option in options}
+        
+        shown = article_list.options
+        unchanged = len(shown) <= len(options) and all(old is new for old, new in zip(shown, options))
+        if unchanged:
+            if len(shown) < len(options):
+                article_list.add_options(options[len(shown):])
+            return
+        
+        selected_key = f"article:{self.selected_article.url}" if self.selected_article else None
+        scroll_y = article_list.scroll_y
+        article_list.clear_options()
+        article_list.add_options(options)
+        article_list.scroll_y = scroll_y
+        
+        # Restore the cursor on the previously highlighted article
+        for position, option in enumerate(options):
+            if option.id == selected_key:
+                article_list.highlighted = position
+                break
+    
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
         """Handle article highlight (navigation)."""
-        if isinstance(event.item, ArticleItem):
-            self.selected_article = event.item.article
-            detail = self.query_one("#article-detail", ArticleDetail)
-            detail.show_article(event.item.article)
+        if isinstance(event.option, ArticleOption):
+            self.selected_article = event.option.article
+            self.show_detail(event.option.article)
     
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle article selection."""
-        if isinstance(event.item, ArticleItem):
-            self.selected_article = event.item.article
-            detail = self.query_one("#article-detail", ArticleDetail)
-            detail.show_article(event.item.article)
+        if isinstance(event.option, ArticleOption):
+            self.selected_article = event.option.article
+            self.show_detail(event.option.article)
+    
+    def show_detail(self, article: Article) -> None:
+        """Show an article in the detail pane with its summary or summary progress."""
+        # Highlight messages can still arrive while the screen is being torn down
+        if not self.query("#article-detail"):
+            return
+        detail = self.query_one("#article-detail", ArticleDetail)
+        if article.url not in self._looked_up:
+            # Shown again once its stored summary and text have been read
+            self.load_stored(article)
+        status = None
+        job = self.summary_queue.get(article.url)
+        if job and job.status == RUNNING:
+            status = f"[bold]🐸 Kiro is summarizing... ⏳ {job.elapsed:.0f}s[/bold] [dim](c to cancel)[/dim]"
+        elif job and job.status == QUEUED:
+            status = f"[bold]🐸 Summary queued (#{self.summary_queue.position(job)})[/bold] [dim](c to cancel)[/dim]"
+        elif job and job.status == CANCELLED and article.url not in self.summaries:
+            status = "[dim]Summary cancelled[/dim]"
+        
+        preview = None
+        if job and (job.active or (job.status == DONE and job.result.startswith("Error:"))):
+            preview = self._preview_for(article)
+            if preview and not job.active:
+                status = "[dim]The summary failed; showing a local preview[/dim]"
+        
+        label = "Local Summary" if self.config.summarizer_backend == "extractive" else "Kiro Battle Chip Summary"
+        detail.show_article(article, summary=self._summary_for(article), status=status,
+                            body=self._body_for(article), preview=preview, summary_label=label)
+    
+    def _preview_for(self, article: Article) -> Optional[str]:
+        """Return a local extractive summary to show until the configured backend's summary arrives."""
+        if not self.config.summarizer_preview or self.config.summarizer_backend == "extractive":
+            return None
+        if article.url not in self.previews:
+            from toadman.summarizer.extractive import preview
+            summary = preview(article, self._body_for(article))
+            self.previews[article.url] = None if summary.startswith("Error:") else summary
+        return self.previews[article.url]
+    
+    def _body_for(self, article: Article) -> Optional[str]:
+        """Return the article's fetched full text, if it has been read (see load_stored)."""
+        return self.bodies.get(article.url)
+    
+    def _summary_for(self, article: Article) -> Optional[str]:
+        """Return the article's summary from this session or, once read, the on-disk summary cache."""
+        return self.summaries.get(article.url)
+    
+    @work(thread=True, exclusive=True, group="stored", exit_on_error=False)
+    def load_stored(self, article: Article) -> None:
+        """
+        Read an article's cached summary and stored full text, off the UI thread.
+        
+        These take several store queries, too slow to run on every cursor
+        move; the detail pane is redrawn when they are in, if the article is
+        still selected.
+        """
+        from toadman.summarizer.backends import get_backend
+        summary = get_summary(get_backend().summary_key(article))
+        body = get_body(article.url) if self.config.content_enabled else None
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._stored_loaded, article, summary, body)
+    
+    def _stored_loaded(self, article: Article, summary: Optional[str], body: Optional[str]) -> None:
+        self._looked_up.add(article.url)
+        if summary is not None:
+            self.summaries.setdefault(article.url, summary)
+        if body is not None:
+            self.bodies[article.url] = body
+            # A preview made before the text was read summarized the snippet
+            self.previews.pop(article.url, None)
+        if self.selected_article and self.selected_article.url == article.url:
+            self.show_detail(article)
+    
+    def on_toadman_app_summary_updated(self, message: "ToadmanApp.SummaryUpdated") -> None:
+        """Store finished summaries and refresh the detail pane if it shows the job's article."""
+        job = message.job
+        if job.status == DONE and job.result.startswith("Error:"):
+            self.notify(f"🐸 {job.result}", severity="error")
+        elif job.status == DONE:
+            self.summaries[job.article.url] = job.result
+            self.notify(f"🐸 Battle Chip complete! {job.article.title[:40]}")
+        
+        if self.selected_article and self.selected_article.url == job.article.url:
+            self.show_detail(job.article)
+    
+    def _tick_summary_progress(self) -> None:
+        """Update the elapsed time shown for the selected article's running summary."""
+        if not self.selected_article:
+            return
+        job = self.summary_queue.get(self.selected_article.url)
+        if job and job.active:
+            self.show_detail(self.selected_article)
     
     def action_cursor_down(self) -> None:
         """Move cursor down (vim-style)."""
-        article_list = self.query_one("#article-list", ListView)
+        article_list = self.query_one("#article-list", OptionList)
         article_list.action_cursor_down()
     
     def action_cursor_up(self) -> None:
         """Move cursor up (vim-style)."""
-        article_list = self.query_one("#article-list", ListView)
+        article_list = self.query_one("#article-list", OptionList)
         article_list.action_cursor_up()
     
     def action_refresh(self) -> None:
         """Refresh articles."""
+        if self.attached:
+            self.notify("🐸 Asking the daemon to refresh...")
+            self.run_worker(daemon.request("refresh", force=True), group="daemon-refresh")
+            return
+        
         clear_cache()
-        self.query_one("#loading", LoadingIndicator).display = True
-        self.load_articles()
+        if not self.articles:
+            self.query_one("#loading", LoadingIndicator).display = True
+        self.notify("🐸 Refreshing news in the background...")
+        self.refresh_articles()
     
     def action_help(self) -> None:
         """Show help screen."""
@@ -250,25 +675,35 @@ class ToadmanApp(App):
 [bold]Navigation:[/bold]
   ↑/↓ or j/k    Navigate articles (Ribbit!)
   Enter         Select article to view details
-  
+
 [bold]Battle Chip Actions:[/bold]
   o             Open article URL in browser
   s             Summon Kiro for AI summary
+  S             Summarize all visible articles (batched)
+  c             Cancel the selected article's summary
   e             Export articles to markdown
-  r             Refresh today's news (clear cache)
-  /             Search articles
+  r             Refresh every source now, due or not
+  /             Search articles (Esc to clear)
+  t             Toggle ranking by relevance / grouping by source
+  m             Show fetch, cache and summarizer stats
   ?             Show this help
   q             Jack out (Quit)
 
 [bold]Configuration:[/bold]
   Edit ~/.toadman/config.toml to customize RSS feeds
 
-[bold]Cache:[/bold]
-  Articles cached for 1 hour in ~/.toadman/cache/
+[bold]Refresh:[/bold]
+  Each source is fetched on its own schedule, learned from how often
+  it publishes (15 min to 24 h); failing sources back off
+  Articles are stored in ~/.toadman/cache/
   Shows articles from the last 7 days! 🐸
 """
         self.notify(help_text, timeout=10)
     
+    def action_metrics(self) -> None:
+        """Show fetch, cache and summarizer stats."""
+        self.push_screen(MetricsScreen())
+    
     def action_open_url(self) -> None:
         """Open the selected article URL in browser."""
         if not self.selected_article:
@@ -279,45 +714,80 @@ class ToadmanApp(App):
         webbrowser.open(self.selected_article.url)
         self.notify(f"🐸 Opening in browser... Ribbit!")
     
+    async def action_toggle_sort(self) -> None:
+        """Switch between grouping the list by source and ranking it by relevance."""
+        self.sort_mode = "source" if self.sort_mode == "relevance" else "relevance"
+        await self.update_article_list()
+        if self.sort_mode == "relevance":
+            self.notify("🐸 Ranked by relevance to your keywords and interests")
+        else:
+            self.notify("🐸 Grouped by source")
+    
     def action_search(self) -> None:
-        """Search articles."""
-        # Simple search - just prompt for query
-        self.notify("Search: Type to filter articles (press ESC to clear)", timeout=5)
-        # Note: Full implementation would use Input widget, keeping it simple for now
+        """Show the search box and focus it."""
+        search_input = self.query_one("#search-input", Input)
+        search_input.display = True
+        search_input.focus()
+    
+    def action_clear_search(self) -> None:
+        """Clear and hide the search box, restoring the full list."""
+        search_input = self.query_one("#search-input", Input)
+        search_input.display = False
+        self.query_one("#article-list", OptionList).focus()
+        if search_input.value:
+            search_input.value = ""
+    
+    async def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-rank the list as the search query is typed."""
+        if event.input.id == "search-input":
+            self.search_query = event.value.strip() and event.value
+            await self.update_article_list()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Move focus to the results when Enter is pressed in the search box."""
+        if event.input.id == "search-input":
+            self.query_one("#article-list", OptionList).focus()
     
     def action_summarize(self) -> None:
-        """Summarize the selected article using Kiro."""
+        """Queue the selected article for summarization using Kiro."""
         if not self.selected_article:
             self.notify("🐸 Ribbit! Select an article first", severity="warning")
             return
         
-        detail = self.query_one("#article-detail", ArticleDetail)
+        if self._summary_for(self.selected_article) is not None:
+            self.show_detail(self.selected_article)
+            return
         
-        # Show loading state
-        detail.update("[bold]🐸 Toadman.EXE summoning Kiro...[/bold]\n\n⏳ Battle Chip loading...")
-        self.notify("🐸 Activating Battle Chip: Kiro Summarizer!")
+        job = self.summary_queue.get(self.selected_article.url)
+        if job and job.active:
+            self.notify("🐸 Kiro is already on it! Ribbit!")
+            return
         
-        # Generate summary
-        summary = summarize_article(self.selected_article)
+        self.summary_queue.submit(self.selected_article)
+        self.notify("🐸 Activating Battle Chip: Kiro Summarizer!")
+    
+    def action_summarize_all(self) -> None:
+        """Queue every visible article without a summary, batching several per Kiro call."""
+        from toadman.summarizer.backends import get_backend
+        pending = [a for a in self.visible_articles if a.url not in self.summaries]
+        keys = dict(zip(get_backend().summary_keys(pending), pending))
+        for key, summary in get_summaries(list(keys)).items():
+            self.summaries[keys[key].url] = summary
+        pending = [a for a in pending if a.url not in self.summaries]
+        if not pending:
+            self.notify("🐸 Every visible article is already summarized! Ribbit!")
+            return
         
-        # Store summary
-        self.summaries[self.selected_article.url] = summary
+        self.summary_queue.submit_many(pending, batch_size=self.config.summarizer_batch_size)
+        self.notify(f"🐸 Activating Battle Chip: summarizing {len(pending)} articles!")
+    
+    def action_cancel_summary(self) -> None:
+        """Cancel the queued or running summary for the selected article."""
+        if not self.selected_article:
+            return
         
-        # Update detail view with summary
-        content = f"""[bold]{self.selected_article.title}[/bold]
-
-[dim]Source:[/dim] {self.selected_article.source}
-[dim]Published:[/dim] {self.selected_article.published_date or 'Unknown'}
-[dim]URL:[/dim] {self.selected_article.url}
-
-[bold cyan]🐸 Kiro Battle Chip Summary:[/bold cyan]
-{summary}
-
-[dim]Original Content:[/dim]
-{self.selected_article.content_snippet}
-"""
-        detail.update(content)
-        self.notify("🐸 Battle Chip complete! Ribbit!")
+        if self.summary_queue.cancel(self.selected_article.url):
+            self.notify("🐸 Summary cancelled")
     
     def action_export(self) -> None:
         """Export articles to markdown."""
@@ -328,6 +798,7 @@ class ToadmanApp(App):
         self.notify("🐸 Exporting Battle Chip data...")
         
         # Export all articles
+        from toadman.export.markdown_exporter import export_to_markdown
         filepath = export_to_markdown(self.articles, self.summaries)
         
         self.notify(f"🐸 {len(self.articles)} articles exported! Ribbit!")